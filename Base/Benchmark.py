@@ -0,0 +1,282 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Runs a function many times with time.perf_counter_ns and reports the mean,
+  standard deviation and confidence interval of a call.  Several
+  functions can be compared side by side, for A/B tests of your own hot
+  functions.
+
+  For further details see the help file for this module.
+-----------------------------------------------------------------------------
+Required Libraries:
+
+  From Python
+    collections
+    gc
+    itertools
+    math
+    os
+    statistics
+    time
+
+  From Libs
+    Libs.Base.Converters
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+    Runs are timed with time.perf_counter_ns, the timers of CodeTimer are
+    not turned on.  ResultString shows 'n/a' for a mean of 0.
+-----------------------------------------------------------------------------
+'''
+
+import gc
+import itertools
+import math
+import os
+import statistics
+import time
+from collections import namedtuple
+
+from .Converters import ConvertMillisecondsDays
+
+  # Is what CBenchmark.Run returns.  The times are milliseconds per call.
+  # Low and High are the confidence interval of Mean.  Number is the calls
+  # in each run and Runs is the measured runs.
+_BenchResultDef = namedtuple('BenchResult', ['Name', 'Number', 'Runs', 'Mean', 'StdDev',
+                                             'Min', 'Max', 'Low', 'High'])
+
+  # Are the two sided t values for 1 to 30 degrees of freedom.  Above 30
+  # the normal value, the last one, is used.
+_TTABLE = {
+  0.90: (6.314, 2.920, 2.353, 2.132, 2.015, 1.943, 1.895, 1.860, 1.833, 1.812,
+         1.796, 1.782, 1.771, 1.761, 1.753, 1.746, 1.740, 1.734, 1.729, 1.725,
+         1.721, 1.717, 1.714, 1.711, 1.708, 1.706, 1.703, 1.701, 1.699, 1.697, 1.645),
+  0.95: (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+         2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+         2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042, 1.960),
+  0.99: (63.657, 9.925, 5.841, 4.604, 4.032, 3.707, 3.499, 3.355, 3.250, 3.169,
+         3.106, 3.055, 3.012, 2.977, 2.947, 2.921, 2.898, 2.878, 2.861, 2.845,
+         2.831, 2.819, 2.807, 2.797, 2.787, 2.779, 2.771, 2.763, 2.756, 2.750, 2.576),
+}
+
+
+  #======================================================
+class CBenchmark(object):
+  '''
+  Runs a function Warmup times, which are not kept, and then Runs
+  times.  Each run calls the function Number times and is timed with
+  time.perf_counter_ns, the time of the run over Number is the time of
+  a call.  It does not use or change the timers of CodeTimer, so
+  EnableTimers has no effect on it.
+
+    Bench = CBenchmark(Warmup = 3, Runs = 10, Number = None, MinTime = 0.05,
+                       DisableGC = True, CPU = None, Confidence = 0.95)
+      Warmup
+        Is the runs made first and thrown away.
+      Runs
+        Is the runs that are measured, at least 2.
+      Number
+        Is the calls in each run.  If None it is found like timeit
+        does, the smallest 1, 2, 5, 10, 20, 50 ... where a run takes
+        at least MinTime seconds.
+      DisableGC
+        If True the garbage collector is run before each run and is
+        off while it runs.
+      CPU
+        Is the CPU number to pin the process to while it runs, None
+        does not pin.  Only where os.sched_setaffinity exists.
+      Confidence
+        Is 0.90, 0.95 or 0.99, the level of the interval.
+
+  Exceptions:
+    AttributeError
+      If an argument is out of range, or CPU is given and the
+      platform can not pin.
+  '''
+
+  def __init__(self, Warmup = 3, Runs = 10, Number = None, MinTime = 0.05, DisableGC = True,
+               CPU = None, Confidence = 0.95):
+    object.__init__(self)
+
+    if Warmup < 0 or Runs < 2:
+      raise AttributeError(f'Warmup must be 0 or more and Runs 2 or more: {Warmup}, {Runs}')
+    if Number is not None and Number < 1:
+      raise AttributeError(f'Number must be None or above 0: {Number}')
+    if Confidence not in _TTABLE:
+      raise AttributeError(f'Confidence must be one of {sorted(_TTABLE)}: {Confidence}')
+    if CPU is not None and not hasattr(os, 'sched_setaffinity'):
+      raise AttributeError('This platform can not pin to a CPU')
+
+    self.Warmup = Warmup
+    self.Runs = Runs
+    self.Number = Number
+    self.MinTime = MinTime
+    self.DisableGC = DisableGC
+    self.CPU = CPU
+    self.Confidence = Confidence
+
+    #------------------------------------------------------
+  def Compare(self, Candidates, Setup = None):
+    '''
+    Runs each candidate, one after the other, with the same settings.
+
+      Results = Compare(Candidates, Setup = None)
+        Results
+          list of _BenchResultDef in the order of Candidates.
+        Candidates
+          Is a dict of {Name: Function}, or a list of functions
+          named by their __name__.
+        Setup
+          See Run.
+    '''
+    if not isinstance(Candidates, dict):
+      Candidates = {Function.__name__: Function for Function in Candidates}
+    return [self.Run(Function, Name, Setup) for Name, Function in Candidates.items()]
+
+    #------------------------------------------------------
+  def Run(self, Function, Name = None, Setup = None):
+    '''
+    Benchmarks one function, it is called with no arguments.  Use a
+    lambda or functools.partial to pass arguments.
+
+      Result = Run(Function, Name = None, Setup = None)
+        Result
+          Is a _BenchResultDef.
+        Name
+          None is the __name__ of Function.
+        Setup
+          Is called with no arguments before each run and is not
+          timed.
+    '''
+    Name = Name if Name is not None else getattr(Function, '__name__', 'Function')
+    Affinity = None
+    GCEnabled = gc.isenabled()
+    try:
+      if self.CPU is not None:
+        Affinity = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {self.CPU})
+
+      Number = self.Number if self.Number is not None else self._AutoNumber(Function, Setup)
+      Tooks = [self._Run(Function, Number, Setup) for _ in range(self.Warmup + self.Runs)]
+    finally:
+      if GCEnabled:
+        gc.enable()
+      if Affinity is not None:
+        os.sched_setaffinity(0, Affinity)
+
+    Times = [Took / Number for Took in Tooks[self.Warmup:]]
+    Mean = statistics.fmean(Times)
+    StdDev = statistics.stdev(Times)
+    TValues = _TTABLE[self.Confidence]
+    HalfWidth = TValues[min(len(Times) - 1, len(TValues)) - 1] * StdDev / math.sqrt(len(Times))
+    return _BenchResultDef(Name, Number, len(Times), Mean, StdDev, min(Times), max(Times),
+                           Mean - HalfWidth, Mean + HalfWidth)
+
+    #------------------------------------------------------
+  def _AutoNumber(self, Function, Setup):
+    '''
+    Finds Number like timeit.Timer.autorange.
+    '''
+    for Scale in itertools.count():
+      for Step in (1, 2, 5):
+        Number = Step * 10 ** Scale
+        if self._Run(Function, Number, Setup) >= self.MinTime * 1000:
+          return Number
+
+    #------------------------------------------------------
+  def _Run(self, Function, Number, Setup):
+    '''
+    Makes one run and returns how long it took in milliseconds.
+    '''
+    if Setup is not None:
+      Setup()
+    if self.DisableGC:
+      gc.collect()
+      gc.disable()
+    Loop = itertools.repeat(None, Number)
+    Start = time.perf_counter_ns()
+    for _ in Loop:
+      Function()
+    Took = (time.perf_counter_ns() - Start) / 1000000
+    if self.DisableGC:
+      gc.enable()
+    return Took
+
+
+  #--------------------------------------------------------------------------
+def FormatMilliseconds(Milliseconds, Decimals = 4):
+  '''
+  Formats a time with ConvertMillisecondsDays, leaving out the
+  leading units that are 0.
+
+    String = FormatMilliseconds(Milliseconds, Decimals = 4)
+      String
+        Like '1m 2s 3.5000ms' or '0.0012ms'.
+  '''
+  Result = ConvertMillisecondsDays(Milliseconds)
+  Parts = []
+  for Value, Unit in ((Result.days, 'd'), (Result.hours, 'h'), (Result.minutes, 'm'),
+                      (Result.seconds, 's')):
+    if Value or Parts:
+      Parts.append(f'{Value}{Unit}')
+  Parts.append(f'{Result.milliseconds:.{Decimals}f}ms')
+  return ' '.join(Parts)
+
+
+  #--------------------------------------------------------------------------
+def ResultString(Results):
+  '''
+  Formats the results of Run or Compare as a table.  The first
+  result is the baseline, each line shows how many times slower or
+  faster it is and if the confidence intervals do not overlap, the
+  difference is real.  If either mean is 0, below the resolution of
+  the clock, it shows 'n/a' as there is no ratio.
+
+    String = ResultString(Results)
+      Results
+        Is a _BenchResultDef or a list of them.
+  '''
+  if isinstance(Results, _BenchResultDef):
+    Results = [Results]
+
+  Base = Results[0]
+  Width = max([len(Result.Name) for Result in Results] + [4])
+  Output = [f'{"Name":<{Width}} {"Mean":>18} {"+/-":>16} {"StdDev":>16} {"Min":>18} '
+            f'{"Calls":>9} {"vs " + Base.Name[:10]:>16}']
+  for Result in Results:
+    if Result is Base:
+      Versus = ''
+    else:
+      if Base.Mean <= 0 or Result.Mean <= 0:
+        Versus = 'n/a'
+      else:
+        Ratio = Result.Mean / Base.Mean
+        Versus = f'{Ratio:.2f}x slower' if Ratio >= 1 else f'{1 / Ratio:.2f}x faster'
+      if Result.Low <= Base.High and Base.Low <= Result.High:
+        Versus = 'same'
+    Output.append(f'{Result.Name:<{Width}} {FormatMilliseconds(Result.Mean, 6):>18} '
+                  f'{FormatMilliseconds(Result.High - Result.Mean, 6):>16} '
+                  f'{FormatMilliseconds(Result.StdDev, 6):>16} {FormatMilliseconds(Result.Min, 6):>18} '
+                  f'{Result.Number * Result.Runs:>9} {Versus:>16}')
+  return '\n'.join(Output)
@@ -29,7 +29,11 @@ Description:
 Required Libraries:
 
   From Python
+    gc
+    os
+    time
     timeit
+    tracemalloc
     
   From Libs
     Libs.Base.Converters
@@ -37,13 +41,90 @@ Required Libraries:
 Update History:
   Feb 21, 2021 - Donald W. Long (Donald.W.Long@gmail.com)
     Released
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Added EnableTimers and the LIBS_TIMERS environment variable.  When
+    the timers are off CCodeTimer returns NullTimer, which does nothing.
+    Added Resources to CCodeTimer, it captures CPU time, thread CPU
+    time, tracemalloc memory and GC collections of the block.
+    Added CCaptureTimer.Capture, CCodeTimer passes the data of each timer
+    to it so one CCaptureTimer can be shared by threads.
 -----------------------------------------------------------------------------
 '''
 
+import gc
+import os
+import time
 import timeit
+import tracemalloc
 
 from .Converters import ConvertMillisecondsDays
 
+  # Is the environment variable that turns the timers off when it is
+  # 0, off, false or no.
+TIMERSENV = 'LIBS_TIMERS'
+
+_Enabled = os.environ.get(TIMERSENV, '').strip().lower() not in ('0', 'off', 'false', 'no')
+
+
+  #--------------------------------------------------------------------------
+def EnableTimers(Enabled = True):
+  '''
+  Turns all the timers on or off.  When they are off CCodeTimer and
+  the timers built on it return NullTimer, and Timed returns the
+  function it decorates.  Timers that already exist, and functions
+  already decorated, are not changed, so call this before you make
+  them.
+
+    EnableTimers(Enabled = True)
+  '''
+  global _Enabled  # pylint: disable=global-statement
+  _Enabled = bool(Enabled)
+
+
+  #--------------------------------------------------------------------------
+def TimersEnabled():
+  '''
+  Returns True if the timers are on.
+  '''
+  return _Enabled
+
+
+  #--------------------------------------------------------------------------
+class _CNullTimer(object):
+  '''
+  Is what the timers return when they are off.  There is only one,
+  NullTimer, and everything it does is nothing.  Its Name is '' and
+  its times are 0.
+  '''
+  __slots__ = ()
+
+  Name = ''
+  Start = 0
+  End = 0
+  Took = 0
+  CaptureTimer = None
+  Resources = False
+  CPU = ThreadCPU = MemoryPeak = MemoryNet = GCCollections = None
+
+  def EndTimer(self):
+    pass
+
+  def Save(self):
+    pass
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    pass
+
+  def __str__(self):
+    return ''
+
+
+  # Is the only _CNullTimer.
+NullTimer = _CNullTimer()
+
   #--------------------------------------------------------------------------
 class CCaptureTimer(object):
   '''
@@ -60,6 +141,9 @@ class CCaptureTimer(object):
       Save
         Is called by the class 'CCodeTimer'.  This is an empty method,
         you must override this method if you wish it to do something.
+      Capture
+        Is what 'CCodeTimer' calls, it stores the data below and calls
+        'Save'.  Override it to use the data without storing it.
         
     Saved Data:
       This is the data that CCodeTimer saves in this class for you.  No
@@ -70,12 +154,22 @@ class CCaptureTimer(object):
       End   = Is when the timer ended. Comes from timeit.default_timer()
       Took  = How many milliseconds it took.  This is a float, so you can
               have less then a millisecond.
+
+      When CCodeTimer has Resources on these are set too, else they
+      are None.  See CCodeTimer.
+
+      CPU, ThreadCPU, MemoryPeak, MemoryNet, GCCollections
   '''
   def __init__(self):
     self.Name = None
     self.Start = 0
     self.End = 0
     self.Took = 0
+    self.CPU = None
+    self.ThreadCPU = None
+    self.MemoryPeak = None
+    self.MemoryNet = None
+    self.GCCollections = None
 
     #--------------------------------------------------------------------------
   def Save(self):
@@ -86,16 +180,43 @@ class CCaptureTimer(object):
     '''
     pass  # pylint: disable=unnecessary-pass
 
+    #--------------------------------------------------------------------------
+  def Capture(self, Name, Start, End, Took, Resources):
+    '''
+    Is called by CCodeTimer when a timer ends.  It stores the data in
+    this class and calls Save, so two timers that end at the same time
+    in two threads overwrite each other's data.  A CCaptureTimer that
+    is shared by threads overrides this to use the arguments instead,
+    they belong to this one call.
+
+      Capture(Name, Start, End, Took, Resources)
+        Resources
+          Is None, or (CPU, ThreadCPU, MemoryPeak, MemoryNet,
+          GCCollections) if the CCodeTimer has Resources on.
+    '''
+    self.Name = Name
+    self.Start = Start
+    self.End = End
+    self.Took = Took
+    if Resources is None:
+      self.CPU = self.ThreadCPU = self.MemoryPeak = self.MemoryNet = self.GCCollections = None
+    else:
+      self.CPU, self.ThreadCPU, self.MemoryPeak, self.MemoryNet, self.GCCollections = Resources
+    self.Save()
+
     #--------------------------------------------------------------------------
   def __str__(self):
     Result = ConvertMillisecondsDays(self.Took)
     FormatString = 'Code Block "{Name}" took: {Days}d {Hours}h {Minutes}m {Seconds}s {Milliseconds}ms'
-    return FormatString.format(Name = self.Name,
+    Line = FormatString.format(Name = self.Name,
                                Days = Result.days,
                                Hours = Result.hours,
                                Minutes = Result.minutes,
                                Seconds = Result.seconds,
                                Milliseconds = Result.milliseconds)
+    if self.CPU is not None:
+      Line += _ResourcesString(self)
+    return Line
     
   #--------------------------------------------------------------------------
 class CCodeTimer(object):
@@ -127,13 +248,39 @@ class CCodeTimer(object):
       Took         = How many milliseconds it took.  This is a float, so you can
                      have less then a millisecond.
       CaptureTimer = If not None is the 'CCaptureTimer' you passed in.
+      Resources    = Is True if you asked for the data below.  If not the
+                     data below is None.
+      CPU          = How many milliseconds of CPU the process used, from
+                     time.process_time(), all threads.
+      ThreadCPU    = How many milliseconds of CPU this thread used, from
+                     time.thread_time().  Took less CPU is time spent
+                     waiting, on I/O for one.
+      MemoryPeak   = The most bytes, more than at the start, that were
+                     allocated at one time, from tracemalloc.
+      MemoryNet    = The bytes still allocated at the end less the bytes
+                     at the start, from tracemalloc.
+      GCCollections = How many garbage collections ran.
+
+    Resources starts tracemalloc if it is not tracing and leaves it on,
+    call tracemalloc.stop() when you are done.  tracemalloc makes every
+    allocation slower, so the times are longer.  Its peak is for the
+    whole process, timers with Resources that run inside each other or
+    at the same time in threads change each other's MemoryPeak.
   
+    When the timers are off, see EnableTimers, CCodeTimer(...) and
+    every class that inherits it returns NullTimer instead.
+
   Exceptions:
     AttributeError
       Name must be an instance of 'str' or None
       CaptureTimer must be an instance of 'CCaptureTimer' or None
   '''
-  def __init__(self, Name = None, CaptureTimer = None):
+  def __new__(cls, *args, **kwargs):  # pylint: disable=unused-argument
+    if not _Enabled:
+      return NullTimer
+    return object.__new__(cls)
+
+  def __init__(self, Name = None, CaptureTimer = None, Resources = False):
     self.Name = Name if Name else ''
 
     if Name and not isinstance(Name, str):
@@ -143,7 +290,16 @@ class CCodeTimer(object):
       raise AttributeError("CaptureTimer must be an instance of CCaptureTimer or None")
     self.CaptureTimer = CaptureTimer
 
+    self.Resources = Resources
+    self.CPU = None
+    self.ThreadCPU = None
+    self.MemoryPeak = None
+    self.MemoryNet = None
+    self.GCCollections = None
+
       # Set _Start, just in case we are created without using the 'with' statement.
+    if Resources:
+      self._StartResources()
     self._Start = timeit.default_timer()
     self.End = None
     self._Took = 0
@@ -164,50 +320,87 @@ class CCodeTimer(object):
     the delete method then 'Save' will not be called.  If you have set 
     'CCaptureTimer' then its 'Save' will be called.
     '''
-    if not self.End:
-      self.End = timeit.default_timer()
-      self._Took = (self.End - self._Start) * 1000.0
-      if self.CaptureTimer:
-        self.CaptureTimer.Name = self.Name
-        self.CaptureTimer.Start = self._Start
-        self.CaptureTimer.End = self.End
-        self.CaptureTimer.Took = self._Took
-        self.CaptureTimer.Save()
+    if self._Stop() and self.CaptureTimer:
+      self._Capture()
     
     #--------------------------------------------------------------------------
   def __enter__(self):
+    if self.Resources:
+      self._StartResources()
     self._Start = timeit.default_timer()
     return self
 
     #--------------------------------------------------------------------------
   def __exit__(self, exc_type, exc_val, exc_tb):
-    if not self.End:
-      self.End = timeit.default_timer()
-      self._Took = (self.End - self._Start) * 1000.0
+    if self._Stop():
       if self.CaptureTimer:
-        self.CaptureTimer.Name = self.Name
-        self.CaptureTimer.Start = self._Start
-        self.CaptureTimer.End = self.End
-        self.CaptureTimer.Took = self._Took
-        self.CaptureTimer.Save()
+        self._Capture()
       else:
         self.Save()
     
     #--------------------------------------------------------------------------
   def __del__(self):
-    if not self.End:
-      self.End = timeit.default_timer()
-      self._Took = (self.End - self._Start) * 1000.0
+    if self._Stop():
       if self.CaptureTimer:
-        self.CaptureTimer.Name = self.Name
-        self.CaptureTimer.Start = self._Start
-        self.CaptureTimer.End = self.End
-        self.CaptureTimer.Took = self._Took
-        self.CaptureTimer.Save()
+        self._Capture()
       else:
         self.Save()
 
     #--------------------------------------------------------------------------
   def __str__(self):
-    return 'Code Block: ' + self.Name + ' Took: ' + str(self._Took) + 'ms'
-  
\ No newline at end of file
+    Line = 'Code Block: ' + self.Name + ' Took: ' + str(self._Took) + 'ms'
+    if self.CPU is not None:
+      Line += _ResourcesString(self)
+    return Line
+
+    #--------------------------------------------------------------------------
+  def _Capture(self):
+    '''
+    Passes the data to the Capture of the CaptureTimer.
+    '''
+    if self.CPU is None:
+      Resources = None
+    else:
+      Resources = (self.CPU, self.ThreadCPU, self.MemoryPeak, self.MemoryNet, self.GCCollections)
+    self.CaptureTimer.Capture(self.Name, self._Start, self.End, self._Took, Resources)
+
+    #--------------------------------------------------------------------------
+  def _StartResources(self):
+    if not tracemalloc.is_tracing():
+      tracemalloc.start()
+    self._GCStart = _GCCollections()
+    self._MemoryStart = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    self._CPUStart = time.process_time()
+    self._ThreadCPUStart = time.thread_time()
+
+    #--------------------------------------------------------------------------
+  def _Stop(self):
+    '''
+    Ends the timer.  Returns False if it had already ended.
+    '''
+    if self.End:
+      return False
+
+    self.End = timeit.default_timer()
+    self._Took = (self.End - self._Start) * 1000.0
+    if self.Resources:
+      self.ThreadCPU = (time.thread_time() - self._ThreadCPUStart) * 1000.0
+      self.CPU = (time.process_time() - self._CPUStart) * 1000.0
+      Current, Peak = tracemalloc.get_traced_memory()
+      self.MemoryNet = Current - self._MemoryStart
+      self.MemoryPeak = max(Peak - self._MemoryStart, 0)
+      self.GCCollections = _GCCollections() - self._GCStart
+    return True
+
+
+  #--------------------------------------------------------------------------
+def _GCCollections():
+  return sum(Stat['collections'] for Stat in gc.get_stats())
+
+
+  #--------------------------------------------------------------------------
+def _ResourcesString(Timer):
+  return (f' CPU: {Timer.CPU}ms Thread CPU: {Timer.ThreadCPU}ms'
+          f' Memory peak: {Timer.MemoryPeak} bytes net: {Timer.MemoryNet} bytes'
+          f' GC: {Timer.GCCollections}')
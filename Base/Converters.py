@@ -22,7 +22,8 @@ CopyRight:
 Description:
 
   This module has functions that will convert data from one format to another.
-  See each function for details.
+  See each function for details.  CUnitLadder converts between the units of
+  a ladder, like ns to days or bytes to GiB, from tables made once.
   
   For further details see the help file for this module.
 -----------------------------------------------------------------------------
@@ -30,14 +31,306 @@ Required Libraries:
 
   From Python
     from collections import namedtuple
+    fractions
+    math
+
+  Optional
+    numpy, the batch functions use it if it is installed.
 -----------------------------------------------------------------------------
 Update History:
   Feb 21, 2021 - Donald W. Long (Donald.W.Long@gmail.com)
     Released
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    The namedtuples are made once, not on every call.
+    Added ConvertMillisecondsDaysBatch and ConvertMillisecondsWeeksBatch.
+    Added CUnitLadder and TimeUnits, ByteUnits and RateUnits.  The
+    ConvertMilliseconds functions use TimeUnits.  A negative value is
+    now broken down with floor division, -1500 is -1 day, 23 hours,
+    59 minutes, 58 seconds and 500 milliseconds.
+    Each plan of CUnitLadder makes its breakdown function once, the
+    ConvertMilliseconds functions call it directly.  BreakdownBatch
+    uses python ints when a value does not fit in int64.
 -----------------------------------------------------------------------------
 '''
 
+import math
 from collections import namedtuple
+from fractions import Fraction
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+  # Is the cached plan of CUnitLadder.Breakdown for one From and Units.
+  # Scale turns a value in From into a count of the smallest unit and
+  # Divisors is the size of each unit, but the smallest, in that unit.
+  # The Exact ones are ints or Fractions, the others ints or floats.
+  # Breakdown is the function that breaks a value down with Scale and
+  # Divisors.
+_PlanDef = namedtuple('Plan', ['Result', 'Scale', 'Divisors', 'ExactScale', 'ExactDivisors',
+                               'Breakdown'])
+
+  # Is the largest magnitude the int64 numpy path can hold.
+_INT64MAX = 2 ** 63 - 1
+
+
+  #======================================================
+class CUnitLadder(object):
+  '''
+  Is a ladder of units of one kind, time or bytes for example, that
+  converts a value from one unit to another or breaks it down into
+  several units, like ConvertMillisecondsDays does.  The size of each
+  unit is an int count of the smallest one, so the tables are exact and
+  made once.  Use the ladders of this module, TimeUnits, ByteUnits and
+  RateUnits, or make your own.
+
+    Ladder = CUnitLadder(Units, Breakdown = None)
+      Units
+        Is a sequence of (Name, Short, Size).  Name, 'hours', is used
+        for the fields of Breakdown, Short, 'h', is another name for
+        the unit.  Size is a positive int, how many of the base unit
+        it is.
+      Breakdown
+        Is the names of the units Breakdown uses when it is not told,
+        None is all of them.
+
+  Exceptions:
+    AttributeError
+      If a Size is not a positive int or a name is used twice.
+  '''
+
+  def __init__(self, Units, Breakdown = None):
+    object.__init__(self)
+
+    self._Names = []
+    self._Sizes = {}
+    self._Lookup = {}
+    for Name, Short, Size in sorted(Units, key = lambda Unit: -Unit[2]):
+      if not isinstance(Size, int) or Size <= 0:
+        raise AttributeError(f'Size of {Name} must be a positive int: {Size!r}')
+      for Key in (Name, Short):
+        if Key in self._Lookup:
+          raise AttributeError(f'Unit used twice: {Key}')
+        self._Lookup[Key] = Name
+      self._Names.append(Name)
+      self._Sizes[Name] = Size
+    self._Names = tuple(self._Names)
+    self._Breakdown = self._Units(Breakdown) if Breakdown is not None else self._Names
+    self._Ratios = {}
+    self._Plans = {}
+
+    #------------------------------------------------------
+  def Breakdown(self, Value, From, Units = None, Exact = False):
+    '''
+    Breaks a value down into units, largest first.  All but the last
+    are whole, the last gets what is left.
+
+      Result = Breakdown(Value, From, Units = None, Exact = False)
+        Result
+          Is a namedtuple with a field for each unit.
+        From
+          Is the unit of Value.
+        Units
+          Is the units to break down into, None is the ones given to
+          the ladder.
+        Exact
+          If True it is done with ints and Fractions, so there is no
+          float drift.  The last field is an int when it is whole.
+          Else a float Value gives a float last field.
+
+    Exceptions:
+      AttributeError
+        If a unit is not in the ladder.
+    '''
+    Plan = self._Plan(From, Units)
+    if not Exact:
+      return Plan.Breakdown(Value)
+
+    Value = Fraction(Value) * Plan.ExactScale
+    Whole = math.floor(Value)
+    Rest = Value - Whole
+    Parts = []
+    for Divisor in Plan.ExactDivisors:
+      Count, Whole = divmod(Whole, Divisor)
+      Parts.append(Count)
+    Parts.append(_Whole(Whole + Rest))
+    return Plan.Result._make(Parts)
+
+    #------------------------------------------------------
+  def BreakdownBatch(self, Values, From, Units = None, Columns = False):
+    '''
+    Is Breakdown for many values at once.  With numpy it is done with
+    whole array divmod, int64 for int values, else with a loop.  If
+    a value in the smallest unit does not fit in int64 the numpy
+    result is made from python ints, its fields are objects.
+
+      Result = BreakdownBatch(Values, From, Units = None, Columns = False)
+        Values
+          Is a sequence or numpy array.
+        Result
+          With numpy a structured array with a field for each unit, or
+          if Columns a namedtuple of arrays.  Without numpy a list of
+          the namedtuple of Breakdown, or if Columns a namedtuple of
+          lists.
+    '''
+    Plan = self._Plan(From, Units)
+    if numpy is not None:
+      return _BreakdownNumPy(Values, Plan, Columns)
+
+    Rows = list(map(Plan.Breakdown, Values))
+    if Columns:
+      return Plan.Result._make([list(Column) for Column in zip(*Rows)] or [[] for _ in Plan.Result._fields])
+    return Rows
+
+    #------------------------------------------------------
+  def BreakdownFunction(self, From, Units = None):
+    '''
+    Gets the function Breakdown uses for From and Units.  Call it with
+    just the value, the plan is not looked up again, which is most of
+    the cost of Breakdown on one value.
+
+      Function = BreakdownFunction(From, Units = None)
+        Result = Function(Value)
+    '''
+    return self._Plan(From, Units).Breakdown
+
+    #------------------------------------------------------
+  def Convert(self, Value, From, To, Exact = False):
+    '''
+    Converts a value from one unit to another.
+
+      Result = Convert(Value, From, To, Exact = False)
+        Result
+          Is an int if Value is an int and the result is whole, else a
+          float.  If Exact it is an int or a Fraction.
+
+    Exceptions:
+      AttributeError
+        If a unit is not in the ladder.
+    '''
+    Ratio = self._Ratio(From, To)
+    if Exact:
+      return _Whole(Fraction(Value) * Ratio)
+    if Ratio.denominator == 1:
+      return Value * Ratio.numerator
+    if isinstance(Value, int) and not (Value * Ratio.numerator) % Ratio.denominator:
+      return Value * Ratio.numerator // Ratio.denominator
+    return Value * Ratio.numerator / Ratio.denominator
+
+    #------------------------------------------------------
+  def ConvertBatch(self, Values, From, To):
+    '''
+    Is Convert for many values at once.  With numpy it is a numpy
+    array, else a list.  If int values times the ratio do not fit in
+    int64 the numpy array is made with Convert and holds objects.
+    '''
+    Ratio = self._Ratio(From, To)
+    if numpy is not None:
+      Values = numpy.asarray(Values)
+      if Values.dtype.kind in 'iub' and Values.size:
+        Largest = max(abs(Values.min().item()), abs(Values.max().item()), 1) * Ratio.numerator
+        if Largest > _INT64MAX:
+          Convert = self.Convert
+          return numpy.array([Convert(Value, From, To) for Value in Values.ravel().tolist()],
+                             dtype = object).reshape(Values.shape)
+      if Ratio.denominator == 1:
+        return Values * Ratio.numerator
+      return Values * Ratio.numerator / Ratio.denominator
+    Convert = self.Convert
+    return [Convert(Value, From, To) for Value in Values]
+
+    #------------------------------------------------------
+  def Size(self, Unit):
+    '''
+    Gets the size of a unit, in the smallest unit of the ladder.
+    '''
+    return self._Sizes[self._Unit(Unit)]
+
+    #------------------------------------------------------
+  @property
+  def Units(self):
+    '''
+    Property: is the names of the units, largest first
+    '''
+    return self._Names
+
+    #------------------------------------------------------
+  def _Plan(self, From, Units):
+    Key = (From, Units if Units is None or isinstance(Units, tuple) else tuple(Units))
+    Plan = self._Plans.get(Key)
+    if Plan is not None:
+      return Plan
+
+    Names = self._Units(Units) if Units is not None else self._Breakdown
+    Smallest = self._Sizes[Names[-1]]
+    ExactScale = _Whole(Fraction(self.Size(From), Smallest))
+    ExactDivisors = tuple(_Whole(Fraction(self._Sizes[Name], Smallest)) for Name in Names[:-1])
+    Result = namedtuple('Result', Names)
+    Scale = _Float(ExactScale)
+    Divisors = tuple(_Float(Divisor) for Divisor in ExactDivisors)
+    Plan = self._Plans[Key] = _PlanDef(Result, Scale, Divisors, ExactScale, ExactDivisors,
+                                       _MakeBreakdown(Result, Scale, Divisors))
+    return Plan
+
+    #------------------------------------------------------
+  def _Ratio(self, From, To):
+    Ratio = self._Ratios.get((From, To))
+    if Ratio is None:
+      Ratio = self._Ratios[(From, To)] = Fraction(self.Size(From), self.Size(To))
+    return Ratio
+
+    #------------------------------------------------------
+  def _Unit(self, Unit):
+    try:
+      return self._Lookup[Unit]
+    except KeyError:
+      raise AttributeError(f'Unit is not in the ladder: {Unit!r}') from None
+
+    #------------------------------------------------------
+  def _Units(self, Units):
+    Names = tuple(self._Unit(Unit) for Unit in Units)
+    if not Names:
+      raise AttributeError('Units must have at least one unit')
+    if any(self._Sizes[Larger] <= self._Sizes[Smaller] for Larger, Smaller in zip(Names, Names[1:])):
+      raise AttributeError(f'Units must go from the largest to the smallest: {Names}')
+    return Names
+
+
+  # Is time, the smallest unit is the nanosecond.
+TimeUnits = CUnitLadder((('weeks', 'w', 7 * 24 * 60 * 60 * 10 ** 9),
+                         ('days', 'd', 24 * 60 * 60 * 10 ** 9),
+                         ('hours', 'h', 60 * 60 * 10 ** 9),
+                         ('minutes', 'm', 60 * 10 ** 9),
+                         ('seconds', 's', 10 ** 9),
+                         ('milliseconds', 'ms', 10 ** 6),
+                         ('microseconds', 'us', 10 ** 3),
+                         ('nanoseconds', 'ns', 1)))
+
+  # Is bytes, in powers of 1024 and of 1000.  Breakdown uses the 1024 ones.
+ByteUnits = CUnitLadder((('tebibytes', 'TiB', 1024 ** 4),
+                         ('terabytes', 'TB', 1000 ** 4),
+                         ('gibibytes', 'GiB', 1024 ** 3),
+                         ('gigabytes', 'GB', 1000 ** 3),
+                         ('mebibytes', 'MiB', 1024 ** 2),
+                         ('megabytes', 'MB', 1000 ** 2),
+                         ('kibibytes', 'KiB', 1024),
+                         ('kilobytes', 'kB', 1000),
+                         ('bytes', 'B', 1)),
+                        Breakdown = ('TiB', 'GiB', 'MiB', 'KiB', 'B'))
+
+  # Is a count per unit of time, like calls per second.  Each size is
+  # how many per day one per that unit is.
+RateUnits = CUnitLadder((('per_nanosecond', '/ns', 24 * 60 * 60 * 10 ** 9),
+                         ('per_microsecond', '/us', 24 * 60 * 60 * 10 ** 6),
+                         ('per_millisecond', '/ms', 24 * 60 * 60 * 1000),
+                         ('per_second', '/s', 24 * 60 * 60),
+                         ('per_minute', '/m', 24 * 60),
+                         ('per_hour', '/h', 24),
+                         ('per_day', '/d', 1)))
+
+_DAYS = ('days', 'hours', 'minutes', 'seconds', 'milliseconds')
+_WEEKS = ('weeks',) + _DAYS
 
   #--------------------------------------------------------------------------
 def ConvertMillisecondsDays(milliseconds):
@@ -52,15 +345,7 @@ def ConvertMillisecondsDays(milliseconds):
       <results>  => namedtuple
         (<days>, <hours>, <minutes>, <seconds>, <milliseconds>)
   '''
-  Result = namedtuple('Result', ['days', 'hours', 'minutes', 'seconds', 'milliseconds'])
-  seconds = int(((milliseconds / 1000) % 60))
-  minutes = int(((milliseconds / (1000 * 60)) % 60))
-  hours = int(((milliseconds / (1000 * 60 * 60)) % 24))
-  days = int(((milliseconds / (1000 * 60 * 60 * 24))))
-  milli = milliseconds - ((seconds * 1000) + (minutes * (60 * 1000)) + 
-                          (hours * (1000 * 60 * 60)) + (days * (1000 * 60 * 60 * 24)))
-
-  return Result(days, hours, minutes, seconds, milli)
+  return _BreakdownDays(milliseconds)
 
   #--------------------------------------------------------------------------
 def ConvertMillisecondsWeeks(milliseconds):
@@ -76,13 +361,110 @@ def ConvertMillisecondsWeeks(milliseconds):
       <results>  => namedtuple
         (<weeks>, <days>, <hours>, <minutes>, <seconds>, <milliseconds>)
   '''
-  Result = namedtuple('Result', ['weeks', 'days', 'hours', 'minutes', 'seconds', 'milliseconds'])
-  seconds = int(((milliseconds / 1000) % 60))
-  minutes = int(((milliseconds / (1000 * 60)) % 60))
-  hours = int(((milliseconds / (1000 * 60 * 60)) % 24))
-  days = int(((milliseconds / (1000 * 60 * 60 * 24)) % 7))
-  weeks = int((milliseconds / (1000 * 60 * 60 * 24 * 7)))
-  milli = milliseconds - ((seconds * 1000) + (minutes * (60 * 1000)) + 
-                          (hours * (1000 * 60 * 60)) + (days * (1000 * 60 * 60 * 24)) + (weeks * (1000 * 60 * 60 * 24 * 7)))
-
-  return Result(weeks, days, hours, minutes, seconds, milli)
+  return _BreakdownWeeks(milliseconds)
+
+  #--------------------------------------------------------------------------
+def ConvertMillisecondsDaysBatch(Values, Columns = False):
+  '''
+    Is ConvertMillisecondsDays for many values at once.  With numpy
+    it is done with whole array integer divmod, else with a loop.
+    A negative value is floored like ConvertMillisecondsDays does,
+    -1500 is -1 day, 23 hours, 59 minutes, 58 seconds and 500
+    milliseconds.
+
+    <result> = ConvertMillisecondsDaysBatch(<values>, Columns = False)
+
+      <values>
+        A sequence or numpy array of milliseconds.
+      <result>
+        With numpy a structured array with the fields days, hours,
+        minutes, seconds and milliseconds, or if Columns a namedtuple
+        of arrays.  Without numpy a list of the namedtuple of
+        ConvertMillisecondsDays, or if Columns a namedtuple of lists.
+  '''
+  return TimeUnits.BreakdownBatch(Values, 'ms', _DAYS, Columns)
+
+  #--------------------------------------------------------------------------
+def ConvertMillisecondsWeeksBatch(Values, Columns = False):
+  '''
+    Is ConvertMillisecondsWeeks for many values at once, see
+    ConvertMillisecondsDaysBatch.
+
+    <result> = ConvertMillisecondsWeeksBatch(<values>, Columns = False)
+  '''
+  return TimeUnits.BreakdownBatch(Values, 'ms', _WEEKS, Columns)
+
+  #--------------------------------------------------------------------------
+def _BreakdownNumPy(Values, Plan, Columns):
+  Values = numpy.asarray(Values)
+  Largest = 0
+  if Values.size:
+      # numpy min and max are nan if there is a nan.
+    Largest = max(abs(Values.min().item()), abs(Values.max().item())) * abs(Plan.Scale)
+  if Values.dtype.kind not in 'iubf' or not Largest <= _INT64MAX:
+      # int64 would overflow, or there is a nan, so it is done with
+      # python numbers and the arrays hold objects.
+    Rows = [Plan.Breakdown(Value) for Value in Values.ravel().tolist()]
+    Arrays = [numpy.array(Column, dtype = object).reshape(Values.shape)
+              for Column in (zip(*Rows) if Rows else [()] * len(Plan.Result._fields))]
+  else:
+    if Values.dtype.kind in 'iub' and isinstance(Plan.Scale, int):
+      Whole = Values.astype(numpy.int64) * Plan.Scale
+      Rest = None
+    else:
+      Values = Values.astype(numpy.float64) * Plan.Scale
+      Whole = numpy.floor(Values).astype(numpy.int64)
+      Rest = Values - Whole
+
+    Arrays = []
+    for Divisor in Plan.Divisors:
+      Count, Whole = numpy.divmod(Whole, Divisor)
+      Arrays.append(Count)
+    Arrays.append(Whole if Rest is None else Whole + Rest)
+
+  Result = Plan.Result
+  if Columns:
+    return Result._make(Arrays)
+  Output = numpy.empty(Values.shape, dtype = [(Name, Array.dtype) for Name, Array in zip(Result._fields, Arrays)])
+  for Name, Array in zip(Result._fields, Arrays):
+    Output[Name] = Array
+  return Output
+
+  #--------------------------------------------------------------------------
+def _MakeBreakdown(Result, Scale, Divisors):
+  '''
+  Makes the breakdown function of a plan, everything it needs is bound
+  once so a call is just the divmods.
+  '''
+  Floor = math.floor
+  Make = tuple.__new__
+
+  def Breakdown(Value):
+    if Scale != 1:
+      Value = Value * Scale
+    Whole = Floor(Value)
+    Rest = Value - Whole
+    Parts = []
+    for Divisor in Divisors:
+      Count, Whole = divmod(Whole, Divisor)
+      Parts.append(Count)
+    Parts.append(Whole + Rest)
+    return Make(Result, Parts)
+  return Breakdown
+
+  #--------------------------------------------------------------------------
+def _Float(Value):
+  return Value if isinstance(Value, int) else float(Value)
+
+  #--------------------------------------------------------------------------
+def _Whole(Value):
+  '''
+  Returns a Fraction that is whole as an int.
+  '''
+  return Value.numerator if isinstance(Value, Fraction) and Value.denominator == 1 else Value
+
+
+  # Are the plans of the ConvertMilliseconds functions, they are made
+  # when the module is loaded, after the functions a plan uses.
+_BreakdownDays = TimeUnits.BreakdownFunction('ms', _DAYS)
+_BreakdownWeeks = TimeUnits.BreakdownFunction('ms', _WEEKS)
@@ -27,6 +27,18 @@ Update History:
   Author: Donald W. Long (Donald.W.Long@gmail.com)
   Date:   Apr 30, 2021
     Released
+  Date:   Oct 18, 2026
+    Nodes carry an owner token so IsNode, PopNode and PushBeforeNode
+    are O(1) instead of scanning the list.
+    Iteration uses its own iterator object, so loops can be nested
+    and reversed() walks the list from the bottom.
+    Added CSlotNode and the NodeClass argument for large lists.
+    Added PushMany, PushManyNodes, PopMany and Splice.
+    Added MaxCount and the DLinkOverflow policies.
+    Added KeyFunc with FindByKey, PopByKey and MoveToTop.
+    Added the _Reset hook so subclasses can clear their own state
+    when their nodes are spliced away.
+    Splice checks the keys and MaxCount before it moves any node.
 -----------------------------------------------------------------------------
 '''
 
@@ -47,6 +59,37 @@ class DLinkType(IntEnum):
   LIFO = auto()
 
 
+  #======================================================
+@unique
+class DLinkOverflow(IntEnum):
+  '''
+  Defines what a push does when the list already has
+  MaxCount nodes.
+    DROPOLDEST
+      Pop the oldest node to make room.  That is the top
+      of a FIFO and the bottom of a LIFO.  This gives you
+      a ring buffer.
+    DROPNEWEST
+      Do not push the new node, the push returns None.
+    RAISE
+      Raise DLinkOverflowError.
+    BLOCK
+      Wait until another thread pops a node.  Only for
+      CLockedDoubleLinkedList.
+  '''
+  DROPOLDEST = auto()
+  DROPNEWEST = auto()
+  RAISE = auto()
+  BLOCK = auto()
+
+
+class DLinkOverflowError(Exception):
+  '''
+  Is raised when you push on a full list that has the
+  overflow policy DLinkOverflow.RAISE.
+  '''
+
+
   #======================================================
 class CNode:
   '''
@@ -68,12 +111,54 @@ class CNode:
       linked list it is None.
     UserData
       Is the 'Data' argument that was passed in to CNode.
+
+    _Owner is managed by CDoubleLinkedList.  It is the token
+    of the list the node is in, else None.  This is what
+    allows IsNode to answer without walking the list.
   '''
 
   def __init__(self, UserData):
     self.Prev = None
     self.Next = None
     self.UserData = UserData
+    self._Owner = None
+
+
+  #======================================================
+class CSlotNode:
+  '''
+  Is a compact version of CNode.  It uses __slots__ so it has
+  no instance __dict__, which takes about 40% less memory per
+  node.  It has the same variables as CNode, but you can not
+  add your own variables to it.  Pass it as the NodeClass to
+  CDoubleLinkedList, or inherit it and add your variables to
+  __slots__.
+
+    CSlotNode(UserData)
+      UserData
+        Is the data you wish to store in the node.
+  '''
+  __slots__ = ('Prev', 'Next', 'UserData', '_Owner')
+
+  def __init__(self, UserData):
+    self.Prev = None
+    self.Next = None
+    self.UserData = UserData
+    self._Owner = None
+
+
+  #======================================================
+class _CListToken:
+  '''
+  Each CDoubleLinkedList has a token and each node in the list
+  points at it.  When a list is spliced into another list its
+  token is forwarded to the other list's token, so the moved
+  nodes still belong to the right list without touching them.
+  '''
+  __slots__ = ('Forward',)
+
+  def __init__(self):
+    self.Forward = None
 
 
   #======================================================
@@ -82,28 +167,71 @@ class CDoubleLinkedList(object):
   Is the double linked list.  When you create this you
   select the type you wish, FIFO or LIFO.  See the enum
   DLinkType.  This class supports iteration thru the
-  list just like a python list.
+  list just like a python list, including reversed().
 
-    DList = CDoubleLinkedList(Type)
+    DList = CDoubleLinkedList(Type, NodeClass = CNode, MaxCount = None,
+                              Overflow = DLinkOverflow.DROPOLDEST,
+                              KeyFunc = None)
       Type
         Is DLinkType.FIFO or DLinkType.LIFO
+      NodeClass
+        Is the class used when the list creates a node for
+        you (Push, PushTop, ...).  CNode or CSlotNode or a
+        class that inherits from one of them.
+      MaxCount
+        Is the most nodes the list can have.  None is no limit.
+      Overflow
+        Is what a push does when the list has MaxCount nodes.
+        See DLinkOverflow.
+      KeyFunc
+        Is a function called with the UserData of a node that
+        returns its key.  If set the list keeps a dict of key
+        to node, so FindByKey, PopByKey and MoveToTop are O(1).
+        Keys must be unique and hashable, and the key of a
+        node must not change while it is in the list.
 
   Exceptions:
     AttributeError
       If type is not of DLinkType
+      If NodeClass is not CNode or CSlotNode
+      If MaxCount is not None or an int above 0
+      If Overflow is not of DLinkOverflow, or is BLOCK
+    DLinkOverflowError
+      If a push is done on a full list and Overflow is RAISE
+    KeyError
+      If a push is done with a key that is already in the list
   '''
+  _CanBlock = False
 
-  def __init__(self, Type):
+  def __init__(self, Type, NodeClass = CNode, MaxCount = None,
+               Overflow = DLinkOverflow.DROPOLDEST, KeyFunc = None):
     object.__init__(self)
 
     if not isinstance(Type, DLinkType):
       raise AttributeError(f'Type must be of DLinkType: {type(Type)}')
+    if not (isinstance(NodeClass, type) and issubclass(NodeClass, (CNode, CSlotNode))):
+      raise AttributeError(f'NodeClass must be CNode or CSlotNode: {NodeClass}')
+    if MaxCount is not None and not (isinstance(MaxCount, int) and MaxCount > 0):
+      raise AttributeError(f'MaxCount must be None or an int above 0: {MaxCount}')
+    if not isinstance(Overflow, DLinkOverflow):
+      raise AttributeError(f'Overflow must be of DLinkOverflow: {type(Overflow)}')
+    if Overflow == DLinkOverflow.BLOCK and not self._CanBlock:
+      raise AttributeError('Overflow BLOCK needs a CLockedDoubleLinkedList')
+    if KeyFunc is not None and not callable(KeyFunc):
+      raise AttributeError(f'KeyFunc must be callable or None: {type(KeyFunc)}')
     self._Type = Type
+    self._NodeClass = NodeClass
+    self._MaxCount = MaxCount
+    self._Overflow = Overflow
+    self._Dropped = 0
+    self._KeyFunc = KeyFunc
+    self._Index = None if KeyFunc is None else {}
     self._Cnt = 0
     self._CurNode = None
     self._FirstNode = None
+    self._Token = _CListToken()
 
-    #------------------------------------------------------    #------------------------------------------------------
+    #------------------------------------------------------
   @property
   def Count(self):
     '''
@@ -111,11 +239,35 @@ class CDoubleLinkedList(object):
     '''
     return self._Cnt
 
+    #------------------------------------------------------
+  @property
+  def Dropped(self):
+    '''
+    Property: is the number of nodes dropped because the list
+    was full, by DROPOLDEST or DROPNEWEST
+    '''
+    return self._Dropped
+
+    #------------------------------------------------------
+  def FindByKey(self, Key):
+    '''
+    Finds the node with the key.  Needs a KeyFunc.
+
+      Node = FindByKey(Key)
+        Node
+          Is the node with the key, else None.
+    '''
+    if self._Index is None:
+      raise AttributeError('FindByKey needs a KeyFunc')
+
+    return self._Index.get(Key)
+
     #------------------------------------------------------
   def IsNode(self, Node):
     '''
     Checks to see if the passed in Node is part of this
-    doubly linked list.
+    doubly linked list.  This does not walk the list, it
+    checks the owner of the node, so it is O(1).
 
       RNode = IsNode(Node)
         RNode
@@ -124,17 +276,19 @@ class CDoubleLinkedList(object):
         Node
           Is the node to check
     '''
-    FoundNode = None
+    Token = getattr(Node, '_Owner', None)
+    if Token is self._Token:
+      return Node
+    if Token is None or Token.Forward is None:
+      return None
 
-    if self._Cnt and Node:
-      SavedCurNode = self._CurNode
-      self._CurNode = None
-      for FoundNode in self:
-        if FoundNode == Node:
-          break
-      self._CurNode = SavedCurNode
+      # The node came in thru a Splice, follow the forwards
+      # and save the end on the node so next time is direct.
+    while Token.Forward is not None:
+      Token = Token.Forward
+    Node._Owner = Token
 
-    return FoundNode
+    return Node if Token is self._Token else None
 
     #------------------------------------------------------
   def Next(self):
@@ -163,6 +317,59 @@ class CDoubleLinkedList(object):
 
     return Node
 
+    #------------------------------------------------------
+  @property
+  def KeyFunc(self):
+    '''
+    Property: is the key function of the list, else None
+    '''
+    return self._KeyFunc
+
+    #------------------------------------------------------
+  @property
+  def MaxCount(self):
+    '''
+    Property: is the most nodes the list can have, else None
+    '''
+    return self._MaxCount
+
+    #------------------------------------------------------
+  def MoveToTop(self, Key):
+    '''
+    Moves the node with the key to the top of the list.  The
+    number of nodes does not change, so MaxCount does not
+    apply.  Needs a KeyFunc.
+
+      Node = MoveToTop(Key)
+        Node
+          Is the node that was moved, else None if the key is
+          not in the list.
+    '''
+    if self._Index is None:
+      raise AttributeError('MoveToTop needs a KeyFunc')
+
+    Node = self._Index.get(Key)
+    if Node is None or Node is self._FirstNode:
+      return Node
+
+    Node.Prev.Next = Node.Next
+    Node.Next.Prev = Node.Prev
+    FirstNode = self._FirstNode
+    Node.Prev = FirstNode.Prev
+    Node.Next = FirstNode
+    FirstNode.Prev.Next = Node
+    FirstNode.Prev = Node
+    self._FirstNode = Node
+    return Node
+
+    #------------------------------------------------------
+  @property
+  def NodeClass(self):
+    '''
+    Property: is the class used to create nodes for you
+    '''
+    return self._NodeClass
+
     #------------------------------------------------------
   def Pop(self):
     '''
@@ -200,6 +407,9 @@ class CDoubleLinkedList(object):
           self._CurNode = None
 
       Node.Prev = Node.Next = None
+      Node._Owner = None
+      if self._Index is not None:
+        self._DropKey(Node)
 
     return Node
 
@@ -229,9 +439,55 @@ class CDoubleLinkedList(object):
           self._CurNode = None
 
       Node.Prev = Node.Next = None
+      Node._Owner = None
+      if self._Index is not None:
+        self._DropKey(Node)
 
     return Node
 
+    #------------------------------------------------------
+  def PopMany(self, Count):
+    '''
+    Pops up to Count nodes off the top of the list, just like
+    calling Pop Count times, but the list is only re-linked once.
+
+      Nodes = PopMany(Count)
+        Nodes
+          Is a python list of the nodes in the order they would
+          have been popped.  Empty if the list is empty.  The
+          returned nodes are no longer part of this list.
+        Count
+          Is the most nodes to pop.
+    '''
+    Nodes = []
+    Count = min(Count, self._Cnt)
+    if Count <= 0:
+      return Nodes
+
+    Node = self._FirstNode
+    LastNode = Node.Prev
+    for _ in range(Count):
+      NextNode = Node.Next
+      Node.Prev = Node.Next = None
+      Node._Owner = None
+      Nodes.append(Node)
+      Node = NextNode
+    if self._Index is not None:
+      for Node in Nodes:
+        self._DropKey(Node)
+
+    self._Cnt -= Count
+    if not self._Cnt:
+      self._FirstNode = None
+    else:
+      self._FirstNode = Node
+      Node.Prev = LastNode
+      LastNode.Next = Node
+    if self._CurNode is not None and self._CurNode._Owner is None:
+      self._CurNode = None
+
+    return Nodes
+
     #------------------------------------------------------
   def PopNode(self, Node):
     '''
@@ -247,21 +503,45 @@ class CDoubleLinkedList(object):
           Is the node else None if empty.  The returned
           node is no longer part of this doubly linked list.
     '''
-    FoundNode = self.IsNode(Node)
-    if FoundNode:
-      if Node == self._FirstNode:
-        self.PopTop()
-      else:
-        SavedNode = self._FirstNode
-        self._FirstNode = Node
-        self.PopTop()
-        self._FirstNode = SavedNode
-        if self._CurNode == Node:
-          self._CurNode = None
+    if not self.IsNode(Node):
+      return None
+
+    if Node is self._FirstNode:
+      return self.PopTop()
+
+      # Not the first node, so there are at least two nodes
+      # and we only have to unlink it from its neighbors.
+    self._Cnt -= 1
+    Node.Prev.Next = Node.Next
+    Node.Next.Prev = Node.Prev
+    if self._CurNode == Node:
+      self._CurNode = None
 
-      Node.Prev = Node.Next = None
+    Node.Prev = Node.Next = None
+    Node._Owner = None
+    if self._Index is not None:
+      self._DropKey(Node)
+
+    return Node
+
+    #------------------------------------------------------
+  def PopByKey(self, Key):
+    '''
+    Pops the node with the key off the list.  Needs a KeyFunc.
+
+      Node = PopByKey(Key)
+        Node
+          Is the node, else None if the key is not in the list.
+          The returned node is no longer part of this list.
+    '''
+    if self._Index is None:
+      raise AttributeError('PopByKey needs a KeyFunc')
+
+    Node = self._Index.get(Key)
+    if Node is None:
+      return None
 
-    return FoundNode
+    return self.PopNode(Node)
 
     #------------------------------------------------------
   def Push(self, UserData):
@@ -279,39 +559,49 @@ class CDoubleLinkedList(object):
           Is the data to assign to the node.
     '''
     if self._Type == DLinkType.FIFO:
-      return self.PushBottomNode(CNode(UserData))
+      return self.PushBottomNode(self._NodeClass(UserData))
 
-    return self.PushTopNode(CNode(UserData))
+    return self.PushTopNode(self._NodeClass(UserData))
 
     #------------------------------------------------------
   def PushBeforeNode(self, BeforeNode, Node):
     '''
-    Push's a node before the passed in node.
+    Push's a node before the passed in node.  If BeforeNode is
+    the top of the list the new node becomes the top.
 
       RNode = PushBeforeNode(BeforeNode, Node)
         RNode
           Is your passed in Node, unless BeforeNode is not
           part of this doubly linked list, it will be None.
+          Also None if the list is full and the node was
+          dropped, or BeforeNode was the node dropped.
         BeforeNode
           Is the node to place the new node before.
         Node
           Is the data to assign to the node.
     '''
-    if self.IsNode(BeforeNode):
-      SavedFirstNode = self._FirstNode
-      SavedCurNode = self._CurNode
-      self._FirstNode = BeforeNode
-      SavedType = self._Type
-      self._Type = DLinkType.FIFO
-
-      Node = self.PushTopNode(Node)
-
-      if SavedFirstNode:
-        self._FirstNode = SavedFirstNode
-        self._CurNode = SavedCurNode
-        self._Type = SavedType
-    else: return None
-
+    if not self.IsNode(BeforeNode):
+      return None
+    if self._Index is not None:
+      Key = self._CheckKey(Node)
+      # See PushBottomNode.
+    if self._MaxCount is not None and self._Cnt >= self._MaxCount:
+      if not self._MakeRoom() or not self.IsNode(BeforeNode):
+        return None
+      if self._Index is not None:
+        Key = self._CheckKey(Node)
+
+    Node.Prev = BeforeNode.Prev
+    Node.Next = BeforeNode
+    BeforeNode.Prev.Next = Node
+    BeforeNode.Prev = Node
+    if BeforeNode is self._FirstNode:
+      self._FirstNode = Node
+
+    Node._Owner = self._Token
+    self._Cnt += 1
+    if self._Index is not None:
+      self._Index[Key] = Node
     return Node
 
     #------------------------------------------------------
@@ -330,7 +620,7 @@ class CDoubleLinkedList(object):
         UserData
           Is the data to assign to the node.
     '''
-    return self.PushBeforeNode(BeforeNode, CNode(UserData))
+    return self.PushBeforeNode(BeforeNode, self._NodeClass(UserData))
 
     #------------------------------------------------------
   def PushBottom(self, UserData):
@@ -345,7 +635,7 @@ class CDoubleLinkedList(object):
         UserData
           Is the data to assign to the node.
     '''
-    return self.PushBottomNode(CNode(UserData))
+    return self.PushBottomNode(self._NodeClass(UserData))
 
     #------------------------------------------------------
   def PushBottomNode(self, NewNode):
@@ -357,8 +647,19 @@ class CDoubleLinkedList(object):
           Is the new node that was created and placed in the
           doubly linked list.
         NewNode
-          Is the node to push to the bottom.
+          Is the node to push to the bottom.  None if the list
+          is full and the node was dropped.
     '''
+    if self._Index is not None:
+      Key = self._CheckKey(NewNode)
+      # A BLOCK push waits in _MakeRoom, another thread may have
+      # pushed the key while it waited, so it is checked again.
+    if self._MaxCount is not None and self._Cnt >= self._MaxCount:
+      if not self._MakeRoom():
+        return None
+      if self._Index is not None:
+        Key = self._CheckKey(NewNode)
+
     if self._Cnt == 0:
       NewNode.Prev = NewNode
       NewNode.Next = NewNode
@@ -369,9 +670,88 @@ class CDoubleLinkedList(object):
       NewNode.Prev.Next = NewNode
       self._FirstNode.Prev = NewNode
 
+    NewNode._Owner = self._Token
     self._Cnt += 1
+    if self._Index is not None:
+      self._Index[Key] = NewNode
     return NewNode
 
+    #------------------------------------------------------
+  def PushMany(self, UserDataList):
+    '''
+    Push's a node for each item in UserDataList.  The result
+    is the same as calling Push for each item, but the nodes
+    are linked to each other first and then placed in the
+    list with one re-link.
+
+      Count = PushMany(UserDataList)
+        Count
+          Is the number of nodes pushed.
+        UserDataList
+          Is any iterable of user data.
+    '''
+    return self.PushManyNodes(map(self._NodeClass, UserDataList))
+
+    #------------------------------------------------------
+  def PushManyNodes(self, NewNodes):
+    '''
+    Is like PushMany, but pushes nodes you already have.  The
+    nodes must not be in a list.  If the list has a MaxCount
+    the nodes are pushed one at a time so the Overflow policy
+    is applied to each one.  The same is done if the list has
+    a KeyFunc, a duplicate key raises KeyError and the nodes
+    before it stay pushed.
+
+      Count = PushManyNodes(NewNodes)
+        Count
+          Is the number of nodes pushed, not counting nodes
+          dropped by DROPNEWEST.
+        NewNodes
+          Is any iterable of nodes.
+    '''
+    if self._MaxCount is not None or self._Index is not None:
+      Count = 0
+      for Node in NewNodes:
+        if self.PushNode(Node):
+          Count += 1
+      return Count
+
+      # The nodes get a token of their own that is forwarded to
+      # ours only once the chain is linked in, so if NewNodes
+      # raises part way the nodes taken so far are not members.
+    Token = _CListToken()
+    TopNode = BottomNode = None
+    Count = 0
+
+      # Build the chain in the order it will have in the
+      # list.  A LIFO puts each new node on top.
+    if self._Type == DLinkType.FIFO:
+      for Node in NewNodes:
+        Node._Owner = Token
+        if BottomNode is None:
+          TopNode = Node
+        else:
+          BottomNode.Next = Node
+          Node.Prev = BottomNode
+        BottomNode = Node
+        Count += 1
+    else:
+      for Node in NewNodes:
+        Node._Owner = Token
+        if TopNode is None:
+          BottomNode = Node
+        else:
+          TopNode.Prev = Node
+          Node.Next = TopNode
+        TopNode = Node
+        Count += 1
+
+    if Count:
+      self._LinkChain(TopNode, BottomNode, Count, self._Type == DLinkType.LIFO)
+      Token.Forward = self._Token
+
+    return Count
+
     #------------------------------------------------------
   def PushNode(self, NewNode):
     '''
@@ -403,7 +783,7 @@ class CDoubleLinkedList(object):
         UserData
           Is the data to assign to the node.
     '''
-    return self._PushTop(CNode(UserData))
+    return self.PushTopNode(self._NodeClass(UserData))
 
     #------------------------------------------------------
   def PushTopNode(self, NewNode):
@@ -416,8 +796,19 @@ class CDoubleLinkedList(object):
           doubly linked list.
         NewNode
           Is the node to push to the top of the doubly linked
-          list.
+          list.  None if the list is full and the node was
+          dropped.
     '''
+    if self._Index is not None:
+      Key = self._CheckKey(NewNode)
+      # A BLOCK push waits in _MakeRoom, another thread may have
+      # pushed the key while it waited, so it is checked again.
+    if self._MaxCount is not None and self._Cnt >= self._MaxCount:
+      if not self._MakeRoom():
+        return None
+      if self._Index is not None:
+        Key = self._CheckKey(NewNode)
+
     if self._Cnt == 0:
       NewNode.Prev = NewNode
       NewNode.Next = NewNode
@@ -429,9 +820,89 @@ class CDoubleLinkedList(object):
       NewNode.Prev.Next = NewNode
       self._FirstNode = NewNode
 
+    NewNode._Owner = self._Token
     self._Cnt += 1
+    if self._Index is not None:
+      self._Index[Key] = NewNode
     return NewNode
 
+    #------------------------------------------------------
+  def Splice(self, OtherList):
+    '''
+    Moves all the nodes from OtherList into this list in O(1).
+    The nodes keep their order and are placed where Push would
+    put them: at the bottom of a FIFO or the top of a LIFO.
+    OtherList is empty afterwards.
+
+      Count = Splice(OtherList)
+        Count
+          Is the number of nodes moved, not counting nodes
+          dropped by DROPNEWEST.
+        OtherList
+          Is the CDoubleLinkedList to take the nodes from.
+
+    If the nodes do not fit in MaxCount, DROPOLDEST and
+    DROPNEWEST move the nodes one at a time so the policy is
+    applied to each one, and RAISE and BLOCK raise
+    DLinkOverflowError without moving any nodes.
+
+    Exceptions:
+      AttributeError
+        If OtherList is not a CDoubleLinkedList or is this list.
+      DLinkOverflowError
+        If the nodes do not fit and Overflow is RAISE or BLOCK.
+      KeyError
+        If this list has a KeyFunc and a key of OtherList is
+        already in this list.  No nodes are moved.
+
+    If this list has a KeyFunc the keys of the moved nodes are
+    added to it, which is O(n) of OtherList.  The keys and MaxCount
+    are checked before any node is moved, so when Splice raises
+    both lists are as they were.
+    '''
+    if not isinstance(OtherList, CDoubleLinkedList):
+      raise AttributeError(f'OtherList must be a CDoubleLinkedList: {type(OtherList)}')
+    if OtherList is self:
+      raise AttributeError('Can not splice a list into itself')
+
+    Count = OtherList._Cnt
+    if not Count:
+      return 0
+
+    NewKeys = self._SpliceCheck(OtherList)
+    if self._MaxCount is not None and self._Cnt + Count > self._MaxCount:
+      if self._Type == DLinkType.FIFO:
+        Nodes = OtherList.PopMany(Count)
+      else:
+        Nodes = [OtherList.PopBottom() for _ in range(Count)]
+      Moved = 0
+      for Node in Nodes:
+        if self.PushNode(Node):
+          Moved += 1
+      return Moved
+
+    TopNode = OtherList._FirstNode
+    BottomNode = TopNode.Prev
+    TopNode.Prev = BottomNode.Next = None
+
+      # Hand the other list's nodes to us by forwarding its
+      # token to ours, then give it a fresh token.
+    OtherList._Token.Forward = self._Token
+    OtherList._Reset()
+    if NewKeys is not None:
+      self._Index.update(NewKeys)
+
+    self._LinkChain(TopNode, BottomNode, Count, self._Type == DLinkType.LIFO)
+    return Count
+
+    #------------------------------------------------------
+  @property
+  def Overflow(self):
+    '''
+    Property: is the DLinkOverflow policy of the list
+    '''
+    return self._Overflow
+
     #------------------------------------------------------
   @property
   def Type(self):
@@ -439,12 +910,200 @@ class CDoubleLinkedList(object):
 
     #------------------------------------------------------
   def __iter__(self):
-    self._CurNode = None
-    return self
+    '''
+    Returns a new iterator that walks the list from the top.  Each
+    iterator has its own cursor, so loops can be nested.
+    '''
+    return _CListIterator(self)
 
     #------------------------------------------------------
   def __next__(self):
+    '''
+    Uses the same cursor as Next.  Kept for code that called
+    next() on the list itself, a for loop does not use this.
+    '''
     Node = self.Next()
     if not Node:
       raise StopIteration
     return Node
+
+    #------------------------------------------------------
+  def __reversed__(self):
+    '''
+    Returns a new iterator that walks the list from the bottom
+    using the Prev links.
+    '''
+    return _CListReverseIterator(self)
+
+    #------------------------------------------------------
+  def _Reset(self):
+    '''
+    Empties the list without touching the nodes.  Is called
+    by Splice on the list the nodes were taken from, they now
+    belong to the other list.
+    '''
+    self._Token = _CListToken()
+    self._Cnt = 0
+    self._FirstNode = None
+    self._CurNode = None
+    if self._Index is not None:
+      self._Index = {}
+
+    #------------------------------------------------------
+  def _CheckKey(self, Node):
+    '''
+    Returns the key of Node.  Raises KeyError if it is already
+    in the list.
+    '''
+    Key = self._KeyFunc(Node.UserData)
+    if Key in self._Index:
+      raise KeyError(f'Key is already in the list: {Key!r}')
+    return Key
+
+    #------------------------------------------------------
+  def _SpliceCheck(self, OtherList):
+    '''
+    Checks, before Splice moves any node, that the nodes of
+    OtherList can all be pushed, so an error leaves both lists
+    as they were.
+
+      NewKeys = _SpliceCheck(OtherList)
+        NewKeys
+          Is a dict of the key of each node of OtherList to the
+          node, None if this list has no KeyFunc.
+
+    Exceptions:
+      DLinkOverflowError
+        If the nodes do not fit and Overflow is RAISE or BLOCK.
+      KeyError
+        If a key is in both lists, or twice in OtherList.
+    '''
+    Count = OtherList._Cnt
+    if (self._MaxCount is not None and self._Cnt + Count > self._MaxCount and
+        self._Overflow in (DLinkOverflow.RAISE, DLinkOverflow.BLOCK)):
+      raise DLinkOverflowError(f'Splice of {Count} nodes does not fit in MaxCount {self._MaxCount}')
+
+    if self._Index is None:
+      return None
+    if OtherList._Index is not None and OtherList._KeyFunc is self._KeyFunc:
+      NewKeys = OtherList._Index
+    else:
+      NewKeys = {self._KeyFunc(Node.UserData): Node for Node in OtherList}
+      if len(NewKeys) != Count:
+        raise KeyError('Duplicate keys in OtherList')
+    if not self._Index.keys().isdisjoint(NewKeys):
+      raise KeyError('Keys of OtherList are already in this list')
+    return NewKeys
+
+    #------------------------------------------------------
+  def _DropKey(self, Node):
+    '''
+    Removes the key of a node that was popped from the index.
+    '''
+    Key = self._KeyFunc(Node.UserData)
+    if self._Index.get(Key) is Node:
+      del self._Index[Key]
+
+    #------------------------------------------------------
+  def _MakeRoom(self):
+    '''
+    Is called by the push methods when the list is full.  Applies
+    the Overflow policy.
+
+      Room = _MakeRoom()
+        Room
+          True if the new node can be pushed, False if it is
+          to be dropped.
+    '''
+    if self._Overflow == DLinkOverflow.DROPOLDEST:
+      if self._Type == DLinkType.FIFO:
+        self.PopTop()
+      else:
+        self.PopBottom()
+      self._Dropped += 1
+      return True
+
+    if self._Overflow == DLinkOverflow.DROPNEWEST:
+      self._Dropped += 1
+      return False
+
+    raise DLinkOverflowError(f'List is full, MaxCount is {self._MaxCount}')
+
+    #------------------------------------------------------
+  def _LinkChain(self, TopNode, BottomNode, Count, AtTop):
+    '''
+    Links a chain of nodes, already linked to each other from
+    TopNode down to BottomNode, into the list at the top or the
+    bottom.  The owner of the nodes must already be set.
+    '''
+    if not self._Cnt:
+      self._FirstNode = TopNode
+      TopNode.Prev = BottomNode
+      BottomNode.Next = TopNode
+    else:
+      FirstNode = self._FirstNode
+      LastNode = FirstNode.Prev
+      LastNode.Next = TopNode
+      TopNode.Prev = LastNode
+      BottomNode.Next = FirstNode
+      FirstNode.Prev = BottomNode
+      if AtTop:
+        self._FirstNode = TopNode
+
+    self._Cnt += Count
+
+
+  #======================================================
+class _CListIterator:
+  '''
+  Iterator returned by CDoubleLinkedList.__iter__.  The next node
+  is worked out before the current one is returned, so you can
+  pop the node you were just given.  If the next node is popped
+  out from under the iterator, iteration stops.
+  '''
+  __slots__ = ('_List', '_Node')
+
+  def __init__(self, List):
+    self._List = List
+    self._Node = List._FirstNode
+
+  def __iter__(self):
+    return self
+
+  def __next__(self):
+    Node = self._Node
+    if Node is None or (Node._Owner is not self._List._Token and
+                        not self._List.IsNode(Node)):
+      self._Node = None
+      raise StopIteration
+
+    self._Node = Node.Next
+    if self._Node is self._List._FirstNode:
+      self._Node = None
+    return Node
+
+
+  #======================================================
+class _CListReverseIterator:
+  '''
+  Iterator returned by CDoubleLinkedList.__reversed__.  Same rules
+  as _CListIterator, but walks the Prev links from the bottom.
+  '''
+  __slots__ = ('_List', '_Node')
+
+  def __init__(self, List):
+    self._List = List
+    self._Node = List._FirstNode.Prev if List._FirstNode else None
+
+  def __iter__(self):
+    return self
+
+  def __next__(self):
+    Node = self._Node
+    if Node is None or (Node._Owner is not self._List._Token and
+                        not self._List.IsNode(Node)):
+      self._Node = None
+      raise StopIteration
+
+    self._Node = None if Node is self._List._FirstNode else Node.Prev
+    return Node
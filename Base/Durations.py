@@ -0,0 +1,199 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Parses durations like "1d 2h 3m 4s 5ms", the format CCaptureTimer prints,
+  back to milliseconds and formats milliseconds with a template.  The
+  parser is one regular expression compiled when the module is loaded and
+  each template is compiled once.  The line functions are generators, so a
+  timer log of any size can be read one line at a time.
+
+  For further details see the help file for this module.
+-----------------------------------------------------------------------------
+Required Libraries:
+
+  From Python
+    collections
+    functools
+    math
+    re
+    string
+
+  From Libs
+    Libs.Base.Converters
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+    The unit sizes come from Converters.TimeUnits.
+-----------------------------------------------------------------------------
+'''
+
+import functools
+import math
+import re
+import string
+from collections import namedtuple
+
+from .Converters import TimeUnits
+
+  # Is the template of CCaptureTimer.__str__.
+DEFAULTTEMPLATE = '{d}d {h}h {m}m {s}s {ms}ms'
+
+  # Is the milliseconds in each unit, largest first.  ms is what is left.
+_UNITS = tuple((Unit, TimeUnits.Convert(1, Unit, 'ms')) for Unit in ('w', 'd', 'h', 'm', 's', 'ms'))
+_UNITMS = dict(_UNITS)
+_UNITVALUES = tuple(Unit for _, Unit in _UNITS)
+
+_NUMBER = r'(\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)'
+_DURATION = (rf'(-)?\s*(?:{_NUMBER}\s*w\s*)?(?:{_NUMBER}\s*d\s*)?(?:{_NUMBER}\s*h\s*)?'
+             rf'(?:{_NUMBER}\s*m(?!s)\s*)?(?:{_NUMBER}\s*s\s*)?(?:{_NUMBER}\s*ms)?')
+_DurationRE = re.compile(_DURATION)
+_TimerLineRE = re.compile(r'Code Block "(.*?)" took: ' + _DURATION)
+
+  # Is what ParseTimerLines yields.  Took is in milliseconds.
+_TimerLineDef = namedtuple('TimerLine', ['Name', 'Took'])
+
+
+  #--------------------------------------------------------------------------
+def FormatDuration(Milliseconds, Template = DEFAULTTEMPLATE):
+  '''
+  Formats milliseconds with a template.
+
+    String = FormatDuration(Milliseconds, Template = DEFAULTTEMPLATE)
+      Milliseconds
+        Is an int or a float, if it is negative the string starts
+        with '-'.
+      Template
+        Is a str.format template with the fields w, d, h, m, s and
+        ms, weeks to milliseconds.  Any of them can be left out, the
+        largest one in the template gets all of the larger units and
+        ms, or the smallest one if there is no ms, gets the rest.
+        Format specs work, '{h:02}:{m:02}:{s:02}' for one.
+
+  Exceptions:
+    AttributeError
+      If the template has a field that is not a unit, or no fields.
+  '''
+  Units, Last = _CompileTemplate(Template)
+  Sign = ''
+  if Milliseconds < 0:
+    Sign = '-'
+    Milliseconds = -Milliseconds
+
+  Whole = math.floor(Milliseconds)
+  Rest = Milliseconds - Whole
+  Values = {}
+  for Name, Unit in Units:
+    Values[Name], Whole = divmod(Whole, Unit)
+  Unit = _UNITMS[Last]
+  if Unit == 1:
+    Values[Last] = Whole + Rest
+  elif Rest or Whole % Unit:
+    Values[Last] = (Whole + Rest) / Unit
+  else:
+    Values[Last] = Whole // Unit
+  return Sign + Template.format_map(Values)
+
+
+  #--------------------------------------------------------------------------
+def FormatDurations(Values, Template = DEFAULTTEMPLATE):
+  '''
+  Is a generator of FormatDuration for each value.
+
+    for String in FormatDurations(Values, Template = DEFAULTTEMPLATE):
+  '''
+  for Value in Values:
+    yield FormatDuration(Value, Template)
+
+
+  #--------------------------------------------------------------------------
+def ParseDuration(Text):
+  '''
+  Parses a duration to milliseconds.  The units are w, d, h, m, s and
+  ms, in that order, each can be left out and there may be spaces
+  between the number and the unit.  '1d 2h 3m 4s 5ms', '90s' and
+  '1.5h' all work.
+
+    Milliseconds = ParseDuration(Text)
+      Milliseconds
+        Is an int if all the numbers are, else a float.
+
+  Exceptions:
+    ValueError
+      If Text is not a duration.
+  '''
+  Match = _DurationRE.fullmatch(Text.strip())
+  if Match is None or Match.lastindex is None or Match.lastindex == 1:
+    raise ValueError(f'Not a duration: {Text!r}')
+  return _Milliseconds(Match.groups())
+
+
+  #--------------------------------------------------------------------------
+def ParseTimerLines(Lines):
+  '''
+  Is a generator over the lines of a timer log that yields the Name
+  and Took of each line CCaptureTimer printed, the other lines are
+  skipped.  Lines can be an open file, it is read one line at a time.
+
+    for Name, Took in ParseTimerLines(Lines):
+  '''
+  Search = _TimerLineRE.search
+  for Line in Lines:
+    Match = Search(Line)
+    if Match is not None and Match.lastindex > 2:
+      Groups = Match.groups()
+      yield _TimerLineDef(Groups[0], _Milliseconds(Groups[1:]))
+
+
+  #--------------------------------------------------------------------------
+@functools.lru_cache(maxsize = 128)
+def _CompileTemplate(Template):
+  '''
+  Returns the units to divmod by, largest first, and the name of the
+  smallest unit in Template, it gets what is left.
+  '''
+  Fields = set()
+  for _, Field, _, _ in string.Formatter().parse(Template):
+    if Field is not None:
+      if Field not in _UNITMS:
+        raise AttributeError(f'Template field must be one of {", ".join(_UNITMS)}: {Field!r}')
+      Fields.add(Field)
+  if not Fields:
+    raise AttributeError(f'Template has no fields: {Template!r}')
+
+  Names = [Name for Name, _ in _UNITS if Name in Fields]
+  return tuple((Name, _UNITMS[Name]) for Name in Names[:-1]), Names[-1]
+
+
+  #--------------------------------------------------------------------------
+def _Milliseconds(Groups):
+  '''
+  Adds up the numbers of a _DURATION match, Groups is the sign then a
+  number or None for each unit.
+  '''
+  Total = 0
+  for Number, Unit in zip(Groups[1:], _UNITVALUES):
+    if Number is not None:
+      Total += (int(Number) if Number.isdigit() else float(Number)) * Unit
+  return -Total if Groups[0] else Total
+
@@ -0,0 +1,323 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  A low overhead way to time a block of code or a function.  CFastTimer
+  and Timed use time.perf_counter_ns, take off the cost of the timer
+  itself and add the time to a CTimerRegistry.
+
+  For further details see the help file for this module.
+-----------------------------------------------------------------------------
+Required Libraries:
+
+  From Python
+    functools
+    math
+    random
+    time
+
+  From Libs
+    Libs.Base.CodeTimer
+    Libs.Base.TimerStats
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+    Calibrate runs on the first use of a timer, not when the module is
+    loaded.
+-----------------------------------------------------------------------------
+'''
+
+import functools
+import math
+import random
+from time import perf_counter_ns
+
+from .CodeTimer import (NullTimer, TimersEnabled)
+from .TimerStats import (CTimerRegistry, TimerRegistry)
+
+  # Are the nanoseconds a CFastTimer and a Timed function add to what
+  # they time, when there is nothing in the block or the function.  Set
+  # by Calibrate, it runs when the first timer is made.
+ContextOverhead = 0
+DecoratorOverhead = 0
+_Calibrated = False
+
+
+  #======================================================
+class CFastTimer(object):
+  '''
+  Times the block of a 'with' statement in nanoseconds and adds it,
+  in milliseconds, to a CTimerRegistry.  ContextOverhead is taken off
+  the time.  Unlike CCodeTimer nothing is checked or printed and
+  there is no __del__, so an instance can be made once and used for
+  every pass of a loop.  It is not reentrant, nest two instances.
+
+    Timer = CFastTimer(Name, Registry = None)
+      Name
+        Is the name the time is added under.  If None the time is
+        only kept in Took.
+      Registry
+        Is the CTimerRegistry, None is TimerRegistry.
+
+    Took
+      Is the nanoseconds the last block took, an int.
+
+  When the timers are off, see EnableTimers in CodeTimer, it returns
+  NullTimer instead.
+  '''
+  __slots__ = ('Name', 'Registry', 'Took', '_Start')
+
+  def __new__(cls, *args, **kwargs):  # pylint: disable=unused-argument
+    if not TimersEnabled():
+      return NullTimer
+    return object.__new__(cls)
+
+  def __init__(self, Name, Registry = None):
+    if not _Calibrated:
+      Calibrate()
+    self.Name = Name
+    self.Registry = Registry if Registry is not None else TimerRegistry
+    self.Took = 0
+    self._Start = 0
+
+    #------------------------------------------------------
+  def __enter__(self):
+    self._Start = perf_counter_ns()
+    return self
+
+    #------------------------------------------------------
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    Took = perf_counter_ns() - self._Start - ContextOverhead
+    self.Took = Took = Took if Took > 0 else 0
+    if self.Name is not None:
+      self.Registry.Add(self.Name, Took / 1e6)
+
+
+  #======================================================
+class CSampledTimer(CFastTimer):
+  '''
+  Is a CFastTimer that only times some of the blocks, so it can be
+  left in a hot loop.  A block that is not timed only counts down to
+  the next one that is.  Each time is added with a Weight of the
+  calls it stands for, so the Count, Total and quantiles in the
+  registry are for all the calls.  Give Every or Rate.
+
+    Timer = CSampledTimer(Name, Registry = None, Every = None, Rate = None)
+      Every
+        Times 1 block in Every.
+      Rate
+        Is the chance, from 0 to 1, that a block is timed.  The
+        number of blocks to the next timed one is picked at random,
+        so a loop that repeats every N blocks does not line up with
+        the samples.
+      See CFastTimer for the rest.  Took is the last block timed.
+
+  Exceptions:
+    AttributeError
+      If neither or both of Every and Rate are given, or they are
+      out of range.
+  '''
+  __slots__ = ('Weight', '_Skip', '_NextGap')
+
+  def __init__(self, Name, Registry = None, Every = None, Rate = None):
+    CFastTimer.__init__(self, Name, Registry)
+    self._NextGap, self.Weight = _Sampler(Every, Rate)
+    self._Skip = self._NextGap()
+
+    #------------------------------------------------------
+  def __enter__(self):
+    self._Skip -= 1
+    if not self._Skip:
+      self._Start = perf_counter_ns()
+    return self
+
+    #------------------------------------------------------
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    if self._Skip:
+      return
+    Took = perf_counter_ns() - self._Start - ContextOverhead
+    self.Took = Took = Took if Took > 0 else 0
+    self._Skip = self._NextGap()
+    if self.Name is not None:
+      self.Registry.Add(self.Name, Took / 1e6, self.Weight)
+
+
+  #--------------------------------------------------------------------------
+def Timed(Name = None, Registry = None, Every = None, Rate = None):
+  '''
+  Is a decorator that times each call of a function in nanoseconds
+  and adds it, in milliseconds, to a CTimerRegistry.
+  DecoratorOverhead is taken off the time.  The time is added even
+  if the function raises.
+
+    @Timed
+    def MyFunction(...):
+
+    @Timed(Name = None, Registry = None, Every = None, Rate = None)
+    def MyFunction(...):
+      Name
+        Is the name the time is added under, None is the
+        __qualname__ of the function.
+      Registry
+        Is the CTimerRegistry, None is TimerRegistry.
+      Every, Rate
+        Only time some of the calls, see CSampledTimer.
+
+  When the timers are off, see EnableTimers in CodeTimer, the
+  function is returned as it is.
+  '''
+  if callable(Name):
+    return Timed()(Name)
+  if not TimersEnabled():
+    return _Untimed
+  if Every is not None or Rate is not None:
+    return _SampledTimed(Name, Registry, *_Sampler(Every, Rate))
+
+  def Decorator(Function):
+    if not _Calibrated:
+      Calibrate()
+    TimerName = Name if Name is not None else Function.__qualname__
+    Add = (Registry if Registry is not None else TimerRegistry).Add
+
+    @functools.wraps(Function)
+    def Wrapper(*args, **kwargs):
+      Start = perf_counter_ns()
+      try:
+        return Function(*args, **kwargs)
+      finally:
+        Took = perf_counter_ns() - Start - DecoratorOverhead
+        Add(TimerName, (Took if Took > 0 else 0) / 1e6)
+
+    return Wrapper
+
+  return Decorator
+
+
+  #--------------------------------------------------------------------------
+def _Untimed(Function):
+  return Function
+
+
+  #--------------------------------------------------------------------------
+def _SampledTimed(Name, Registry, NextGap, Weight):
+  '''
+  Is the decorator of Timed when only some calls are timed.
+  '''
+  def Decorator(Function):
+    if not _Calibrated:
+      Calibrate()
+    TimerName = Name if Name is not None else Function.__qualname__
+    Add = (Registry if Registry is not None else TimerRegistry).Add
+    Skip = NextGap()
+
+    @functools.wraps(Function)
+    def Wrapper(*args, **kwargs):
+      nonlocal Skip
+      Skip -= 1
+      if Skip:
+        return Function(*args, **kwargs)
+
+      Skip = NextGap()
+      Start = perf_counter_ns()
+      try:
+        return Function(*args, **kwargs)
+      finally:
+        Took = perf_counter_ns() - Start - DecoratorOverhead
+        Add(TimerName, (Took if Took > 0 else 0) / 1e6, Weight)
+
+    return Wrapper
+
+  return Decorator
+
+
+  #--------------------------------------------------------------------------
+def _Sampler(Every, Rate):
+  '''
+  Checks Every and Rate and returns (NextGap, Weight).  NextGap is
+  called to get how many calls there are to the next timed one,
+  counting that one.
+  '''
+  if (Every is None) == (Rate is None):
+    raise AttributeError('Give one of Every or Rate')
+
+  if Every is not None:
+    if not isinstance(Every, int) or Every < 1:
+      raise AttributeError(f'Every must be an int above 0: {Every}')
+    return (lambda: Every), Every
+
+  if not 0 < Rate <= 1:
+    raise AttributeError(f'Rate must be above 0 and not more than 1: {Rate}')
+  if Rate == 1:
+    return (lambda: 1), 1
+
+    # The gaps of a Bernoulli process are geometric.
+  Scale = 1 / math.log(1 - Rate)
+  Random = random.Random()
+  return (lambda: int(math.log(1 - Random.random()) * Scale) + 1), 1 / Rate
+
+
+  #--------------------------------------------------------------------------
+def Calibrate(Loops = 1000, Rounds = 5):
+  '''
+  Measures ContextOverhead and DecoratorOverhead by timing empty
+  blocks and an empty function.  Each round times Loops of them
+  and the round with the lowest mean is kept, the others had
+  something else running.  It is called when the first CFastTimer
+  is made or the first function is Timed, with the timers on, so
+  importing the module costs nothing.  Call it yourself to measure
+  at a time you pick, or again for a better measure.  When the
+  timers are off both are set to 0 and the first timer made after
+  they are turned on calibrates.
+
+    ContextOverhead, DecoratorOverhead = Calibrate(Loops = 1000, Rounds = 5)
+  '''
+  global ContextOverhead, DecoratorOverhead, _Calibrated  # pylint: disable=global-statement
+  ContextOverhead = DecoratorOverhead = 0
+  if not TimersEnabled():
+    return ContextOverhead, DecoratorOverhead
+    # Set first, the timers made below must not calibrate again.
+  _Calibrated = True
+
+  Registry = CTimerRegistry()
+  Timer = CFastTimer('Context', Registry)
+  Empty = Timed('Decorator', Registry)(_Empty)
+  Context = Decorator = None
+  for _ in range(Rounds):
+    Registry.Reset()
+    for _ in range(Loops):
+      with Timer:
+        pass
+      Empty()
+    Mean = Registry.Get('Context').Mean
+    Context = Mean if Context is None else min(Context, Mean)
+    Mean = Registry.Get('Decorator').Mean
+    Decorator = Mean if Decorator is None else min(Decorator, Mean)
+
+  ContextOverhead = round(Context * 1e6)
+  DecoratorOverhead = round(Decorator * 1e6)
+  return ContextOverhead, DecoratorOverhead
+
+
+  #--------------------------------------------------------------------------
+def _Empty():
+  pass
@@ -0,0 +1,336 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  A bounded least recently used (LRU) cache with optional time to live
+  (TTL) and size by weight, built on CDoubleLinkedList.  Also has a
+  decorator that memoizes a function with the cache.
+
+  For further details see the help file for this module.
+-----------------------------------------------------------------------------
+Required Libraries:
+
+  From Python
+    collections
+    functools
+    time
+
+  From Libs
+    Libs.Base.DoubleLinkedList
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+    The keys of LRUMemoize keep the positional and keyword arguments apart.
+-----------------------------------------------------------------------------
+'''
+
+import functools
+import time
+from collections import namedtuple
+
+from .DoubleLinkedList import (DLinkType, CDoubleLinkedList, CSlotNode)
+
+  # Is what is returned from CLRUCache.Stats.
+_CacheStatsDef = namedtuple('CacheStats', ['Hits', 'Misses', 'Evictions', 'Expirations',
+                                           'Count', 'Weight'])
+
+_NotFound = object()
+
+  # Is put between the positional and the keyword arguments in a key of
+  # LRUMemoize, no argument can be it.
+_KeywordMark = (object(),)
+
+
+  #======================================================
+class _CCacheNode(CSlotNode):
+  '''
+  Is the node for each entry in the cache.  UserData is the value.
+  '''
+  __slots__ = ('Key', 'Weight', 'Expires')
+
+  def __init__(self, Key, Value, Weight, Expires):
+    CSlotNode.__init__(self, Value)
+    self.Key = Key
+    self.Weight = Weight
+    self.Expires = Expires
+
+
+  #======================================================
+class CLRUCache(object):
+  '''
+  Is a least recently used cache.  The entries are kept in a LIFO
+  CDoubleLinkedList, the top is the most recently used and the
+  bottom is the next to be evicted.  A dict maps each key to its
+  node, so Get, Put, Touch and Pop are all O(1).  This class is
+  not thread safe.
+
+    Cache = CLRUCache(MaxSize = 128, MaxWeight = None, TTL = None,
+                      Weigher = None, Timer = time.monotonic)
+      MaxSize
+        Is the most entries to keep.  None is no limit.
+      MaxWeight
+        Is the most total weight to keep.  None is no limit.
+      TTL
+        Is the seconds an entry lives after it is put.  None
+        means entries do not expire.
+      Weigher
+        Is a function called with (Key, Value) that returns the
+        weight of an entry.  If None every entry weighs 1.
+      Timer
+        Is the clock used for the TTL, in seconds.
+
+    Hits, Misses, Evictions, Expirations
+      Are the counters of the cache.  See Stats.
+
+  Exceptions:
+    AttributeError
+      If MaxSize, MaxWeight or TTL is not None or above 0.
+      If an entry weighs more than MaxWeight.
+  '''
+
+  def __init__(self, MaxSize = 128, MaxWeight = None, TTL = None, Weigher = None,
+               Timer = time.monotonic):
+    object.__init__(self)
+
+    for Name, Value in (('MaxSize', MaxSize), ('MaxWeight', MaxWeight), ('TTL', TTL)):
+      if Value is not None and not Value > 0:
+        raise AttributeError(f'{Name} must be None or above 0: {Value}')
+
+    self._MaxSize = MaxSize
+    self._MaxWeight = MaxWeight
+    self._TTL = TTL
+    self._Weigher = Weigher
+    self._Timer = Timer
+    self._Map = {}
+    self._List = CDoubleLinkedList(DLinkType.LIFO, CSlotNode)
+    self._Weight = 0
+    self.Hits = 0
+    self.Misses = 0
+    self.Evictions = 0
+    self.Expirations = 0
+
+    #------------------------------------------------------
+  def Clear(self):
+    '''
+    Removes all the entries.  The counters are not reset.
+    '''
+    self._Map.clear()
+    self._List = CDoubleLinkedList(DLinkType.LIFO, CSlotNode)
+    self._Weight = 0
+
+    #------------------------------------------------------
+  @property
+  def Count(self):
+    '''
+    Property: is the number of entries in the cache
+    '''
+    return self._List.Count
+
+    #------------------------------------------------------
+  def Expire(self):
+    '''
+    Removes every entry whose TTL is over.  Expired entries are
+    also removed when you Get them, this is for when you wish to
+    free the memory.  This walks the whole cache.
+
+      Count = Expire()
+        Count
+          Is the number of entries removed.
+    '''
+    if self._TTL is None:
+      return 0
+
+    Now = self._Timer()
+    Expired = [Node for Node in self._List if Node.Expires <= Now]
+    for Node in Expired:
+      self._Remove(Node)
+    self.Expirations += len(Expired)
+    return len(Expired)
+
+    #------------------------------------------------------
+  def Get(self, Key, Default = None):
+    '''
+    Gets the value of Key and makes it the most recently used.
+
+      Value = Get(Key, Default = None)
+        Value
+          Is the value, else Default if Key is not in the cache
+          or its TTL is over.
+    '''
+    Node = self._Map.get(Key)
+    if Node is None:
+      self.Misses += 1
+      return Default
+
+    if self._Expired(Node):
+      self.Misses += 1
+      return Default
+
+    self.Hits += 1
+    self._List.PopNode(Node)
+    self._List.PushTopNode(Node)
+    return Node.UserData
+
+    #------------------------------------------------------
+  def Pop(self, Key, Default = None):
+    '''
+    Removes Key from the cache.
+
+      Value = Pop(Key, Default = None)
+        Value
+          Is the value that was removed, else Default if Key
+          was not in the cache or its TTL is over.
+    '''
+    Node = self._Map.get(Key)
+    if Node is None or self._Expired(Node):
+      return Default
+
+    self._Remove(Node)
+    return Node.UserData
+
+    #------------------------------------------------------
+  def Put(self, Key, Value):
+    '''
+    Puts Key in the cache as the most recently used entry.  If it
+    is already in the cache its value is replaced and its TTL
+    starts again.  Entries are evicted from the bottom until the
+    cache is within MaxSize and MaxWeight.
+
+      Put(Key, Value)
+    '''
+    Weight = self._Weigher(Key, Value) if self._Weigher else 1
+    if self._MaxWeight is not None and Weight > self._MaxWeight:
+      raise AttributeError(f'Weight of {Key!r} is more than MaxWeight: {Weight}')
+
+    OldNode = self._Map.get(Key)
+    if OldNode is not None:
+      self._Remove(OldNode)
+
+    Expires = None if self._TTL is None else self._Timer() + self._TTL
+    Node = self._List.PushTopNode(_CCacheNode(Key, Value, Weight, Expires))
+    self._Map[Key] = Node
+    self._Weight += Weight
+
+    while ((self._MaxSize is not None and self._List.Count > self._MaxSize) or
+           (self._MaxWeight is not None and self._Weight > self._MaxWeight)):
+      self._Forget(self._List.PopBottom())
+      self.Evictions += 1
+
+    #------------------------------------------------------
+  @property
+  def Stats(self):
+    '''
+    Property: is a namedtuple of the counters
+      CacheStats(Hits, Misses, Evictions, Expirations, Count, Weight)
+    '''
+    return _CacheStatsDef(self.Hits, self.Misses, self.Evictions, self.Expirations,
+                          self._List.Count, self._Weight)
+
+    #------------------------------------------------------
+  def Touch(self, Key):
+    '''
+    Makes Key the most recently used entry without getting it
+    or counting a hit.
+
+      Found = Touch(Key)
+        Found
+          True if Key is in the cache else False.  An entry
+          whose TTL is over is removed and is not found.
+    '''
+    Node = self._Map.get(Key)
+    if Node is None or self._Expired(Node):
+      return False
+
+    self._List.PopNode(Node)
+    self._List.PushTopNode(Node)
+    return True
+
+    #------------------------------------------------------
+  @property
+  def Weight(self):
+    '''
+    Property: is the total weight of the entries
+    '''
+    return self._Weight
+
+    #------------------------------------------------------
+  def _Expired(self, Node):
+    '''
+    Removes Node, and counts an expiration, if its TTL is over.
+    Returns True if it was removed.
+    '''
+    if self._TTL is None or Node.Expires > self._Timer():
+      return False
+    self._Remove(Node)
+    self.Expirations += 1
+    return True
+
+    #------------------------------------------------------
+  def _Forget(self, Node):
+    del self._Map[Node.Key]
+    self._Weight -= Node.Weight
+
+    #------------------------------------------------------
+  def _Remove(self, Node):
+    self._List.PopNode(Node)
+    self._Forget(Node)
+
+    #------------------------------------------------------
+  def __contains__(self, Key):
+    Node = self._Map.get(Key)
+    return Node is not None and (self._TTL is None or Node.Expires > self._Timer())
+
+    #------------------------------------------------------
+  def __len__(self):
+    return self._List.Count
+
+
+  #--------------------------------------------------------------------------
+def LRUMemoize(MaxSize = 128, MaxWeight = None, TTL = None, Weigher = None):
+  '''
+  Is a decorator that caches the results of a function in a
+  CLRUCache.  The arguments must be hashable.  Like functools.lru_cache
+  the keyword arguments are kept in the order they are passed, so
+  f(a = 1, b = 2) and f(b = 2, a = 1) are cached apart.  The cache is
+  available as the 'Cache' attribute of the decorated function.
+
+    @LRUMemoize(MaxSize = 128, MaxWeight = None, TTL = None, Weigher = None)
+    def MyFunction(...):
+      See CLRUCache for the arguments.
+  '''
+  def Decorator(Function):
+    Cache = CLRUCache(MaxSize, MaxWeight, TTL, Weigher)
+
+    @functools.wraps(Function)
+    def Wrapper(*args, **kwargs):
+      Key = args + _KeywordMark + tuple(kwargs.items()) if kwargs else args
+      Value = Cache.Get(Key, _NotFound)
+      if Value is _NotFound:
+        Value = Function(*args, **kwargs)
+        Cache.Put(Key, Value)
+      return Value
+
+    Wrapper.Cache = Cache
+    return Wrapper
+
+  return Decorator
@@ -0,0 +1,375 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Thread safe and asyncio versions of CDoubleLinkedList that can be used
+  as a queue.  Pop will wait for a node to be pushed instead of returning
+  None.
+
+  For further details see the help file for this module.
+-----------------------------------------------------------------------------
+Required Libraries:
+
+  From Python
+    asyncio
+    collections
+    threading
+    time
+
+  From Libs
+    Libs.Base.DoubleLinkedList
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+from .DoubleLinkedList import (CDoubleLinkedList, CNode, DLinkOverflow)
+
+
+  #======================================================
+class CLockedDoubleLinkedList(CDoubleLinkedList):
+  '''
+  Is a CDoubleLinkedList that can be shared between threads.  Every
+  method that changes the list holds the lock of the list.  Pop
+  will wait for a node when the list is empty.  PopTop, PopBottom
+  and the rest of the methods never wait.  If the Overflow is
+  DLinkOverflow.BLOCK a push on a full list waits until a node
+  is popped.
+
+    DList = CLockedDoubleLinkedList(Type, NodeClass = CNode, MaxCount = None,
+                                    Overflow = DLinkOverflow.DROPOLDEST,
+                                    KeyFunc = None)
+      See CDoubleLinkedList.
+
+    Lock
+      Is the lock of the list.  Hold it with the 'with' statement
+      while you iterate over the list or need several calls to
+      happen together.
+  '''
+
+  _CanBlock = True
+
+  def __init__(self, Type, NodeClass = CNode, MaxCount = None,
+               Overflow = DLinkOverflow.DROPOLDEST, KeyFunc = None):
+    CDoubleLinkedList.__init__(self, Type, NodeClass, MaxCount, Overflow, KeyFunc)
+    self._Lock = threading.RLock()
+    self._NotEmpty = threading.Condition(self._Lock)
+    self._NotFull = threading.Condition(self._Lock)
+
+    #------------------------------------------------------
+  @property
+  def Lock(self):
+    '''
+    Property: is the lock used by the list
+    '''
+    return self._Lock
+
+    #------------------------------------------------------
+  def MoveToTop(self, Key):
+    with self._Lock:
+      return CDoubleLinkedList.MoveToTop(self, Key)
+
+    #------------------------------------------------------
+  def Next(self):
+    with self._Lock:
+      return CDoubleLinkedList.Next(self)
+
+    #------------------------------------------------------
+  def Pop(self, Block = True, Timeout = None):
+    '''
+    Pops the first item off the list.  If the list is empty it
+    waits for a node to be pushed.
+
+      Node = Pop(Block = True, Timeout = None)
+        Node
+          Is the node, else None if the list is still empty
+          when the wait is over.
+        Block
+          If False do not wait, just like PopTop.
+        Timeout
+          Is the most seconds to wait.  None waits forever.
+    '''
+    with self._NotEmpty:
+      if Block and not self._Cnt:
+        if Timeout is None:
+          while not self._Cnt:
+            self._NotEmpty.wait()
+        else:
+          EndTime = time.monotonic() + Timeout
+          while not self._Cnt:
+            Remaining = EndTime - time.monotonic()
+            if Remaining <= 0:
+              break
+            self._NotEmpty.wait(Remaining)
+      return self.PopTop()
+
+    #------------------------------------------------------
+  def PopByKey(self, Key):
+    with self._Lock:
+      return CDoubleLinkedList.PopByKey(self, Key)
+
+    #------------------------------------------------------
+  def PopTop(self):
+    with self._Lock:
+      Node = CDoubleLinkedList.PopTop(self)
+      if Node is not None:
+        self._Popped(1)
+      return Node
+
+    #------------------------------------------------------
+  def PopBottom(self):
+    with self._Lock:
+      Node = CDoubleLinkedList.PopBottom(self)
+      if Node is not None:
+        self._Popped(1)
+      return Node
+
+    #------------------------------------------------------
+  def PopMany(self, Count):
+    with self._Lock:
+      Nodes = CDoubleLinkedList.PopMany(self, Count)
+      if Nodes:
+        self._Popped(len(Nodes))
+      return Nodes
+
+    #------------------------------------------------------
+  def PopNode(self, Node):
+    with self._Lock:
+      Node = CDoubleLinkedList.PopNode(self, Node)
+      if Node is not None:
+        self._Popped(1)
+      return Node
+
+    #------------------------------------------------------
+  def PushBeforeNode(self, BeforeNode, Node):
+    with self._Lock:
+      Node = CDoubleLinkedList.PushBeforeNode(self, BeforeNode, Node)
+      if Node:
+        self._Pushed(1)
+      return Node
+
+    #------------------------------------------------------
+  def PushBottomNode(self, NewNode):
+    with self._Lock:
+      Node = CDoubleLinkedList.PushBottomNode(self, NewNode)
+      if Node is not None:
+        self._Pushed(1)
+      return Node
+
+    #------------------------------------------------------
+  def PushManyNodes(self, NewNodes):
+    with self._Lock:
+      Count = CDoubleLinkedList.PushManyNodes(self, NewNodes)
+        # With a MaxCount or KeyFunc each node went through PushNode,
+        # which already woke up the waiters.
+      if Count and self._MaxCount is None and self._Index is None:
+        self._Pushed(Count)
+      return Count
+
+    #------------------------------------------------------
+  def PushTopNode(self, NewNode):
+    with self._Lock:
+      Node = CDoubleLinkedList.PushTopNode(self, NewNode)
+      if Node is not None:
+        self._Pushed(1)
+      return Node
+
+    #------------------------------------------------------
+  def Splice(self, OtherList):
+    '''
+    See CDoubleLinkedList.Splice.  If OtherList also has a lock
+    both are held, always in the same order so two threads
+    splicing the lists into each other can not deadlock.
+    '''
+    OtherLock = getattr(OtherList, '_Lock', None)
+    if OtherLock is None or OtherList is self:
+      with self._Lock:
+        OneByOne = self._SpliceOneByOne(OtherList)
+        Count = CDoubleLinkedList.Splice(self, OtherList)
+        if Count and not OneByOne:
+          self._Pushed(Count)
+      return Count
+
+    FirstLock, SecondLock = ((self._Lock, OtherLock) if id(self) < id(OtherList)
+                             else (OtherLock, self._Lock))
+    with FirstLock, SecondLock:
+      OneByOne = self._SpliceOneByOne(OtherList)
+      Count = CDoubleLinkedList.Splice(self, OtherList)
+      if Count and not OneByOne:
+        OtherList._Popped(Count)
+        self._Pushed(Count)
+    return Count
+
+    #------------------------------------------------------
+  def _SpliceOneByOne(self, OtherList):
+    '''
+    Is True if Splice will move the nodes with a pop and a push
+    each, as they do not fit in MaxCount.  Those already wake up
+    the waiters, so Splice must not do it again.  The locks are
+    held.
+    '''
+    return (self._MaxCount is not None and OtherList is not self and
+            self._Cnt + getattr(OtherList, '_Cnt', 0) > self._MaxCount)
+
+    #------------------------------------------------------
+  def _CheckKey(self, Node):
+    '''
+    See CDoubleLinkedList._CheckKey.  A BLOCK push that waited may
+    find its key was pushed while it waited, the wake up it took
+    is passed on to the next thread waiting for room.
+    '''
+    try:
+      return CDoubleLinkedList._CheckKey(self, Node)
+    except KeyError:
+      if self._MaxCount is not None and self._Cnt < self._MaxCount:
+        self._Popped(1)
+      raise
+
+    #------------------------------------------------------
+  def _MakeRoom(self):
+    '''
+    Waits for a pop if the Overflow is BLOCK, else see
+    CDoubleLinkedList._MakeRoom.  The lock is held.
+    '''
+    if self._Overflow != DLinkOverflow.BLOCK:
+      return CDoubleLinkedList._MakeRoom(self)
+
+    while self._Cnt >= self._MaxCount:
+      self._NotFull.wait()
+    return True
+
+    #------------------------------------------------------
+  def _Popped(self, Count):
+    '''
+    Is called with the lock held after Count nodes were popped.
+    Wakes up that many threads waiting to push on a full list.
+    '''
+    if self._MaxCount is not None:
+      self._NotFull.notify(Count)
+
+    #------------------------------------------------------
+  def _Pushed(self, Count):
+    '''
+    Is called with the lock held after Count nodes were pushed.
+    Wakes up that many threads waiting in Pop.
+    '''
+    self._NotEmpty.notify(Count)
+
+
+  #======================================================
+class CAsyncDoubleLinkedList(CLockedDoubleLinkedList):
+  '''
+  Is a CLockedDoubleLinkedList where Pop is a coroutine.  Nodes can
+  be pushed from any thread, or from the event loop, and the
+  coroutines waiting in Pop are woken up on their own loop.
+
+    DList = CAsyncDoubleLinkedList(Type, NodeClass = CNode, MaxCount = None,
+                                   Overflow = DLinkOverflow.DROPOLDEST,
+                                   KeyFunc = None)
+      See CDoubleLinkedList.  A BLOCK push waits in the thread
+      that pushes, so do not push on a full BLOCK list from the
+      event loop.
+
+    Node = await DList.Pop(Timeout = None)
+  '''
+
+  def __init__(self, Type, NodeClass = CNode, MaxCount = None,
+               Overflow = DLinkOverflow.DROPOLDEST, KeyFunc = None):
+    CLockedDoubleLinkedList.__init__(self, Type, NodeClass, MaxCount, Overflow, KeyFunc)
+    self._Waiters = deque()
+
+    #------------------------------------------------------
+  async def Pop(self, Timeout = None):  # pylint: disable=invalid-overridden-method,arguments-differ
+    '''
+    Pops the first item off the list.  If the list is empty it
+    waits, without blocking the event loop, for a node to be
+    pushed.
+
+      Node = await Pop(Timeout = None)
+        Node
+          Is the node, else None if the list is still empty
+          when the wait is over.
+        Timeout
+          Is the most seconds to wait.  None waits forever.
+    '''
+    Loop = asyncio.get_running_loop()
+    EndTime = None if Timeout is None else Loop.time() + Timeout
+
+    while True:
+      with self._Lock:
+        Node = self.PopTop()
+        if Node is not None:
+          return Node
+        Remaining = None if EndTime is None else EndTime - Loop.time()
+        if Remaining is not None and Remaining <= 0:
+          return None
+        Waiter = (Loop, Loop.create_future())
+        self._Waiters.append(Waiter)
+
+      try:
+        await asyncio.wait_for(Waiter[1], Remaining)
+      except asyncio.TimeoutError:
+        self._DropWaiter(Waiter)
+      except asyncio.CancelledError:
+        self._DropWaiter(Waiter)
+        raise
+
+    #------------------------------------------------------
+  def _DropWaiter(self, Waiter):
+    '''
+    Removes a waiter that gave up.  If it was already woken up
+    the wake up is passed on to the next waiter.
+    '''
+    with self._Lock:
+      try:
+        self._Waiters.remove(Waiter)
+      except ValueError:
+        if self._Cnt:
+          self._WakeWaiters(1)
+
+    #------------------------------------------------------
+  def _Pushed(self, Count):
+    CLockedDoubleLinkedList._Pushed(self, Count)
+    self._WakeWaiters(Count)
+
+    #------------------------------------------------------
+  def _WakeWaiters(self, Count):
+    while Count and self._Waiters:
+      Loop, Future = self._Waiters.popleft()
+      try:
+        Loop.call_soon_threadsafe(_WakeWaiter, Future)
+      except RuntimeError:
+        continue  # The loop is closed, nobody is waiting anymore.
+      Count -= 1
+
+
+  #--------------------------------------------------------------------------
+def _WakeWaiter(Future):
+  if not Future.done():
+    Future.set_result(None)
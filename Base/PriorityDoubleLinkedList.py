@@ -0,0 +1,309 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  A CDoubleLinkedList that keeps its nodes ordered by a priority.  A skip
+  list finds where a new node goes, so a push is O(log n) instead of a
+  linear search.
+
+  For further details see the help file for this module.
+-----------------------------------------------------------------------------
+Required Libraries:
+
+  From Python
+    itertools
+    random
+
+  From Libs
+    Libs.Base.DoubleLinkedList
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import itertools
+import random
+
+from .DoubleLinkedList import (DLinkType, DLinkOverflow, CDoubleLinkedList, CNode)
+
+_MAXLEVEL = 32
+_LEVELCHANCE = 0.25
+
+
+  #======================================================
+class _CSkipTower:
+  '''
+  Is the entry for one node in the skip list.  Key is the
+  (Priority, Sequence) of the node and Next has the next
+  tower for each level this tower is in.
+  '''
+  __slots__ = ('Key', 'Node', 'Next')
+
+  def __init__(self, Key, Node, Levels):
+    self.Key = Key
+    self.Node = Node
+    self.Next = [None] * Levels
+
+
+  #======================================================
+class CPriorityDoubleLinkedList(CDoubleLinkedList):
+  '''
+  Is a CDoubleLinkedList that keeps its nodes ordered by priority.
+  The node with the lowest priority value is on top, so Pop always
+  gets it.  Nodes with the same priority are ordered by the Type:
+  FIFO pops them in the order they were pushed, LIFO pops the last
+  one pushed first.
+
+  Push, PushNode, PushMany and PushManyNodes put each node where its
+  priority belongs in O(log n).  PushTop, PushBottom, PushBeforeNode
+  and MoveToTop would break the order and raise AttributeError.  All
+  the pop methods, IsNode, the key methods and iteration work as
+  they do on CDoubleLinkedList.
+
+    DList = CPriorityDoubleLinkedList(Type, PriorityFunc, NodeClass = CNode,
+                                      MaxCount = None,
+                                      Overflow = DLinkOverflow.DROPOLDEST,
+                                      KeyFunc = None)
+      PriorityFunc
+        Is a function called with the UserData of a node that
+        returns its priority.  Priorities must be comparable to
+        each other and must not change while the node is in the
+        list.
+      See CDoubleLinkedList for the rest.  When the list is full
+      DROPOLDEST drops the bottom node, that is the one that would
+      be popped last.
+
+  Exceptions:
+    AttributeError
+      If PriorityFunc is not callable.
+      See CDoubleLinkedList.
+  '''
+
+  def __init__(self, Type, PriorityFunc, NodeClass = CNode, MaxCount = None,
+               Overflow = DLinkOverflow.DROPOLDEST, KeyFunc = None):
+    CDoubleLinkedList.__init__(self, Type, NodeClass, MaxCount, Overflow, KeyFunc)
+
+    if not callable(PriorityFunc):
+      raise AttributeError(f'PriorityFunc must be callable: {type(PriorityFunc)}')
+    self._PriorityFunc = PriorityFunc
+    self._Sequence = itertools.count(1)
+    self._SeqSign = 1 if Type == DLinkType.FIFO else -1
+    self._Head = _CSkipTower(None, None, _MAXLEVEL)
+    self._Levels = 1
+    self._Towers = {}
+
+    #------------------------------------------------------
+  def MoveToTop(self, Key):
+    raise AttributeError('MoveToTop is not supported by a priority list')
+
+    #------------------------------------------------------
+  def PopBottom(self):
+    Node = CDoubleLinkedList.PopBottom(self)
+    if Node is not None:
+      self._RemoveTower(Node)
+    return Node
+
+    #------------------------------------------------------
+  def PopMany(self, Count):
+    Nodes = CDoubleLinkedList.PopMany(self, Count)
+    for Node in Nodes:
+      self._RemoveTower(Node)
+    return Nodes
+
+    #------------------------------------------------------
+  def PopNode(self, Node):
+    Node = CDoubleLinkedList.PopNode(self, Node)
+    if Node is not None:
+      self._RemoveTower(Node)
+    return Node
+
+    #------------------------------------------------------
+  def PopTop(self):
+    Node = CDoubleLinkedList.PopTop(self)
+    if Node is not None:
+      self._RemoveTower(Node)
+    return Node
+
+    #------------------------------------------------------
+  @property
+  def PriorityFunc(self):
+    '''
+    Property: is the priority function of the list
+    '''
+    return self._PriorityFunc
+
+    #------------------------------------------------------
+  def Push(self, UserData):
+    '''
+    Push's a node in priority order.  It will create the node
+    for you and assign the passed in user data to that node.
+
+      Node = Push(UserData)
+        Node
+          Is the new node, else None if the list is full and
+          the node was dropped.
+    '''
+    return self.PushNode(self._NodeClass(UserData))
+
+    #------------------------------------------------------
+  def PushBeforeNode(self, BeforeNode, Node):
+    raise AttributeError('PushBeforeNode is not supported by a priority list, use PushNode')
+
+    #------------------------------------------------------
+  def PushBottomNode(self, NewNode):
+    raise AttributeError('PushBottomNode is not supported by a priority list, use PushNode')
+
+    #------------------------------------------------------
+  def PushManyNodes(self, NewNodes):
+    '''
+    Push's each node in priority order.
+
+      Count = PushManyNodes(NewNodes)
+        Count
+          Is the number of nodes pushed, not counting nodes
+          dropped by DROPNEWEST.
+    '''
+    Count = 0
+    for Node in NewNodes:
+      if self.PushNode(Node):
+        Count += 1
+    return Count
+
+    #------------------------------------------------------
+  def PushNode(self, NewNode):
+    '''
+    Push's a node in priority order.  Finding the place is
+    O(log n).
+
+      Node = PushNode(NewNode)
+        Node
+          Is NewNode, else None if the list is full and the
+          node was dropped.
+    '''
+    Key = (self._PriorityFunc(NewNode.UserData), self._SeqSign * next(self._Sequence))
+    if self._Index is not None:
+      self._CheckKey(NewNode)
+    if self._MaxCount is not None and self._Cnt >= self._MaxCount and not self._MakeRoom():
+      return None
+
+    Update = self._FindBefore(Key)
+    NextTower = Update[0].Next[0]
+    if NextTower is None:
+      CDoubleLinkedList.PushBottomNode(self, NewNode)
+    else:
+      CDoubleLinkedList.PushBeforeNode(self, NextTower.Node, NewNode)
+
+    Levels = 1
+    while Levels < _MAXLEVEL and random.random() < _LEVELCHANCE:
+      Levels += 1
+    if Levels > self._Levels:
+      Update.extend([self._Head] * (Levels - self._Levels))
+      self._Levels = Levels
+
+    Tower = _CSkipTower(Key, NewNode, Levels)
+    for Level in range(Levels):
+      Tower.Next[Level] = Update[Level].Next[Level]
+      Update[Level].Next[Level] = Tower
+    self._Towers[NewNode] = Tower
+
+    return NewNode
+
+    #------------------------------------------------------
+  def PushTopNode(self, NewNode):
+    raise AttributeError('PushTopNode is not supported by a priority list, use PushNode')
+
+    #------------------------------------------------------
+  def Splice(self, OtherList):
+    '''
+    Moves all the nodes from OtherList into this list, each one
+    is pushed in priority order so this is O(n log n) and not
+    O(1) like CDoubleLinkedList.Splice.
+
+      Count = Splice(OtherList)
+        Count
+          Is the number of nodes moved, not counting nodes
+          dropped by DROPNEWEST.
+
+    The exceptions are those of CDoubleLinkedList.Splice, they are
+    raised before any node is moved.
+    '''
+    if not isinstance(OtherList, CDoubleLinkedList):
+      raise AttributeError(f'OtherList must be a CDoubleLinkedList: {type(OtherList)}')
+    if OtherList is self:
+      raise AttributeError('Can not splice a list into itself')
+
+    self._SpliceCheck(OtherList)
+    return self.PushManyNodes(OtherList.PopMany(OtherList.Count))
+
+    #------------------------------------------------------
+  def _FindBefore(self, Key):
+    '''
+    Returns, for each level in use, the last tower with a key
+    less than Key.  The head tower stands in where there is none.
+    '''
+    Update = [None] * self._Levels
+    Tower = self._Head
+    for Level in range(self._Levels - 1, -1, -1):
+      NextTower = Tower.Next[Level]
+      while NextTower is not None and NextTower.Key < Key:
+        Tower = NextTower
+        NextTower = Tower.Next[Level]
+      Update[Level] = Tower
+    return Update
+
+    #------------------------------------------------------
+  def _MakeRoom(self):
+    '''
+    DROPOLDEST drops the bottom node, the rest is the same as
+    CDoubleLinkedList._MakeRoom.
+    '''
+    if self._Overflow != DLinkOverflow.DROPOLDEST:
+      return CDoubleLinkedList._MakeRoom(self)
+
+    self.PopBottom()
+    self._Dropped += 1
+    return True
+
+    #------------------------------------------------------
+  def _RemoveTower(self, Node):
+    Tower = self._Towers.pop(Node, None)
+    if Tower is None:
+      return
+
+    if self._Head.Next[0] is Tower:
+      Update = [self._Head] * len(Tower.Next)
+    else:
+      Update = self._FindBefore(Tower.Key)
+    for Level, NextTower in enumerate(Tower.Next):
+      Update[Level].Next[Level] = NextTower
+
+    while self._Levels > 1 and self._Head.Next[self._Levels - 1] is None:
+      self._Levels -= 1
+
+    #------------------------------------------------------
+  def _Reset(self):
+    CDoubleLinkedList._Reset(self)
+    self._Head = _CSkipTower(None, None, _MAXLEVEL)
+    self._Levels = 1
+    self._Towers = {}
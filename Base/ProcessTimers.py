@@ -0,0 +1,249 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Collects the TimerRegistry of the worker processes of a multiprocessing
+  Pool or a ProcessPoolExecutor.  Each worker sends its timers to the
+  parent through a pipe, the parent merges them into one registry and
+  keeps one registry per worker.
+
+  For further details see the help file for this module.
+-----------------------------------------------------------------------------
+Required Libraries:
+
+  From Python
+    functools
+    multiprocessing
+    os
+    threading
+    time
+
+  From Libs
+    Libs.Base.TimerStats
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+    The worker ships its timers before its queue is closed on exit.
+-----------------------------------------------------------------------------
+'''
+
+import functools
+import multiprocessing
+import multiprocessing.util
+import os
+import threading
+import time
+
+from .TimerStats import (CTimerRegistry, QUANTILES, TimerRegistry)
+
+  # Is set in a worker by _InitWorker, they are None in every other process.
+_Queue = None
+_Interval = None
+_LastShip = 0.0
+
+
+  #======================================================
+class CProcessTimers(object):
+  '''
+  Collects the TimerRegistry of worker processes.  Pass PoolArgs to
+  the pool, the workers add to their TimerRegistry as usual, with a
+  CRegistryCaptureTimer, CFastTimer or Timed, and send it when they
+  exit.  A thread of this class merges what they send.
+
+    Timers = CProcessTimers(Registry = None, Interval = 1.0, Context = None)
+      Registry
+        Is the CTimerRegistry the timers of all the workers are
+        merged into, None makes a new one.  Pass TimerRegistry to
+        merge them with the timers of this process.
+      Interval
+        Is the least seconds between two sends of ShipsTimers.
+      Context
+        Is the multiprocessing context of the pool, None is the
+        default one.
+
+    with Timers:
+      with ProcessPoolExecutor(4, **Timers.PoolArgs()) as Pool:
+        ...
+    print(Timers.ReportString())
+
+  The pool must be shut down, so the workers exit and send their
+  timers, before Close.
+  '''
+
+  def __init__(self, Registry = None, Interval = 1.0, Context = None):
+    object.__init__(self)
+
+    self.Registry = Registry if Registry is not None else CTimerRegistry()
+    self._Interval = Interval
+    Context = Context if Context is not None else multiprocessing.get_context()
+    self._Queue = Context.Queue()
+    self._Lock = threading.Lock()
+    self._Workers = {}
+    self._Thread = threading.Thread(target = self._Run, name = 'ProcessTimers', daemon = True)
+    self._Thread.start()
+
+    #------------------------------------------------------
+  def __enter__(self):
+    return self
+
+    #------------------------------------------------------
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self.Close()
+
+    #------------------------------------------------------
+  def Close(self, Timeout = None):
+    '''
+    Merges what the workers sent and stops the thread.  Everything a
+    worker sent before Close is merged.
+
+      Closed = Close(Timeout = None)
+        Closed
+          Is False if the thread did not stop within Timeout seconds.
+    '''
+    if self._Thread.is_alive():
+      self._Queue.put(None)
+      self._Thread.join(Timeout)
+    return not self._Thread.is_alive()
+
+    #------------------------------------------------------
+  def PoolArgs(self, Initializer = None, InitArgs = ()):
+    '''
+    Gets the initializer and initargs for the pool.
+
+      Args = PoolArgs(Initializer = None, InitArgs = ())
+        Args
+          Is a dict with initializer and initargs, pass it to
+          multiprocessing.Pool or ProcessPoolExecutor with **.
+        Initializer, InitArgs
+          Is your own initializer, it is called in each worker
+          after the timers are set up.
+    '''
+    return {'initializer': _InitWorker,
+            'initargs': (self._Queue, self._Interval, Initializer, InitArgs)}
+
+    #------------------------------------------------------
+  def ReportString(self, Quantiles = QUANTILES):
+    '''
+    Is Registry.ReportString, the timers of all the workers.
+    '''
+    return self.Registry.ReportString(Quantiles)
+
+    #------------------------------------------------------
+  def WorkerReportString(self, Quantiles = QUANTILES):
+    '''
+    Formats the timers of each worker as a table, one line per timer
+    and worker.  The lines of a timer are together, the name of each
+    is the timer name and the worker, 'Name [Worker]'.
+
+      String = WorkerReportString(Quantiles = QUANTILES)
+    '''
+    Registry = CTimerRegistry()
+    for Worker, WorkerRegistry in self.Workers.items():
+      Copy = CTimerRegistry()
+      Copy.Merge(WorkerRegistry)
+      Registry.Merge({f'{Name} [{Worker}]': Stats for Name, Stats in Copy.Take().items()})
+    return Registry.ReportString(Quantiles)
+
+    #------------------------------------------------------
+  @property
+  def Workers(self):
+    '''
+    Property: is a dict of worker, its process id, to the
+    CTimerRegistry of that worker
+    '''
+    with self._Lock:
+      return dict(self._Workers)
+
+    #------------------------------------------------------
+  def _Run(self):
+    while True:
+      Message = self._Queue.get()
+      if Message is None:
+        return
+
+      Worker, Timers = Message
+      with self._Lock:
+        WorkerRegistry = self._Workers.get(Worker)
+        if WorkerRegistry is None:
+          WorkerRegistry = self._Workers[Worker] = CTimerRegistry()
+      WorkerRegistry.Merge(Timers)
+      self.Registry.Merge(Timers)
+
+
+  #--------------------------------------------------------------------------
+def ShipTimers():
+  '''
+  Sends the TimerRegistry of this worker to the parent and resets it.
+  A worker calls this when it exits, call it yourself if the pool may
+  be terminated, multiprocessing.Pool.__exit__ terminates the workers.
+  Outside a worker it does nothing.
+
+    Sent = ShipTimers()
+      Sent
+        Is True if this is a worker.
+  '''
+  global _LastShip  # pylint: disable=global-statement
+
+  if _Queue is None:
+    return False
+
+  _LastShip = time.monotonic()
+  Timers = TimerRegistry.Take()
+  if Timers:
+    _Queue.put((os.getpid(), Timers))
+  return True
+
+
+  #--------------------------------------------------------------------------
+def ShipsTimers(Function):
+  '''
+  Is a decorator for the function the pool runs.  After each call the
+  worker sends its timers, if Interval seconds went by since the last
+  send, so the timers get to the parent even if the pool is
+  terminated.
+  '''
+  @functools.wraps(Function)
+  def Wrapper(*args, **kwargs):
+    try:
+      return Function(*args, **kwargs)
+    finally:
+      if _Queue is not None and time.monotonic() - _LastShip >= _Interval:
+        ShipTimers()
+  return Wrapper
+
+
+  #--------------------------------------------------------------------------
+def _InitWorker(Queue, Interval, Initializer, InitArgs):
+  global _Queue, _Interval, _LastShip  # pylint: disable=global-statement
+
+    # A forked worker has a copy of the timers of the parent.
+  TimerRegistry.Reset()
+  _Queue = Queue
+  _Interval = Interval
+  _LastShip = time.monotonic()
+    # Must run before the queue closes, its finalizer has exitpriority 10
+    # and is made when ShipsTimers first puts, after this one, so with the
+    # same priority it would run first and the last put would be lost.
+  multiprocessing.util.Finalize(None, ShipTimers, exitpriority = 20)
+  if Initializer is not None:
+    Initializer(*InitArgs)
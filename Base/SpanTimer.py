@@ -0,0 +1,232 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Nested timers.  A CSpanTimer knows the CSpanTimer it runs inside of, so
+  the time of each block is split into the time of its children and its
+  own time, and all of it is kept as a call tree.
+
+  For further details see the help file for this module.
+-----------------------------------------------------------------------------
+Required Libraries:
+
+  From Python
+    collections
+    contextvars
+    threading
+
+  From Libs
+    Libs.Base.CodeTimer
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import threading
+from collections import namedtuple
+from contextvars import ContextVar
+
+from .CodeTimer import CCodeTimer
+
+  # Is the CSpanTimer running in the current thread or asyncio task.
+_CurrentSpan = ContextVar('CurrentSpan', default = None)
+
+  # Is one line of CSpanTree.Report.  Path is the tuple of span names from
+  # the root to this span, Depth is len(Path) - 1.  Total is the time of
+  # the span and SelfTime is Total less the time of its children.  Times
+  # are in milliseconds.
+_SpanReportDef = namedtuple('SpanReport', ['Path', 'Depth', 'Name', 'Count', 'Total',
+                                           'SelfTime'])
+
+
+  #======================================================
+class CSpanTree(object):
+  '''
+  Adds up the spans by their path, the names of the spans from the
+  root down to the span.  The same block called from two parents is
+  two entries in the tree.  It is thread safe.  Use the module
+  variable SpanTree, the one for the process, unless you need a
+  tree of your own.
+
+    Tree = CSpanTree()
+  '''
+
+  def __init__(self):
+    object.__init__(self)
+    self._Lock = threading.Lock()
+    self._Spans = {}
+
+    #------------------------------------------------------
+  def Add(self, Path, Took, SelfTime):
+    '''
+    Adds one span.  CSpanTimer calls this for you.
+
+      Add(Path, Took, SelfTime)
+        Path
+          Is the tuple of span names from the root.
+        Took, SelfTime
+          Are the total and self time of the span in milliseconds.
+    '''
+    with self._Lock:
+      Span = self._Spans.get(Path)
+      if Span is None:
+        self._Spans[Path] = [1, Took, SelfTime]
+      else:
+        Span[0] += 1
+        Span[1] += Took
+        Span[2] += SelfTime
+
+    #------------------------------------------------------
+  def Report(self):
+    '''
+    Gets a line for each path in tree order.  The children of a span
+    follow it, the child with the most total time first.
+
+      Lines = Report()
+        Lines
+          list of _SpanReportDef
+    '''
+    with self._Lock:
+      Spans = {Path: tuple(Span) for Path, Span in self._Spans.items()}
+
+    Children = {}
+    for Path in Spans:
+      Children.setdefault(Path[:-1], []).append(Path)
+    for Paths in Children.values():
+      Paths.sort(key = lambda Path: -Spans[Path][1])
+
+    Lines = []
+    Stack = list(reversed(Children.get((), [])))
+    while Stack:
+      Path = Stack.pop()
+      Count, Total, SelfTime = Spans[Path]
+      Lines.append(_SpanReportDef(Path, len(Path) - 1, Path[-1], Count, Total, SelfTime))
+      Stack.extend(reversed(Children.get(Path, [])))
+    return Lines
+
+    #------------------------------------------------------
+  def ReportString(self):
+    '''
+    Formats Report as an indented call tree with the total and self
+    time in milliseconds and the percent of the parent's time.
+
+      String = ReportString()
+    '''
+    Lines = self.Report()
+    Totals = {Line.Path: Line.Total for Line in Lines}
+    Width = max([len(Line.Name) + 2 * Line.Depth for Line in Lines] + [4])
+    Output = [f'{"Span":<{Width}} {"Count":>10} {"Total":>12} {"Self":>12} {"Parent%":>8}']
+    for Line in Lines:
+      ParentTotal = Totals.get(Line.Path[:-1])
+      Percent = f'{Line.Total / ParentTotal * 100:7.1f}%' if ParentTotal else f'{"":>8}'
+      Output.append(f'{"  " * Line.Depth + Line.Name:<{Width}} {Line.Count:>10} '
+                    f'{Line.Total:12.4f} {Line.SelfTime:12.4f} {Percent}')
+    return '\n'.join(Output)
+
+    #------------------------------------------------------
+  def Reset(self):
+    '''
+    Forgets all the spans.
+    '''
+    with self._Lock:
+      self._Spans.clear()
+
+
+  #======================================================
+class CSpanTimer(CCodeTimer):
+  '''
+  Is a CCodeTimer that knows its parent, the CSpanTimer whose 'with'
+  statement it runs inside of.  When it ends its time is added to
+  the ChildTime of the parent and the span is added to a CSpanTree.
+  Nothing is printed, if you pass a CaptureTimer its Save is still
+  called.  The parent is kept in a ContextVar, so each thread and
+  each asyncio task has its own.  A task takes the span that was
+  running when it was created as its parent.  A new thread starts
+  with no span, run it with contextvars.copy_context().run to keep
+  the parent.  It must be used with the 'with' statement.
+
+    with CSpanTimer(Name, CaptureTimer = None, Tree = None) as Span:
+      Name, CaptureTimer
+        See CCodeTimer.
+      Tree
+        Is the CSpanTree, None is SpanTree.
+
+    Parent
+      Is the parent CSpanTimer, None for a root span.
+    Path
+      Is the tuple of span names from the root to this span.
+    ChildTime
+      Is the milliseconds of the children that have ended.
+    SelfTime
+      Is Took less ChildTime, it is set when the span ends.  Children
+      that run at the same time, like asyncio tasks, can add up to
+      more than Took, SelfTime is never below 0.
+  '''
+
+  def __init__(self, Name, CaptureTimer = None, Tree = None):
+    CCodeTimer.__init__(self, Name, CaptureTimer)
+    self.Tree = Tree if Tree is not None else SpanTree
+    self.Parent = None
+    self.Path = (self.Name,)
+    self.ChildTime = 0.0
+    self.SelfTime = 0.0
+    self._Token = None
+
+    #------------------------------------------------------
+  def Save(self):
+    '''
+    Does nothing, the span goes to the tree.  Override it to also
+    save the span some other way.
+    '''
+    pass  # pylint: disable=unnecessary-pass
+
+    #------------------------------------------------------
+  def __enter__(self):
+    self.Parent = _CurrentSpan.get()
+    if self.Parent is not None:
+      self.Path = self.Parent.Path + (self.Name,)
+    self._Token = _CurrentSpan.set(self)
+    return CCodeTimer.__enter__(self)
+
+    #------------------------------------------------------
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    CCodeTimer.__exit__(self, exc_type, exc_val, exc_tb)
+    _CurrentSpan.reset(self._Token)
+    self.SelfTime = max(self._Took - self.ChildTime, 0.0)
+    if self.Parent is not None:
+      self.Parent.ChildTime += self._Took
+    self.Tree.Add(self.Path, self._Took, self.SelfTime)
+
+
+  #--------------------------------------------------------------------------
+def CurrentSpan():
+  '''
+  Gets the CSpanTimer running in this thread or asyncio task, None
+  if there is none.
+  '''
+  return _CurrentSpan.get()
+
+
+  # Is the span tree for the process.
+SpanTree = CSpanTree()
@@ -30,10 +30,18 @@ Description:
 Update History:
   Feb 21, 2021 - Donald W. Long (Donald.W.Long@gmail.com)
     Released
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Added CStringScanner, it scans a whole string by offset with str.find
+    and compiled regular expressions instead of one character at a time.
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Added GetStringBytes, SkipWhiteSpaceBytes and UnescapeBytes, they scan
+    bytes, a memoryview or an mmap between offsets and return offsets.
 -----------------------------------------------------------------------------
 '''
 
+import re
 from collections import namedtuple
+from enum import (IntEnum, unique, auto)
 
   # Is what is returned from SMS._Strings.GetString.  OutCome is the
   # outcome of the operation, True is ok False is not.  CharConsumed is
@@ -41,6 +49,37 @@ from collections import namedtuple
   # removed from the line
 _GetStringDef = namedtuple('GetString', ['OutCome', 'CharConsumed', 'String'])
 
+  # Is what CStringScanner.Tokens yields.  Offset is where the token starts.
+_TokenDef = namedtuple('Token', ['Kind', 'Value', 'Offset'])
+
+_IDENTIFIER = r'[^\W\d]\w*'
+_NUMBER = r'[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?'
+_IdentifierRE = re.compile(_IDENTIFIER)
+_NumberRE = re.compile(_NUMBER)
+
+
+def _CharClass(Chars, Negate = False):
+  '''
+  Is the regular expression of one character in Chars, or with Negate
+  one that is not.  [] is not valid, so if Chars is empty it is one
+  that never matches, or with Negate any character.
+  '''
+  if Chars:
+    return f'[{"^" if Negate else ""}{re.escape(Chars)}]'
+  return '(?s:.)' if Negate else '(?!)'
+
+  # Is what is returned from GetStringBytes.  OutCome is True if there is
+  # a closed string at Start.  Next is the offset after the closing quote,
+  # Start and End are the offsets of the string without the quotes and
+  # Escaped is True if it has a backslash, see UnescapeBytes.
+_GetStringBytesDef = namedtuple('GetStringBytes', ['OutCome', 'Next', 'Start', 'End', 'Escaped'])
+
+  # Are the compiled patterns of the bytes functions, by quote and by white
+  # space.
+_BytesStringRE = {}
+_BytesWhiteSpaceRE = {}
+_BytesEscapeRE = re.compile(rb'\\(.)', re.DOTALL)
+
 
 def GetString(Line, QuoteChars = "\"'"):
   '''
@@ -102,3 +141,272 @@ def SkipWhiteSpace(String, WhiteSpace = ' \t'):
     return next(i for i, j in enumerate(String) if j not in WhiteSpace)
   except StopIteration:
     return len(String)
+
+
+def GetStringBytes(Buffer, Start = 0, End = None, QuoteChars = b"\"'"):
+  '''
+  Finds the quoted string at Start in bytes, a memoryview or an mmap
+  without copying it.  The string is found by one compiled regular
+  expression, it handles the backslash like GetString.
+
+  _GetStringBytesDef = GetStringBytes(Buffer, Start = 0, End = None, QuoteChars = b"\"'")
+    _GetStringBytesDef = namedtuple('GetStringBytes', ['OutCome', 'Next', 'Start', 'End', 'Escaped'])
+      OutCome is True if there is a closed string at Start.  Next is the
+      offset after the closing quote.  Start and End are the offsets of
+      the string without the quotes, Buffer[Start:End] is the string if
+      Escaped is False, else use UnescapeBytes.  If OutCome is False
+      the offsets are all Start.
+    Buffer
+      Is the bytes, bytearray, memoryview of bytes or mmap to scan.
+    Start = int
+      Is the offset of the opening quote.
+    End = int
+      Is the offset the string must close before, None is the end of
+      Buffer.
+    QuoteChars = bytes
+      Is the characters that can be used for quote, any bytes-like
+      object.  If it is empty there is never a string.
+  '''
+  if End is None:
+    End = len(Buffer)
+  if End - Start < 2 or Buffer[Start] not in QuoteChars:
+    return _GetStringBytesDef(False, Start, Start, Start, False)
+
+  Quote = Buffer[Start]
+  Pattern = _BytesStringRE.get(Quote)
+  if Pattern is None:
+    Char = re.escape(bytes((Quote,)))
+    Pattern = _BytesStringRE[Quote] = re.compile(
+        rb'%s[^%s\\]*((?:\\.[^%s\\]*)*)%s' % (Char, Char, Char, Char), re.DOTALL)
+  Match = Pattern.match(Buffer, Start, End)
+  if Match is None:
+    return _GetStringBytesDef(False, Start, Start, Start, False)
+  Next = Match.end()
+  return _GetStringBytesDef(True, Next, Start + 1, Next - 1, Match.start(1) != Match.end(1))
+
+
+def SkipWhiteSpaceBytes(Buffer, Start = 0, End = None, WhiteSpace = b' \t'):
+  '''
+  Skips the white space at Start in bytes, a memoryview or an mmap.
+
+  Offset = SkipWhiteSpaceBytes(Buffer, Start = 0, End = None, WhiteSpace = b' \t')
+    Offset
+      Is the offset of the first character that is not white space,
+      End if there is none.  Offset - Start is what SkipWhiteSpace
+      returns.
+    End = int
+      Is the offset to stop at, None is the end of Buffer.
+    WhiteSpace = bytes
+      Is the characters to use for white space, any bytes-like
+      object.  If it is empty nothing is skipped.
+  '''
+  WhiteSpace = bytes(WhiteSpace)
+  Pattern = _BytesWhiteSpaceRE.get(WhiteSpace)
+  if Pattern is None:
+    Pattern = _BytesWhiteSpaceRE[WhiteSpace] = re.compile(
+        b'[%s]*' % re.escape(WhiteSpace) if WhiteSpace else b'')
+  if End is None:
+    End = len(Buffer)
+  return Pattern.match(Buffer, Start, End).end() if Start < End else Start
+
+
+def UnescapeBytes(Buffer, Start, End):
+  '''
+  Copies Buffer[Start:End] out with the backslashes removed, a
+  backslash and the character after it is that character.  Use it on
+  the Start and End of GetStringBytes when Escaped is True.
+
+  String = UnescapeBytes(Buffer, Start, End)
+    String
+      Is bytes.
+  '''
+  return _BytesEscapeRE.sub(rb'\1', bytes(Buffer[Start:End]))
+
+
+  #======================================================
+@unique
+class TokenKind(IntEnum):
+  '''
+  Is the kind of a token of CStringScanner.Tokens
+    STRING
+      A quoted string, the Value has no quotes and no escapes.
+    IDENTIFIER
+      A name, like a python identifier.
+    NUMBER
+      An int or a float.
+    PUNCTUATION
+      Any other character, one at a time.
+  '''
+  STRING = auto()
+  IDENTIFIER = auto()
+  NUMBER = auto()
+  PUNCTUATION = auto()
+
+
+  #======================================================
+class CStringScanner(object):
+  '''
+  Scans a string from an offset.  Each Get method looks at the text at
+  Offset and, if it finds what it is after, moves Offset past it.  The
+  string is never copied or built one character at a time, the methods
+  use str.find and compiled regular expressions and slice the result
+  out, so a long line is scanned in about linear time.
+
+    Scanner = CStringScanner(Text, Offset = 0)
+      Text
+        Is the string to scan.
+      Offset
+        Is where to start.  It is a plain attribute, you can move it.
+
+  GetString and SkipWhiteSpace return the same as the functions of this
+  module on Text[Offset:].
+  '''
+
+  def __init__(self, Text, Offset = 0):
+    object.__init__(self)
+    self.Text = Text
+    self.Offset = Offset
+    self._WhiteSpaceRE = {}
+    self._TokenRE = {}
+
+    #------------------------------------------------------
+  @property
+  def AtEnd(self):
+    '''
+    Property: is True if Offset is at the end of Text
+    '''
+    return self.Offset >= len(self.Text)
+
+    #------------------------------------------------------
+  def GetIdentifier(self):
+    '''
+    Gets the identifier at Offset.
+
+      Identifier = GetIdentifier()
+        Identifier
+          Is the str, None if there is no identifier at Offset.
+    '''
+    Match = _IdentifierRE.match(self.Text, self.Offset)
+    if Match is None:
+      return None
+    self.Offset = Match.end()
+    return Match.group()
+
+    #------------------------------------------------------
+  def GetNumber(self):
+    '''
+    Gets the number at Offset, it can have a sign, a fraction and an
+    exponent.
+
+      Number = GetNumber()
+        Number
+          Is an int, or a float if it has a '.' or an exponent.  None
+          if there is no number at Offset.
+    '''
+    Match = _NumberRE.match(self.Text, self.Offset)
+    if Match is None:
+      return None
+    self.Offset = Match.end()
+    Number = Match.group()
+    try:
+      return int(Number)
+    except ValueError:
+      return float(Number)
+
+    #------------------------------------------------------
+  def GetString(self, QuoteChars = "\"'"):
+    '''
+    Gets the quoted string at Offset, see GetString of this module.
+    If OutCome is True Offset is moved past the closing quote.
+
+      _GetStringDef = GetString(QuoteChars = "\"'")
+    '''
+    Text = self.Text
+    Start = self.Offset
+    TextLen = len(Text)
+    if TextLen - Start < 2 or Text[Start] not in QuoteChars:
+      return _GetStringDef(False, 0, '')
+
+    Quote = Text[Start]
+    Parts = []
+    Pos = Start + 1
+    End = -1
+    while True:
+      if End < Pos:
+        End = Text.find(Quote, Pos)
+        if End < 0:
+          return _GetStringDef(False, 0, '')
+      Escape = Text.find('\\', Pos, End)
+      if Escape < 0:
+        Parts.append(Text[Pos:End])
+        self.Offset = End + 1
+        return _GetStringDef(True, End + 1 - Start, ''.join(Parts))
+      if Escape + 1 >= TextLen:
+        return _GetStringDef(False, 0, '')
+      Parts.append(Text[Pos:Escape])
+      Parts.append(Text[Escape + 1])
+      Pos = Escape + 2
+
+    #------------------------------------------------------
+  def SkipWhiteSpace(self, WhiteSpace = ' \t'):
+    '''
+    Moves Offset past the white space at Offset, see SkipWhiteSpace of
+    this module.
+
+      consumedCharCnt = SkipWhiteSpace(WhiteSpace = ' \t')
+    '''
+    Pattern = self._WhiteSpaceRE.get(WhiteSpace)
+    if Pattern is None:
+      Pattern = self._WhiteSpaceRE[WhiteSpace] = re.compile(f'{_CharClass(WhiteSpace)}*')
+    Start = self.Offset
+    self.Offset = Pattern.match(self.Text, Start).end()
+    return self.Offset - Start
+
+    #------------------------------------------------------
+  def Tokens(self, QuoteChars = "\"'", WhiteSpace = ' \t\r\n'):
+    '''
+    Is a generator of the tokens from Offset to the end, white space
+    is skipped.  A '+' or '-' is a NUMBER token with the number after
+    it if there is one, else PUNCTUATION.
+
+      for Kind, Value, Offset in Tokens(QuoteChars = "\"'", WhiteSpace = ' \t\r\n'):
+
+    Exceptions:
+      ValueError
+        If a string is not closed.
+    '''
+    Key = (QuoteChars, WhiteSpace)
+    Pattern = self._TokenRE.get(Key)
+    if Pattern is None:
+      Pattern = self._TokenRE[Key] = re.compile(
+          f'{_CharClass(WhiteSpace)}*(?:(?P<I>{_IDENTIFIER})|(?P<N>{_NUMBER})|'
+          f'(?P<Q>{_CharClass(QuoteChars)})|(?P<P>{_CharClass(WhiteSpace, True)}))')
+    Match = Pattern.match
+    Text = self.Text
+
+    while True:
+      Token = Match(Text, self.Offset)
+      if Token is None:
+        self.Offset = len(Text)
+        return
+
+      Kind = Token.lastgroup
+      Start = Token.start(Kind)
+      self.Offset = Token.end()
+      if Kind == 'I':
+        yield _TokenDef(TokenKind.IDENTIFIER, Token.group(Kind), Start)
+      elif Kind == 'N':
+        Number = Token.group(Kind)
+        try:
+          Number = int(Number)
+        except ValueError:
+          Number = float(Number)
+        yield _TokenDef(TokenKind.NUMBER, Number, Start)
+      elif Kind == 'Q':
+        self.Offset = Start
+        Result = self.GetString(QuoteChars)
+        if not Result.OutCome:
+          raise ValueError(f'String is not closed at offset {Start}')
+        yield _TokenDef(TokenKind.STRING, Result.String, Start)
+      else:
+        yield _TokenDef(TokenKind.PUNCTUATION, Token.group(Kind), Start)
@@ -0,0 +1,332 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  A sink for timer samples that writes them on a background thread, in
+  batches, to a CSV, JSON lines or SQLite file.  The timed code only puts
+  the sample on a queue, so it does not wait on the file or database.
+
+  For further details see the help file for this module.
+-----------------------------------------------------------------------------
+Required Libraries:
+
+  From Python
+    atexit
+    csv
+    json
+    os
+    sqlite3
+    threading
+    time
+
+  From Libs
+    Libs.Base.CodeTimer
+    Libs.Base.DoubleLinkedList
+    Libs.Base.LockedDoubleLinkedList
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+    CSinkCaptureTimer overrides Capture, so it can be shared by threads.
+-----------------------------------------------------------------------------
+'''
+
+import atexit
+import csv
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from .CodeTimer import CCaptureTimer
+from .DoubleLinkedList import (DLinkType, DLinkOverflow, CSlotNode)
+from .LockedDoubleLinkedList import CLockedDoubleLinkedList
+
+  # Are the fields of each sample, in the order they are written.  Time
+  # is time.time() when the sample was added, the rest are from the timer.
+SINKFIELDS = ('Time', 'Name', 'Start', 'End', 'Took')
+
+
+  #======================================================
+class CCSVSinkWriter(object):
+  '''
+  Writes the samples to a CSV file with a header line.  If the file
+  already has data the samples are appended.
+
+    Writer = CCSVSinkWriter(FileName)
+  '''
+
+  def __init__(self, FileName):
+    object.__init__(self)
+    NewFile = not os.path.exists(FileName) or not os.path.getsize(FileName)
+    self._File = open(FileName, 'a', newline = '', encoding = 'utf-8')  # pylint: disable=consider-using-with
+    self._Writer = csv.writer(self._File)
+    if NewFile:
+      self._Writer.writerow(SINKFIELDS)
+
+    #------------------------------------------------------
+  def Close(self):
+    self._File.close()
+
+    #------------------------------------------------------
+  def Write(self, Samples):
+    self._Writer.writerows(Samples)
+    self._File.flush()
+
+
+  #======================================================
+class CJSONLinesSinkWriter(object):
+  '''
+  Writes the samples to a file with one JSON object per line.  If the
+  file already has data the samples are appended.
+
+    Writer = CJSONLinesSinkWriter(FileName)
+  '''
+
+  def __init__(self, FileName):
+    object.__init__(self)
+    self._File = open(FileName, 'a', encoding = 'utf-8')  # pylint: disable=consider-using-with
+
+    #------------------------------------------------------
+  def Close(self):
+    self._File.close()
+
+    #------------------------------------------------------
+  def Write(self, Samples):
+    self._File.write(''.join(json.dumps(dict(zip(SINKFIELDS, Sample))) + '\n'
+                             for Sample in Samples))
+    self._File.flush()
+
+
+  #======================================================
+class CSQLiteSinkWriter(object):
+  '''
+  Writes the samples to a table of a SQLite database, one commit per
+  batch.  The table is created if it does not exist.  The connection
+  is made on the first Write, so it belongs to the sink's thread.
+
+    Writer = CSQLiteSinkWriter(FileName, Table = 'Timers')
+  '''
+
+  def __init__(self, FileName, Table = 'Timers'):
+    object.__init__(self)
+    if not Table.isidentifier():
+      raise AttributeError(f'Table must be an identifier: {Table}')
+    self._FileName = FileName
+    self._Table = Table
+    self._Connection = None
+
+    #------------------------------------------------------
+  def Close(self):
+    if self._Connection is not None:
+      self._Connection.close()
+      self._Connection = None
+
+    #------------------------------------------------------
+  def Write(self, Samples):
+    if self._Connection is None:
+      self._Connection = sqlite3.connect(self._FileName)
+      self._Connection.execute(f'CREATE TABLE IF NOT EXISTS {self._Table} '
+                               '(Time REAL, Name TEXT, Start REAL, End REAL, Took REAL)')
+    with self._Connection:
+      self._Connection.executemany(f'INSERT INTO {self._Table} VALUES (?, ?, ?, ?, ?)', Samples)
+
+
+  #======================================================
+class CTimerSink(object):
+  '''
+  Queues timer samples and writes them with Writer on a background
+  thread.  The thread wakes up when BatchSize samples are waiting or
+  every FlushInterval seconds, and writes everything that is queued.
+  The queue is a CLockedDoubleLinkedList with MaxCount MaxQueue, so
+  when the writer can not keep up the Overflow policy applies: BLOCK
+  makes Add wait, which is the back pressure, DROPNEWEST and
+  DROPOLDEST drop samples and count them in Dropped.  The sink is
+  closed, and all the samples written, when the interpreter exits.
+
+    Sink = CTimerSink(Writer, MaxQueue = 10000, BatchSize = 500,
+                      FlushInterval = 1.0, Overflow = DLinkOverflow.BLOCK)
+      Writer
+        Is an object with Write(Samples) and Close().  Samples is a
+        list of tuples with the fields in SINKFIELDS.  See
+        CCSVSinkWriter, CJSONLinesSinkWriter and CSQLiteSinkWriter.
+      MaxQueue
+        Is the most samples that can wait to be written.
+      BatchSize
+        Is how many waiting samples wake up the thread, and the most
+        given to one Write.
+      FlushInterval
+        Is the most seconds a sample waits before it is written.
+
+    Written
+      Is the number of samples written.
+    Errors
+      Is the number of batches Writer raised on.  They are lost.
+
+  Exceptions:
+    AttributeError
+      If BatchSize is not above 0 or MaxQueue is less than BatchSize.
+      If a sample is added after Close.
+  '''
+
+  def __init__(self, Writer, MaxQueue = 10000, BatchSize = 500, FlushInterval = 1.0,
+               Overflow = DLinkOverflow.BLOCK):
+    object.__init__(self)
+
+    if not BatchSize > 0 or MaxQueue < BatchSize:
+      raise AttributeError(f'BatchSize must be above 0 and not more than MaxQueue: '
+                           f'{BatchSize}, {MaxQueue}')
+    self._Writer = Writer
+    self._BatchSize = BatchSize
+    self._FlushInterval = FlushInterval
+    self._Queue = CLockedDoubleLinkedList(DLinkType.FIFO, CSlotNode, MaxQueue, Overflow)
+    self._Wake = threading.Condition()
+    self._Stop = False
+    self._Closed = False
+    self._FlushWanted = False
+    self._Started = 0
+    self._Finished = 0
+    self.Written = 0
+    self.Errors = 0
+
+    self._Thread = threading.Thread(target = self._Run, name = 'TimerSink', daemon = True)
+    self._Thread.start()
+    atexit.register(self.Close)
+
+    #------------------------------------------------------
+  def Add(self, Name, Start, End, Took):
+    '''
+    Queues one sample.  This is all the timed code waits for, unless
+    the queue is full and the Overflow is BLOCK.
+
+      Add(Name, Start, End, Took)
+    '''
+    if self._Closed:
+      raise AttributeError('The sink is closed')
+    self._Queue.Push((time.time(), Name, Start, End, Took))
+    if self._Queue.Count >= self._BatchSize:
+      with self._Wake:
+        self._Wake.notify()
+
+    #------------------------------------------------------
+  def Close(self, Timeout = None):
+    '''
+    Writes all the queued samples, stops the thread and closes the
+    Writer.  It does nothing if the sink is already closed.
+    '''
+    with self._Wake:
+      if self._Closed:
+        return
+      self._Closed = self._Stop = True
+      self._Wake.notify()
+    self._Thread.join(Timeout)
+    atexit.unregister(self.Close)
+
+    #------------------------------------------------------
+  @property
+  def Count(self):
+    '''
+    Property: is the number of samples waiting to be written
+    '''
+    return self._Queue.Count
+
+    #------------------------------------------------------
+  @property
+  def Dropped(self):
+    '''
+    Property: is the number of samples dropped because the queue
+    was full
+    '''
+    return self._Queue.Dropped
+
+    #------------------------------------------------------
+  def Flush(self, Timeout = None):
+    '''
+    Waits until every sample added before the call is written.
+
+      Done = Flush(Timeout = None)
+        Done
+          False if Timeout seconds passed first.
+    '''
+    with self._Wake:
+      if self._Closed:
+        return True
+      Target = self._Started + 1
+      self._FlushWanted = True
+      self._Wake.notify()
+      return self._Wake.wait_for(lambda: self._Finished >= Target, Timeout)
+
+    #------------------------------------------------------
+  def _Run(self):
+    '''
+    Is the background thread.
+    '''
+    while True:
+      with self._Wake:
+        if not (self._Stop or self._FlushWanted or self._Queue.Count >= self._BatchSize):
+          self._Wake.wait(self._FlushInterval)
+        self._FlushWanted = False
+        self._Started += 1
+        Cycle = self._Started
+        Stop = self._Stop
+
+      while True:
+        Nodes = self._Queue.PopMany(self._BatchSize)
+        if not Nodes:
+          break
+        try:
+          self._Writer.Write([Node.UserData for Node in Nodes])
+          self.Written += len(Nodes)
+        except Exception:  # pylint: disable=broad-except
+          self.Errors += 1
+
+      with self._Wake:
+        self._Finished = Cycle
+        self._Wake.notify_all()
+      if Stop:
+        break
+
+    self._Writer.Close()
+
+
+  #======================================================
+class CSinkCaptureTimer(CCaptureTimer):
+  '''
+  Is a CCaptureTimer that adds the sample to a CTimerSink.  Pass it to
+  CCodeTimer.  It overrides Capture and does not store the data, so
+  one instance can be used by timers in many threads.
+
+    CaptureTimer = CSinkCaptureTimer(Sink)
+  '''
+
+  def __init__(self, Sink):
+    CCaptureTimer.__init__(self)
+    self.Sink = Sink
+
+    #------------------------------------------------------
+  def Capture(self, Name, Start, End, Took, Resources):
+    self.Sink.Add(Name, Start, End, Took)
+
+    #------------------------------------------------------
+  def Save(self):
+    self.Sink.Add(self.Name, self.Start, self.End, self.Took)
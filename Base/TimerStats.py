@@ -0,0 +1,527 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  A process wide registry that aggregates the times of CCodeTimer by Name.
+  Each name keeps count, total, min, max, mean and a log bucket histogram
+  for the quantiles, so memory does not grow with the number of samples.
+
+  For further details see the help file for this module.
+-----------------------------------------------------------------------------
+Required Libraries:
+
+  From Python
+    collections
+    math
+    threading
+
+  From Libs
+    Libs.Base.CodeTimer
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+    Added the CPU, memory and GC totals of timers that capture Resources.
+    Added CTimerRegistry.Merge and Take, to move timers between processes.
+    CRegistryCaptureTimer overrides Capture, so it can be shared by threads.
+-----------------------------------------------------------------------------
+'''
+
+import math
+import threading
+from math import (floor, log)
+from collections import namedtuple
+
+from .CodeTimer import CCaptureTimer
+
+PRECISION = 0.01
+QUANTILES = (0.50, 0.95, 0.99)
+
+  # Is one line of CTimerRegistry.Report.  Quantiles is a tuple with the
+  # value of each quantile asked for, in the same order.  All the times
+  # are in milliseconds.  CPU to GCCollections are None if the timer
+  # never captured Resources, see CTimerStats.AddResources.
+_TimerReportDef = namedtuple('TimerReport', ['Name', 'Count', 'Total', 'Min', 'Max',
+                                             'Mean', 'Quantiles', 'CPU', 'ThreadCPU',
+                                             'MemoryPeak', 'MemoryNet', 'GCCollections'])
+
+
+  #======================================================
+class CTimerStats(object):
+  '''
+  Aggregates the times, in milliseconds, of one timer.  The quantiles
+  come from a histogram with log sized buckets, every value in a
+  bucket is within Precision of the value the bucket reports.  The
+  number of buckets only depends on the range of the times, about
+  1200 buckets cover 1 microsecond to 1 hour at 1%, not on how many
+  times are added.  This class is not thread safe, CTimerRegistry
+  holds its lock while it adds.
+
+    Stats = CTimerStats(Precision = PRECISION)
+      Precision
+        Is the most relative error of a quantile, 0.01 is 1%.
+
+  Exceptions:
+    AttributeError
+      If Precision is not between 0 and 1.
+  '''
+
+  def __init__(self, Precision = PRECISION):
+    object.__init__(self)
+
+    if not 0 < Precision < 1:
+      raise AttributeError(f'Precision must be between 0 and 1: {Precision}')
+    self._Precision = Precision
+    self._Base = (1 + Precision) ** 2
+    self._InvLogBase = 1 / math.log(self._Base)
+    self.Reset()
+
+    #------------------------------------------------------
+  def Add(self, Took, Weight = 1):
+    '''
+    Adds one time, in milliseconds.
+
+      Add(Took, Weight = 1)
+        Weight
+          Is how many calls the time stands for.  A sampled timer
+          that times 1 call in 10 adds each time with Weight 10,
+          so Count, Total and the quantiles are for all the calls.
+    '''
+    self._Samples += 1
+    self._Count += Weight
+    self._Total += Took * Weight
+    if Took < self._Min:
+      self._Min = Took
+    if Took > self._Max:
+      self._Max = Took
+
+    if Took > 0:
+      Bucket = floor(log(Took) * self._InvLogBase)
+      Buckets = self._Buckets
+      Buckets[Bucket] = Buckets.get(Bucket, 0) + Weight
+    else:
+      self._Zeros += Weight
+
+    #------------------------------------------------------
+  def AddResources(self, CPU, ThreadCPU, MemoryPeak, MemoryNet, GCCollections, Weight = 1):
+    '''
+    Adds the resources of one time, see CCodeTimer Resources.  CPU,
+    ThreadCPU, MemoryNet and GCCollections are summed, MemoryPeak
+    keeps the largest.
+
+      AddResources(CPU, ThreadCPU, MemoryPeak, MemoryNet, GCCollections, Weight = 1)
+    '''
+    self._Resources += Weight
+    self._CPU += CPU * Weight
+    self._ThreadCPU += ThreadCPU * Weight
+    self._MemoryNet += MemoryNet * Weight
+    self._GCCollections += GCCollections * Weight
+    if MemoryPeak > self._MemoryPeak:
+      self._MemoryPeak = MemoryPeak
+
+    #------------------------------------------------------
+  @property
+  def Count(self):
+    '''
+    Property: is the number of calls, the sum of the weights
+    '''
+    return self._Count
+
+    #------------------------------------------------------
+  @property
+  def CPU(self):
+    '''
+    Property: is the total process CPU in milliseconds, None if no
+    resources were added
+    '''
+    return self._CPU if self._Resources else None
+
+    #------------------------------------------------------
+  @property
+  def GCCollections(self):
+    '''
+    Property: is the total garbage collections, None if no resources
+    were added
+    '''
+    return self._GCCollections if self._Resources else None
+
+    #------------------------------------------------------
+  @property
+  def Max(self):
+    '''
+    Property: is the longest time, None if nothing was added
+    '''
+    return self._Max if self._Count else None
+
+    #------------------------------------------------------
+  @property
+  def Mean(self):
+    '''
+    Property: is the mean time, None if nothing was added
+    '''
+    return self._Total / self._Count if self._Count else None
+
+    #------------------------------------------------------
+  @property
+  def MemoryNet(self):
+    '''
+    Property: is the total net bytes, None if no resources were added
+    '''
+    return self._MemoryNet if self._Resources else None
+
+    #------------------------------------------------------
+  @property
+  def MemoryPeak(self):
+    '''
+    Property: is the largest peak bytes, None if no resources were
+    added
+    '''
+    return self._MemoryPeak if self._Resources else None
+
+    #------------------------------------------------------
+  def Merge(self, Other):
+    '''
+    Adds all the times of another CTimerStats to this one.  Both
+    must have the same Precision.
+
+      Merge(Other)
+
+    Exceptions:
+      AttributeError
+        If the Precision is not the same.
+    '''
+    if Other._Precision != self._Precision:
+      raise AttributeError(f'Can not merge Precision {Other._Precision} into {self._Precision}')
+
+    self._Samples += Other._Samples
+    self._Count += Other._Count
+    self._Total += Other._Total
+    self._Min = min(self._Min, Other._Min)
+    self._Max = max(self._Max, Other._Max)
+    self._Zeros += Other._Zeros
+    for Bucket, Count in Other._Buckets.items():
+      self._Buckets[Bucket] = self._Buckets.get(Bucket, 0) + Count
+    self._Resources += Other._Resources
+    self._CPU += Other._CPU
+    self._ThreadCPU += Other._ThreadCPU
+    self._MemoryPeak = max(self._MemoryPeak, Other._MemoryPeak)
+    self._MemoryNet += Other._MemoryNet
+    self._GCCollections += Other._GCCollections
+
+    #------------------------------------------------------
+  @property
+  def Min(self):
+    '''
+    Property: is the shortest time, None if nothing was added
+    '''
+    return self._Min if self._Count else None
+
+    #------------------------------------------------------
+  @property
+  def Precision(self):
+    '''
+    Property: is the most relative error of a quantile
+    '''
+    return self._Precision
+
+    #------------------------------------------------------
+  def Quantile(self, Fraction):
+    '''
+    Gets the time that Fraction of the times are at or below.
+
+      Value = Quantile(Fraction)
+        Value
+          Is the time in milliseconds, None if nothing was added.
+        Fraction
+          Is from 0 to 1, 0.95 is the 95th percentile.
+
+    Exceptions:
+      AttributeError
+        If Fraction is not from 0 to 1.
+    '''
+    return self.Quantiles((Fraction,))[0]
+
+    #------------------------------------------------------
+  def Quantiles(self, Fractions = QUANTILES):
+    '''
+    Gets several quantiles with one pass over the buckets.
+
+      Values = Quantiles(Fractions = QUANTILES)
+        Values
+          Is a tuple with the time of each fraction, in the same
+          order as Fractions.
+    '''
+    for Fraction in Fractions:
+      if not 0 <= Fraction <= 1:
+        raise AttributeError(f'Fraction must be from 0 to 1: {Fraction}')
+    if not self._Count:
+      return tuple(None for _ in Fractions)
+
+    Ranks = sorted((max(1, math.ceil(Fraction * self._Count)), i)
+                   for i, Fraction in enumerate(Fractions))
+    Values = [None] * len(Fractions)
+    Buckets = iter(sorted(self._Buckets.items()))
+    Seen = self._Zeros
+    Value = 0.0
+    for Rank, i in Ranks:
+      while Seen < Rank:
+        Bucket, Count = next(Buckets, (None, None))
+        if Bucket is None:
+          break  # Weights that are floats may not add up to Count exactly.
+        Seen += Count
+        Value = self._Base ** (Bucket + 0.5)
+      Values[i] = min(max(Value, self._Min), self._Max)
+    return tuple(Values)
+
+    #------------------------------------------------------
+  def Reset(self):
+    '''
+    Forgets all the times.
+    '''
+    self._Samples = 0
+    self._Count = 0
+    self._Total = 0.0
+    self._Min = math.inf
+    self._Max = -math.inf
+    self._Zeros = 0
+    self._Buckets = {}
+    self._Resources = 0
+    self._CPU = 0.0
+    self._ThreadCPU = 0.0
+    self._MemoryPeak = 0
+    self._MemoryNet = 0
+    self._GCCollections = 0
+
+    #------------------------------------------------------
+  @property
+  def Samples(self):
+    '''
+    Property: is the number of times added, not counting Weight
+    '''
+    return self._Samples
+
+    #------------------------------------------------------
+  @property
+  def ThreadCPU(self):
+    '''
+    Property: is the total thread CPU in milliseconds, None if no
+    resources were added
+    '''
+    return self._ThreadCPU if self._Resources else None
+
+    #------------------------------------------------------
+  @property
+  def Total(self):
+    '''
+    Property: is the sum of all the times
+    '''
+    return self._Total
+
+
+  #======================================================
+class CTimerRegistry(object):
+  '''
+  Keeps a CTimerStats for each timer Name.  It is thread safe.  Use
+  the module variable TimerRegistry, the one for the process, unless
+  you need a registry of your own.
+
+    Registry = CTimerRegistry(Precision = PRECISION)
+      Precision
+        Is passed to each CTimerStats.
+  '''
+
+  def __init__(self, Precision = PRECISION):
+    object.__init__(self)
+    self._Precision = Precision
+    self._Lock = threading.Lock()
+    self._Timers = {}
+
+    #------------------------------------------------------
+  def Add(self, Name, Took, Weight = 1, Resources = None):
+    '''
+    Adds one time, in milliseconds, to the timer Name.  See
+    CTimerStats.Add for Weight.
+
+      Add(Name, Took, Weight = 1, Resources = None)
+        Resources
+          If not None is the tuple (CPU, ThreadCPU, MemoryPeak,
+          MemoryNet, GCCollections), see CTimerStats.AddResources.
+    '''
+    with self._Lock:
+      Stats = self._Timers.get(Name)
+      if Stats is None:
+        Stats = self._Timers[Name] = CTimerStats(self._Precision)
+      Stats.Add(Took, Weight)
+      if Resources is not None:
+        Stats.AddResources(*Resources, Weight = Weight)
+
+    #------------------------------------------------------
+  def Get(self, Name):
+    '''
+    Gets the CTimerStats of Name, None if nothing was added to
+    it.  Do not change it while other threads can add to it.
+    '''
+    return self._Timers.get(Name)
+
+    #------------------------------------------------------
+  def Merge(self, Timers):
+    '''
+    Merges timers into this registry.  The CTimerStats passed in are
+    not kept, so they can be changed after.
+
+      Merge(Timers)
+        Timers
+          Is a CTimerRegistry, or a dict of Name to CTimerStats like
+          the one Take returns.
+
+    Exceptions:
+      AttributeError
+        If a timer has a different Precision than the one in this
+        registry.
+    '''
+    if isinstance(Timers, CTimerRegistry):
+      with Timers._Lock:
+        Timers = dict(Timers._Timers)
+    with self._Lock:
+      for Name, Other in Timers.items():
+        Stats = self._Timers.get(Name)
+        if Stats is None:
+          Stats = self._Timers[Name] = CTimerStats(Other.Precision)
+        Stats.Merge(Other)
+
+    #------------------------------------------------------
+  @property
+  def Names(self):
+    '''
+    Property: is a sorted list of the timer names
+    '''
+    with self._Lock:
+      return sorted(self._Timers)
+
+    #------------------------------------------------------
+  def Report(self, Quantiles = QUANTILES):
+    '''
+    Gets a line for each timer, sorted by Name.
+
+      Lines = Report(Quantiles = QUANTILES)
+        Lines
+          list of _TimerReportDef
+        Quantiles
+          Is the fractions to report, see CTimerStats.Quantiles.
+    '''
+    with self._Lock:
+      return [_TimerReportDef(Name, Stats.Count, Stats.Total, Stats.Min, Stats.Max,
+                              Stats.Mean, Stats.Quantiles(Quantiles), Stats.CPU,
+                              Stats.ThreadCPU, Stats.MemoryPeak, Stats.MemoryNet,
+                              Stats.GCCollections)
+              for Name, Stats in sorted(self._Timers.items())]
+
+    #------------------------------------------------------
+  def ReportString(self, Quantiles = QUANTILES):
+    '''
+    Formats Report as a table, one line per timer, times are in
+    milliseconds.  If any timer captured Resources the CPU, memory
+    and GC columns are added, they are blank for timers that did not.
+
+      String = ReportString(Quantiles = QUANTILES)
+    '''
+    Lines = self.Report(Quantiles)
+    Width = max([len(Line.Name) for Line in Lines] + [5])
+    Titles = ['Count', 'Total', 'Min', 'Mean', 'Max'] + [f'P{Fraction * 100:g}' for Fraction in Quantiles]
+    Resources = any(Line.CPU is not None for Line in Lines)
+    if Resources:
+      Titles += ['CPU', 'ThreadCPU', 'PeakBytes', 'NetBytes', 'GC']
+    Output = [f'{"Timer":<{Width}} ' + ' '.join(f'{Title:>12}' for Title in Titles)]
+    for Line in Lines:
+      Values = [Line.Total, Line.Min, Line.Mean, Line.Max] + list(Line.Quantiles)
+      Row = (f'{Line.Name:<{Width}} {Line.Count:>12.0f} ' +
+             ' '.join(f'{Value:12.4f}' for Value in Values))
+      if Line.CPU is not None:
+        Row += (f' {Line.CPU:12.4f} {Line.ThreadCPU:12.4f} {Line.MemoryPeak:>12.0f}'
+                f' {Line.MemoryNet:>12.0f} {Line.GCCollections:>12.0f}')
+      Output.append(Row)
+    return '\n'.join(Output)
+
+    #------------------------------------------------------
+  def Reset(self, Name = None):
+    '''
+    Forgets the timer Name, or all the timers if Name is None.
+    '''
+    with self._Lock:
+      if Name is None:
+        self._Timers.clear()
+      else:
+        self._Timers.pop(Name, None)
+
+    #------------------------------------------------------
+  def Take(self):
+    '''
+    Gets all the timers and forgets them, in one step so no time
+    added by another thread is lost.
+
+      Timers = Take()
+        Timers
+          Is a dict of Name to CTimerStats, it can be pickled.
+    '''
+    with self._Lock:
+      Timers = self._Timers
+      self._Timers = {}
+    return Timers
+
+
+  #======================================================
+class CRegistryCaptureTimer(CCaptureTimer):
+  '''
+  Is a CCaptureTimer that adds the time to a CTimerRegistry.  Pass it
+  to CCodeTimer.  It overrides Capture and does not store the data,
+  so one instance can be used by timers in many threads.  If the
+  CCodeTimer has Resources on they are added too.
+
+    CaptureTimer = CRegistryCaptureTimer(Registry = None)
+      Registry
+        Is the CTimerRegistry to add to, None is TimerRegistry.
+  '''
+
+  def __init__(self, Registry = None):
+    CCaptureTimer.__init__(self)
+    self.Registry = Registry if Registry is not None else TimerRegistry
+
+    #------------------------------------------------------
+  def Capture(self, Name, Start, End, Took, Resources):
+    self.Registry.Add(Name, Took, Resources = Resources)
+
+    #------------------------------------------------------
+  def Save(self):
+    '''
+    Adds the data stored in this class, for when you fill it in
+    yourself.
+    '''
+    if self.CPU is None:
+      self.Registry.Add(self.Name, self.Took)
+    else:
+      self.Registry.Add(self.Name, self.Took,
+                        Resources = (self.CPU, self.ThreadCPU, self.MemoryPeak,
+                                     self.MemoryNet, self.GCCollections))
+
+
+  # Is the registry for the process.
+TimerRegistry = CTimerRegistry()
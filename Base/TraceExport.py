@@ -0,0 +1,357 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Writes the spans of CCodeTimer, CSpanTimer or your own timers to files
+  you can open in a flame graph viewer: the Chrome Trace Event format
+  (chrome://tracing, Perfetto) and the speedscope format.  The spans are
+  written to disk in chunks as they come in, so a long run does not have
+  to fit in memory.
+
+  For further details see the help file for this module.
+-----------------------------------------------------------------------------
+Required Libraries:
+
+  From Python
+    json
+    os
+    shutil
+    tempfile
+    threading
+
+  From Libs
+    Libs.Base.CodeTimer
+    Libs.Base.SpanTimer
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+    CTraceCaptureTimer overrides Capture, so it can be shared by threads.
+-----------------------------------------------------------------------------
+'''
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+from .CodeTimer import CCaptureTimer
+from .SpanTimer import CurrentSpan
+
+CHUNKSIZE = 1000
+SPEEDSCOPESCHEMA = 'https://www.speedscope.app/file-format-schema.json'
+
+
+  #======================================================
+class CTraceWriter(object):
+  '''
+  Is the base of the trace writers, CChromeTraceWriter and
+  CSpeedscopeWriter.  A writer overrides _Add and _Close, this class
+  on its own writes an empty file.  Spans are added with Add and
+  are written to the file ChunkSize at a time.  Close must be called,
+  or the writer used with the 'with' statement, to finish the file.
+  It is thread safe.
+
+    Writer = CTraceWriter(FileName, ChunkSize = CHUNKSIZE)
+      FileName
+        Is the file to write.
+      ChunkSize
+        Is how many spans are kept before they are written.
+
+  Exceptions:
+    AttributeError
+      If ChunkSize is not above 0.
+      If a span is added after Close.
+  '''
+
+  def __init__(self, FileName, ChunkSize = CHUNKSIZE):
+    object.__init__(self)
+
+    if not ChunkSize > 0:
+      raise AttributeError(f'ChunkSize must be above 0: {ChunkSize}')
+    self._FileName = FileName
+    self._ChunkSize = ChunkSize
+    self._Lock = threading.Lock()
+    self._File = open(FileName, 'w', encoding = 'utf-8')  # pylint: disable=consider-using-with
+    self._ThreadNames = {}
+    self.Count = 0
+
+    #------------------------------------------------------
+  def Add(self, Name, Start, End, ThreadId = None, Root = True):
+    '''
+    Adds one span.
+
+      Add(Name, Start, End, ThreadId = None, Root = True)
+        Name
+          Is the name of the span.
+        Start, End
+          Are the start and end of the span in seconds, from
+          timeit.default_timer like CCodeTimer.
+        ThreadId
+          Is the thread of the span, None is the current thread.
+        Root
+          Is False if the span is inside another span of the same
+          thread that has not ended yet.  See CSpeedscopeWriter.
+    '''
+    if ThreadId is None:
+      Thread = threading.current_thread()
+      ThreadId = Thread.ident
+      if ThreadId not in self._ThreadNames:
+        self._ThreadNames[ThreadId] = Thread.name
+    with self._Lock:
+      if self._File is None:
+        raise AttributeError(f'The trace is closed: {self._FileName}')
+      self._Add(Name, Start, End, ThreadId, Root)
+      self.Count += 1
+
+    #------------------------------------------------------
+  def Close(self):
+    '''
+    Writes what is left and finishes the file.  It does nothing if
+    the writer is already closed.
+    '''
+    with self._Lock:
+      if self._File is not None:
+        try:
+          self._Close()
+        finally:
+          self._File.close()
+          self._File = None
+
+    #------------------------------------------------------
+  @property
+  def FileName(self):
+    '''
+    Property: is the file being written
+    '''
+    return self._FileName
+
+    #------------------------------------------------------
+  def _Add(self, Name, Start, End, ThreadId, Root):
+    '''
+    Is called by Add with the lock held.  This is an empty method,
+    override it to keep or write the span.
+    '''
+    pass  # pylint: disable=unnecessary-pass
+
+    #------------------------------------------------------
+  def _Close(self):
+    '''
+    Is called by Close with the lock held, before the file is
+    closed.  This is an empty method, override it to write what
+    is left and finish the file.
+    '''
+    pass  # pylint: disable=unnecessary-pass
+
+    #------------------------------------------------------
+  def __enter__(self):
+    return self
+
+    #------------------------------------------------------
+  def __exit__(self, exc_type, exc_val, exc_tb):
+    self.Close()
+
+
+  #======================================================
+class CChromeTraceWriter(CTraceWriter):
+  '''
+  Writes the Chrome Trace Event format.  Each span is a complete
+  ('X') event, so the spans can be written in any order.  Open the
+  file with chrome://tracing or https://ui.perfetto.dev.
+
+    Writer = CChromeTraceWriter(FileName, ChunkSize = CHUNKSIZE)
+      See CTraceWriter.
+  '''
+
+  def __init__(self, FileName, ChunkSize = CHUNKSIZE):
+    CTraceWriter.__init__(self, FileName, ChunkSize)
+    self._Pid = os.getpid()
+    self._Events = []
+    self._Separator = ''
+    self._File.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+
+    #------------------------------------------------------
+  def _Add(self, Name, Start, End, ThreadId, Root):
+    self._Events.append(f'{{"name": {json.dumps(Name)}, "ph": "X", "ts": {Start * 1e6:.3f}, '
+                        f'"dur": {(End - Start) * 1e6:.3f}, "pid": {self._Pid}, "tid": {ThreadId}}}')
+    if len(self._Events) >= self._ChunkSize:
+      self._WriteEvents()
+
+    #------------------------------------------------------
+  def _Close(self):
+    for ThreadId, ThreadName in self._ThreadNames.items():
+      self._Events.append(f'{{"name": "thread_name", "ph": "M", "pid": {self._Pid}, '
+                          f'"tid": {ThreadId}, "args": {{"name": {json.dumps(ThreadName)}}}}}')
+    self._WriteEvents()
+    self._File.write('\n]}\n')
+
+    #------------------------------------------------------
+  def _WriteEvents(self):
+    if self._Events:
+      self._File.write(self._Separator + ',\n'.join(self._Events))
+      self._Separator = ',\n'
+      self._Events = []
+
+
+  #======================================================
+class CSpeedscopeWriter(CTraceWriter):
+  '''
+  Writes the speedscope format, one evented profile per thread.  Open
+  the file with https://www.speedscope.app.
+
+  The events of a profile must be in time order, and a span is only
+  added when it ends, after its children.  So the spans of a thread
+  are kept until a root span, one with Root True, ends.  Then they
+  are sorted and written to a temporary file for the thread, and
+  Close copies the temporary files into FileName.  Spans of a thread
+  must nest, a span that ends after its parent is cut at the end of
+  its parent.  Spans of asyncio tasks that run at the same time do
+  not nest, use CChromeTraceWriter for them.  If a thread never ends
+  a root span its spans are written every ChunkSize * 100 spans so
+  memory stays bounded.
+
+    Writer = CSpeedscopeWriter(FileName, ChunkSize = CHUNKSIZE, Name = None)
+      Name
+        Is the name of the trace, None is FileName.
+      See CTraceWriter.
+  '''
+
+  def __init__(self, FileName, ChunkSize = CHUNKSIZE, Name = None):
+    CTraceWriter.__init__(self, FileName, ChunkSize)
+    self._Name = Name if Name is not None else os.path.basename(FileName)
+    self._Frames = {}
+    self._Threads = {}
+
+    #------------------------------------------------------
+  def _Add(self, Name, Start, End, ThreadId, Root):
+    Frame = self._Frames.get(Name)
+    if Frame is None:
+      Frame = self._Frames[Name] = len(self._Frames)
+
+    Thread = self._Threads.get(ThreadId)
+    if Thread is None:
+      Thread = self._Threads[ThreadId] = _CSpeedscopeThread()
+    Thread.Spans.append((Start, End, Frame))
+    if Root or len(Thread.Spans) >= self._ChunkSize * 100:
+      Thread.Write()
+
+    #------------------------------------------------------
+  def _Close(self):
+    File = self._File
+    File.write(f'{{"$schema": "{SPEEDSCOPESCHEMA}", "exporter": "Libs.Base.TraceExport", '
+               f'"name": {json.dumps(self._Name)}, "activeProfileIndex": 0, "profiles": [')
+    try:
+      for i, (ThreadId, Thread) in enumerate(self._Threads.items()):
+        Thread.Write()
+        ThreadName = self._ThreadNames.get(ThreadId, f'Thread {ThreadId}')
+        File.write(f'{"," if i else ""}\n{{"type": "evented", "name": {json.dumps(ThreadName)}, '
+                   f'"unit": "milliseconds", "events": [')
+        Thread.Temp.seek(0)
+        shutil.copyfileobj(Thread.Temp, File)
+        File.write(f'], "startValue": {Thread.First * 1e3:.6f}, "endValue": {Thread.Last * 1e3:.6f}}}')
+    finally:
+      for Thread in self._Threads.values():
+        Thread.Temp.close()
+
+    Frames = sorted(self._Frames.items(), key = lambda Item: Item[1])
+    File.write('\n], "shared": {"frames": [' +
+               ', '.join(f'{{"name": {json.dumps(Name)}}}' for Name, _ in Frames) + ']}}\n')
+
+
+  #======================================================
+class _CSpeedscopeThread(object):
+  '''
+  Keeps the spans of one thread that are not written yet, and the
+  temporary file with the events that are.
+  '''
+
+  def __init__(self):
+    object.__init__(self)
+    self.Spans = []
+    self.Temp = tempfile.TemporaryFile('w+', encoding = 'utf-8')  # pylint: disable=consider-using-with
+    self.First = None
+    self.Last = None
+    self._Separator = ''
+
+    #------------------------------------------------------
+  def Write(self):
+    '''
+    Sorts the spans and writes their open and close events.
+    '''
+    if not self.Spans:
+      return
+
+    self.Spans.sort(key = lambda Span: (Span[0], -Span[1]))
+    if self.First is None:
+      self.First = self.Spans[0][0]
+    if self.Last is not None and self.Spans[0][0] < self.Last:
+      self.Spans = [(max(Start, self.Last), max(End, self.Last), Frame)
+                    for Start, End, Frame in self.Spans]
+
+    Events = []
+    Stack = []
+    for Start, End, Frame in self.Spans:
+      while Stack and Stack[-1][0] <= Start:
+        Close, CloseFrame = Stack.pop()
+        Events.append(f'{{"type": "C", "frame": {CloseFrame}, "at": {Close * 1e3:.6f}}}')
+      if Stack and End > Stack[-1][0]:
+        End = Stack[-1][0]
+      Events.append(f'{{"type": "O", "frame": {Frame}, "at": {Start * 1e3:.6f}}}')
+      Stack.append((End, Frame))
+    while Stack:
+      Close, CloseFrame = Stack.pop()
+      Events.append(f'{{"type": "C", "frame": {CloseFrame}, "at": {Close * 1e3:.6f}}}')
+      self.Last = Close if self.Last is None else max(self.Last, Close)
+
+    self.Temp.write(self._Separator + ',\n'.join(Events))
+    self._Separator = ',\n'
+    self.Spans = []
+
+
+  #======================================================
+class CTraceCaptureTimer(CCaptureTimer):
+  '''
+  Is a CCaptureTimer that adds the span to a trace writer.  Pass it to
+  CCodeTimer or CSpanTimer.  It overrides Capture and does not store
+  the data, so one instance can be used by timers in many threads.
+  With CSpanTimer the writer knows which spans are roots.  A
+  CCodeTimer is a root unless it runs inside a CSpanTimer.
+
+    CaptureTimer = CTraceCaptureTimer(Writer)
+      Writer
+        Is the CTraceWriter to add the spans to.
+  '''
+
+  def __init__(self, Writer):
+    CCaptureTimer.__init__(self)
+    self.Writer = Writer
+
+    #------------------------------------------------------
+  def Capture(self, Name, Start, End, Took, Resources):
+    Span = CurrentSpan()
+    Root = Span is None or (Span.Parent is None and Span.End == End)
+    self.Writer.Add(Name, Start, End, Root = Root)
+
+    #------------------------------------------------------
+  def Save(self):
+    self.Capture(self.Name, self.Start, self.End, self.Took, None)
@@ -0,0 +1,239 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Runs the benchmarks of the Base package as one suite, saves the results
+  to a JSON file and compares two runs to find regressions.
+
+    python -m Libs.Base.benchmarks --save Before.json
+    ... make your change ...
+    python -m Libs.Base.benchmarks --save After.json --baseline Before.json
+    python -m Libs.Base.benchmarks --compare Before.json After.json
+
+  The exit code is 1 if a benchmark got slower than the threshold.
+-----------------------------------------------------------------------------
+Required Libraries:
+
+  From Python
+    argparse
+    datetime
+    json
+    platform
+    sys
+
+  From Libs
+    Libs.Base.benchmarks.bench_CodeTimer
+    Libs.Base.benchmarks.bench_Converters
+    Libs.Base.benchmarks.bench_DoubleLinkedList
+    Libs.Base.benchmarks.bench_Durations
+    Libs.Base.benchmarks.bench_StringHandlers
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+    CompareResults has MinChange, a change of a few nanoseconds is never
+    a regression and an Old of 0 or less has no Ratio.
+-----------------------------------------------------------------------------
+'''
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+from collections import namedtuple
+
+from .bench_CodeTimer import BenchTimerCost
+from .bench_Converters import (BenchBatch, BenchConverters)
+from .bench_DoubleLinkedList import (BenchListOps, BenchNodeOps)
+from .bench_Durations import BenchDurations
+from .bench_StringHandlers import (BenchStrings, BenchTokens)
+
+FORMATVERSION = 1
+THRESHOLD = 0.10
+MINCHANGE = 1.0
+
+  # Is one line of what CompareResults returns.  Name is the benchmark,
+  # Old and New are its values, Ratio is New / Old, None if Old is not
+  # above 0, and Regressed is True if New is over Old by more than
+  # Threshold and by more than MinChange nanoseconds.
+_CompareDef = namedtuple('Compare', ['Name', 'Old', 'New', 'Ratio', 'Regressed'])
+
+
+  #--------------------------------------------------------------------------
+def RunSuite(Repeat = 3, Quick = False):
+  '''
+  Runs every benchmark Repeat times and keeps the fastest value of
+  each, the slower ones are noise from the machine.  All values
+  are nanoseconds, lower is better.
+
+    Results = RunSuite(Repeat = 3, Quick = False)
+      Results
+        dict of {Name: nanoseconds}.  Name is 'Module.Operation.Size'.
+      Quick
+        If True runs smaller sizes, for a fast check.
+  '''
+    # bench_CodeTimer.BenchDisabled is not here, it is the time of an
+    # empty block less the time of the loop, which is about 0 and can be
+    # below 0, so a ratio of two runs of it is noise.
+  Sizes = (1000, 10000) if Quick else (1000, 10000, 100000)
+  Benchmarks = (
+      ('DoubleLinkedList', lambda: BenchListOps(Sizes)),
+      ('DoubleLinkedList', lambda: BenchNodeOps(Sizes, 2000 if Quick else 10000)),
+      ('StringHandlers', lambda: BenchStrings(Loops = 50 if Quick else 200)),
+      ('StringHandlers', lambda: BenchTokens(Loops = 5 if Quick else 20)),
+      ('Converters', lambda: {'': BenchConverters(20000 if Quick else 100000)}),
+      ('Converters', lambda: {'': BenchBatch(20000 if Quick else 100000)}),
+      ('Durations', lambda: {'': BenchDurations(20000 if Quick else 100000)}),
+      ('CodeTimer', lambda: {'': BenchTimerCost(20000 if Quick else 100000)}),
+  )
+
+  Results = {}
+  for _ in range(Repeat):
+    for Module, Bench in Benchmarks:
+      for Size, Ops in Bench().items():
+        for Op, Value in Ops.items():
+          Name = '.'.join(str(Part) for Part in (Module, Op, Size) if Part != '')
+          if Name not in Results or Value < Results[Name]:
+            Results[Name] = Value
+  return Results
+
+
+  #--------------------------------------------------------------------------
+def SaveResults(FileName, Results):
+  '''
+  Saves the results of RunSuite to a JSON file, with the Python
+  version and platform they were run on.
+  '''
+  Data = {'Version': FORMATVERSION,
+          'Created': datetime.datetime.now().isoformat(timespec = 'seconds'),
+          'Python': platform.python_version(),
+          'Implementation': platform.python_implementation(),
+          'Platform': platform.platform(),
+          'Results': Results}
+  with open(FileName, 'w', encoding = 'utf-8') as File:
+    json.dump(Data, File, indent = 2, sort_keys = True)
+
+
+  #--------------------------------------------------------------------------
+def LoadResults(FileName):
+  '''
+  Loads a file saved by SaveResults.
+
+    Results = LoadResults(FileName)
+      Results
+        dict of {Name: nanoseconds}
+
+  Exceptions:
+    ValueError
+      If the file is not a saved benchmark run.
+  '''
+  with open(FileName, encoding = 'utf-8') as File:
+    Data = json.load(File)
+  if not isinstance(Data, dict) or Data.get('Version') != FORMATVERSION:
+    raise ValueError(f'Not a benchmark results file: {FileName}')
+  return Data['Results']
+
+
+  #--------------------------------------------------------------------------
+def CompareResults(OldResults, NewResults, Threshold = THRESHOLD, MinChange = MINCHANGE):
+  '''
+  Compares two runs.  Only the benchmarks in both runs are compared.
+
+    Lines = CompareResults(OldResults, NewResults, Threshold = THRESHOLD,
+                           MinChange = MINCHANGE)
+      Lines
+        list of _CompareDef sorted by Name.
+      Threshold
+        Is how much slower, as a fraction, a benchmark can get
+        before it is a regression.  0.10 is 10%.
+      MinChange
+        Is how many nanoseconds slower a benchmark must also get to
+        be a regression, so a value near 0 that is mostly timer
+        noise is not flagged for a large ratio.
+  '''
+  Lines = []
+  for Name in sorted(OldResults.keys() & NewResults.keys()):
+    Old = OldResults[Name]
+    New = NewResults[Name]
+    Ratio = New / Old if Old > 0 else None
+    Regressed = New - Old > MinChange and (Ratio is None or Ratio > 1 + Threshold)
+    Lines.append(_CompareDef(Name, Old, New, Ratio, Regressed))
+  return Lines
+
+
+  #--------------------------------------------------------------------------
+def PrintResults(Results, File = sys.stdout):
+  for Name, Value in sorted(Results.items()):
+    print(f'  {Name:<52} {Value:12.1f} ns', file = File)
+
+
+  #--------------------------------------------------------------------------
+def PrintComparison(Lines, File = sys.stdout):
+  print(f'  {"Benchmark":<52} {"Old ns":>12} {"New ns":>12} {"Change":>8}', file = File)
+  for Line in Lines:
+    Flag = '  REGRESSED' if Line.Regressed else ''
+    Change = '     n/a' if Line.Ratio is None else f'{(Line.Ratio - 1) * 100:+7.1f}%'
+    print(f'  {Line.Name:<52} {Line.Old:12.1f} {Line.New:12.1f} {Change}{Flag}', file = File)
+
+
+  #--------------------------------------------------------------------------
+def Main(Args = None):
+  '''
+  Is the command line of the suite, see the module description.
+
+    ExitCode = Main(Args = None)
+      ExitCode
+        1 if a benchmark regressed, else 0.
+  '''
+  Parser = argparse.ArgumentParser(prog = 'python -m Libs.Base.benchmarks',
+                                   description = 'Benchmarks for the Base package.')
+  Parser.add_argument('--save', metavar = 'FILE', help = 'save the results to FILE')
+  Parser.add_argument('--baseline', metavar = 'FILE',
+                      help = 'compare the results with a run saved in FILE')
+  Parser.add_argument('--compare', nargs = 2, metavar = ('OLD', 'NEW'),
+                      help = 'compare two saved runs without running anything')
+  Parser.add_argument('--threshold', type = float, default = THRESHOLD,
+                      help = f'slowdown, as a fraction, that is a regression (default {THRESHOLD})')
+  Parser.add_argument('--repeat', type = int, default = 3,
+                      help = 'times to run each benchmark, the fastest is kept (default 3)')
+  Parser.add_argument('--quick', action = 'store_true', help = 'run smaller sizes')
+  Options = Parser.parse_args(Args)
+
+  if Options.compare:
+    Lines = CompareResults(LoadResults(Options.compare[0]), LoadResults(Options.compare[1]),
+                           Options.threshold)
+  else:
+    Results = RunSuite(Options.repeat, Options.quick)
+    if Options.save:
+      SaveResults(Options.save, Results)
+    if not Options.baseline:
+      PrintResults(Results)
+      return 0
+    Lines = CompareResults(LoadResults(Options.baseline), Results, Options.threshold)
+
+  PrintComparison(Lines)
+  Regressed = [Line.Name for Line in Lines if Line.Regressed]
+  if Regressed:
+    print(f'{len(Regressed)} benchmark(s) regressed more than {Options.threshold:.0%}')
+    return 1
+  return 0
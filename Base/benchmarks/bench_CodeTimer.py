@@ -0,0 +1,179 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Benchmarks for the cost of timing a block with Libs.Base.CodeTimer,
+  Libs.Base.TimerStats and Libs.Base.FastTimer.
+
+    python -m Libs.Base.benchmarks.bench_CodeTimer
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import timeit
+
+from ..CodeTimer import (CCodeTimer, EnableTimers, TimersEnabled)
+from ..FastTimer import (CFastTimer, CSampledTimer, Timed)
+from ..TimerStats import (CTimerRegistry, CRegistryCaptureTimer)
+
+
+  #--------------------------------------------------------------------------
+def BenchTimerCost(Loops = 100000):
+  '''
+  Times an empty block, and an empty function, with each kind of
+  timer and takes off the time of the loop with no timer.  What is
+  left is what each timer costs per call.
+
+    Results = BenchTimerCost(Loops)
+      Results
+        dict of {Timer: nanoseconds per call}
+      Loops
+        Is how many times each block is run.
+  '''
+  Registry = CTimerRegistry()
+  CaptureTimer = CRegistryCaptureTimer(Registry)
+  FastTimer = CFastTimer('Fast', Registry)
+  KeepTimer = CFastTimer(None, Registry)
+  SampledTimer = CSampledTimer('Sampled', Registry, Every = 100)
+
+  def Empty():
+    pass
+  TimedEmpty = Timed('Timed', Registry)(Empty)
+  SampledEmpty = Timed('TimedSampled', Registry, Every = 100)(Empty)
+  Results = {}
+
+  Start = timeit.default_timer()
+  for _ in range(Loops):
+    pass
+  Base = timeit.default_timer() - Start
+
+  Start = timeit.default_timer()
+  for _ in range(Loops):
+    with CCodeTimer('Code', CaptureTimer):
+      pass
+  Results['CCodeTimer+CRegistryCaptureTimer'] = timeit.default_timer() - Start - Base
+
+  Start = timeit.default_timer()
+  for _ in range(Loops):
+    with FastTimer:
+      pass
+  Results['CFastTimer'] = timeit.default_timer() - Start - Base
+
+  Start = timeit.default_timer()
+  for _ in range(Loops):
+    with KeepTimer:
+      pass
+  Results['CFastTimer, no registry'] = timeit.default_timer() - Start - Base
+
+  Start = timeit.default_timer()
+  for _ in range(Loops):
+    with SampledTimer:
+      pass
+  Results['CSampledTimer, Every 100'] = timeit.default_timer() - Start - Base
+
+  Start = timeit.default_timer()
+  for _ in range(Loops):
+    Empty()
+  Base = timeit.default_timer() - Start
+
+  Start = timeit.default_timer()
+  for _ in range(Loops):
+    TimedEmpty()
+  Results['Timed'] = timeit.default_timer() - Start - Base
+
+  Start = timeit.default_timer()
+  for _ in range(Loops):
+    SampledEmpty()
+  Results['Timed, Every 100'] = timeit.default_timer() - Start - Base
+
+  return {Name: Value * 1e9 / Loops for Name, Value in Results.items()}
+
+
+  #--------------------------------------------------------------------------
+def BenchDisabled(Loops = 100000):
+  '''
+  Turns the timers off and times what is left of each kind of timer
+  on an empty block, less the time of the loop with no timer.
+
+    Results = BenchDisabled(Loops)
+      Results
+        dict of {Timer: nanoseconds per call}
+      Loops
+        Is how many times each block is run.
+  '''
+  Enabled = TimersEnabled()
+  EnableTimers(False)
+  try:
+    FastTimer = CFastTimer('Fast')
+
+    def Empty():
+      pass
+    TimedEmpty = Timed(Empty)
+    Results = {}
+
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      pass
+    Base = timeit.default_timer() - Start
+
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      with CCodeTimer('Code'):
+        pass
+    Results['CCodeTimer, off'] = timeit.default_timer() - Start - Base
+
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      with FastTimer:
+        pass
+    Results['CFastTimer, off'] = timeit.default_timer() - Start - Base
+
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      Empty()
+    Base = timeit.default_timer() - Start
+
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      TimedEmpty()
+    Results['Timed, off'] = timeit.default_timer() - Start - Base
+  finally:
+    EnableTimers(Enabled)
+
+  return {Name: Value * 1e9 / Loops for Name, Value in Results.items()}
+
+
+if __name__ == '__main__':
+  from .. import FastTimer
+  print('Cost of timing an empty block (ns per call)')
+  for Name, Value in BenchTimerCost().items():
+    print(f'  {Name:<34} {Value:10.1f}')
+    # The timers calibrate on first use, so the overheads are read from
+    # the module after BenchTimerCost and not imported before it.
+  print(f'Calibrated overhead taken off: CFastTimer {FastTimer.ContextOverhead} ns, '
+        f'Timed {FastTimer.DecoratorOverhead} ns')
+  print('Cost of an empty block with the timers off (ns per call)')
+  for Name, Value in BenchDisabled().items():
+    print(f'  {Name:<34} {Value:10.1f}')
@@ -0,0 +1,103 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Benchmarks for Libs.Base.Converters.
+
+    python -m Libs.Base.benchmarks.bench_Converters
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+    Added BenchBatch.
+-----------------------------------------------------------------------------
+'''
+
+import random
+import timeit
+
+from .. import Converters
+from ..Converters import (ConvertMillisecondsDays, ConvertMillisecondsDaysBatch,
+                          ConvertMillisecondsWeeks, ConvertMillisecondsWeeksBatch)
+
+
+  #--------------------------------------------------------------------------
+def BenchConverters(Count = 100000):
+  '''
+  Times the converters on Count random millisecond values up to
+  a few weeks.
+
+    Results = BenchConverters(Count)
+      Results
+        dict of {Function: nanoseconds per call}
+      Count
+        Is how many values to convert.
+  '''
+  Rand = random.Random(1)
+  Values = [Rand.uniform(0, 30 * 24 * 60 * 60 * 1000) for _ in range(Count)]
+  Results = {}
+
+  for Function in (ConvertMillisecondsDays, ConvertMillisecondsWeeks):
+    Start = timeit.default_timer()
+    for Value in Values:
+      Function(Value)
+    Results[Function.__name__] = (timeit.default_timer() - Start) * 1e9 / Count
+
+  return Results
+
+
+  #--------------------------------------------------------------------------
+def BenchBatch(Count = 100000):
+  '''
+  Times converting a column of Count values with a loop over the
+  scalar function and with the batch function.  The batch time says
+  if numpy was used.
+
+    Results = BenchBatch(Count)
+      Results
+        dict of {Function: nanoseconds per value}
+  '''
+  Rand = random.Random(1)
+  Values = [Rand.uniform(0, 30 * 24 * 60 * 60 * 1000) for _ in range(Count)]
+  Path = 'numpy' if Converters.numpy is not None else 'python'
+  Results = {}
+
+  for Function, Batch in ((ConvertMillisecondsDays, ConvertMillisecondsDaysBatch),
+                          (ConvertMillisecondsWeeks, ConvertMillisecondsWeeksBatch)):
+    Start = timeit.default_timer()
+    _ = [Function(Value) for Value in Values]
+    Results[f'{Function.__name__} loop'] = (timeit.default_timer() - Start) * 1e9 / Count
+
+    Start = timeit.default_timer()
+    Batch(Values)
+    Results[f'{Batch.__name__} {Path}'] = (timeit.default_timer() - Start) * 1e9 / Count
+
+  return Results
+
+
+if __name__ == '__main__':
+  print('Converters (ns per call)')
+  for Function, Value in BenchConverters().items():
+    print(f'  {Function:<26} {Value:10.1f}')
+  print('Converters, a column of values (ns per value)')
+  for Function, Value in BenchBatch().items():
+    print(f'  {Function:<38} {Value:10.1f}')
@@ -0,0 +1,215 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Benchmarks for Libs.Base.DoubleLinkedList.
+
+    python -m Libs.Base.benchmarks.bench_DoubleLinkedList
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import timeit
+import tracemalloc
+
+from ..DoubleLinkedList import (DLinkType, CDoubleLinkedList, CNode, CSlotNode)
+
+SIZES = (1000, 10000, 100000)
+
+
+  #--------------------------------------------------------------------------
+def BenchListOps(Sizes = SIZES):
+  '''
+  Times Push, iterating and Pop over lists of different sizes.
+
+    Results = BenchListOps(Sizes)
+      Results
+        dict of {Size: {Operation: nanoseconds per item}}
+      Sizes
+        Is the list sizes to run.
+  '''
+  Results = {}
+
+  for Size in Sizes:
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+
+    Start = timeit.default_timer()
+    for i in range(Size):
+      DList.Push(i)
+    PushTime = timeit.default_timer() - Start
+
+    Start = timeit.default_timer()
+    for _ in DList:
+      pass
+    IterTime = timeit.default_timer() - Start
+
+    Start = timeit.default_timer()
+    for _ in range(Size):
+      DList.Pop()
+    PopTime = timeit.default_timer() - Start
+
+    Results[Size] = {'Push': PushTime * 1e9 / Size,
+                     'Iterate': IterTime * 1e9 / Size,
+                     'Pop': PopTime * 1e9 / Size}
+
+  return Results
+
+
+  #--------------------------------------------------------------------------
+def BenchNodeOps(Sizes = SIZES, Loops = 10000):
+  '''
+  Times IsNode, PopNode and PushBeforeNode on the middle node of
+  lists of different sizes.  These are O(1), so the time per call
+  should stay flat as the list grows.
+
+    Results = BenchNodeOps(Sizes, Loops)
+      Results
+        dict of {Size: {Operation: nanoseconds per call}}
+      Sizes
+        Is the list sizes to run.
+      Loops
+        Is how many times each operation is called per size.
+  '''
+  Results = {}
+
+  for Size in Sizes:
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+    for i in range(Size):
+      DList.Push(i)
+    MidNode = _NodeAt(DList, Size // 2)
+    BeforeNode = MidNode.Next
+
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      DList.IsNode(MidNode)
+    IsNodeTime = timeit.default_timer() - Start
+
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      DList.PopNode(MidNode)
+      DList.PushBeforeNode(BeforeNode, MidNode)
+    MoveTime = timeit.default_timer() - Start
+
+    Results[Size] = {'IsNode': IsNodeTime * 1e9 / Loops,
+                     'PopNode+PushBeforeNode': MoveTime * 1e9 / Loops}
+
+  return Results
+
+
+  #--------------------------------------------------------------------------
+def BenchNodeMemory(Count = 100000):
+  '''
+  Uses tracemalloc to measure how many bytes each node takes
+  when pushed on a list, for CNode and CSlotNode.
+
+    Results = BenchNodeMemory(Count)
+      Results
+        dict of {NodeClass name: bytes per node}
+      Count
+        Is how many nodes to push for each node class.
+  '''
+  Results = {}
+
+  for NodeClass in (CNode, CSlotNode):
+    DList = CDoubleLinkedList(DLinkType.FIFO, NodeClass)
+    tracemalloc.start()
+    Before = tracemalloc.get_traced_memory()[0]
+    for _ in range(Count):
+      DList.Push(None)
+    After = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    Results[NodeClass.__name__] = (After - Before) / Count
+
+  return Results
+
+
+  #--------------------------------------------------------------------------
+def BenchBulk(Count = 100000):
+  '''
+  Compares loading and draining a list one item at a time against
+  PushMany/PopMany, and times Splice of two lists of Count nodes.
+
+    Results = BenchBulk(Count)
+      Results
+        dict of {Operation: seconds}
+      Count
+        Is how many items to push.
+  '''
+  Results = {}
+
+  DList = CDoubleLinkedList(DLinkType.FIFO)
+  Start = timeit.default_timer()
+  for i in range(Count):
+    DList.Push(i)
+  Results['Push loop'] = timeit.default_timer() - Start
+
+  Start = timeit.default_timer()
+  for _ in range(Count):
+    DList.Pop()
+  Results['Pop loop'] = timeit.default_timer() - Start
+
+  Start = timeit.default_timer()
+  DList.PushMany(range(Count))
+  Results['PushMany'] = timeit.default_timer() - Start
+
+  Start = timeit.default_timer()
+  DList.PopMany(Count)
+  Results['PopMany'] = timeit.default_timer() - Start
+
+  DList.PushMany(range(Count))
+  Other = CDoubleLinkedList(DLinkType.FIFO)
+  Other.PushMany(range(Count))
+  Start = timeit.default_timer()
+  DList.Splice(Other)
+  Results['Splice'] = timeit.default_timer() - Start
+
+  return Results
+
+
+  #--------------------------------------------------------------------------
+def _NodeAt(DList, Index):
+  for i, Node in enumerate(DList):
+    if i == Index:
+      return Node
+  return None
+
+
+  #--------------------------------------------------------------------------
+def _PrintResults(Title, Results):
+  print(Title)
+  for Size, Ops in Results.items():
+    for Op, Value in Ops.items():
+      print(f'  {Size:>10}  {Op:<28} {Value:10.1f} ns')
+
+
+if __name__ == '__main__':
+  _PrintResults('List operations (ns per item)', BenchListOps())
+  _PrintResults('Node operations (ns per call)', BenchNodeOps())
+  print('Node memory (bytes per node)')
+  for Name, Value in BenchNodeMemory().items():
+    print(f'  {Name:<12} {Value:8.1f}')
+  print('Bulk operations, 100000 items (ms)')
+  for Name, Value in BenchBulk().items():
+    print(f'  {Name:<12} {Value * 1000:10.3f}')
@@ -0,0 +1,83 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Benchmarks for Libs.Base.Durations.
+
+    python -m Libs.Base.benchmarks.bench_Durations
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import random
+import timeit
+
+from ..CodeTimer import CCaptureTimer
+from ..Durations import (FormatDuration, ParseDuration, ParseTimerLines)
+
+
+  #--------------------------------------------------------------------------
+def BenchDurations(Count = 100000):
+  '''
+  Times formatting Count random durations, parsing them back and
+  reading a timer log of Count lines, every other line is not a
+  timer line.
+
+    Results = BenchDurations(Count)
+      Results
+        dict of {Function: nanoseconds per value or line}
+  '''
+  Rand = random.Random(1)
+  Values = [Rand.uniform(0, 30 * 24 * 60 * 60 * 1000) for _ in range(Count)]
+  Results = {}
+
+  Start = timeit.default_timer()
+  Strings = [FormatDuration(Value) for Value in Values]
+  Results['FormatDuration'] = (timeit.default_timer() - Start) * 1e9 / Count
+
+  Start = timeit.default_timer()
+  for String in Strings:
+    ParseDuration(String)
+  Results['ParseDuration'] = (timeit.default_timer() - Start) * 1e9 / Count
+
+  CaptureTimer = CCaptureTimer()
+  CaptureTimer.Name = 'Block'
+  Lines = []
+  for Value in Values[:Count // 2]:
+    CaptureTimer.Took = Value
+    Lines.append(str(CaptureTimer) + '\n')
+    Lines.append('Some other line of the log\n')
+  Start = timeit.default_timer()
+  for _ in ParseTimerLines(Lines):
+    pass
+  Results['ParseTimerLines'] = (timeit.default_timer() - Start) * 1e9 / len(Lines)
+
+  return Results
+
+
+if __name__ == '__main__':
+  print('Durations (ns per value or line)')
+  for Function, Value in BenchDurations().items():
+    print(f'  {Function:<26} {Value:10.1f}')
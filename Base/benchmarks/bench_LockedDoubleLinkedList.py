@@ -0,0 +1,124 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Multi producer, multi consumer throughput of
+  Libs.Base.LockedDoubleLinkedList.
+
+    python -m Libs.Base.benchmarks.bench_LockedDoubleLinkedList
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import asyncio
+import threading
+import timeit
+
+from ..DoubleLinkedList import DLinkType
+from ..LockedDoubleLinkedList import (CLockedDoubleLinkedList, CAsyncDoubleLinkedList)
+
+THREADS = ((1, 1), (2, 2), (4, 4))
+
+
+  #--------------------------------------------------------------------------
+def BenchThreads(Threads = THREADS, Items = 50000):
+  '''
+  Runs producer threads pushing into a CLockedDoubleLinkedList and
+  consumer threads popping with Pop.
+
+    Results = BenchThreads(Threads, Items)
+      Results
+        dict of {(Producers, Consumers): items per second}
+      Threads
+        Is a list of (Producers, Consumers) to run.
+      Items
+        Is the total items pushed for each run.
+  '''
+  Results = {}
+
+  for Producers, Consumers in Threads:
+    DList = CLockedDoubleLinkedList(DLinkType.FIFO)
+    PerProducer = Items // Producers
+    Total = PerProducer * Producers
+
+    def Produce():
+      for i in range(PerProducer):
+        DList.Push(i)
+
+    def Consume(Count):
+      for _ in range(Count):
+        DList.Pop()
+
+    Counts = [Total // Consumers] * Consumers
+    Counts[0] += Total - sum(Counts)
+    Workers = [threading.Thread(target = Consume, args = (Count,)) for Count in Counts]
+    Workers += [threading.Thread(target = Produce) for _ in range(Producers)]
+
+    Start = timeit.default_timer()
+    for Worker in Workers:
+      Worker.start()
+    for Worker in Workers:
+      Worker.join()
+    Results[(Producers, Consumers)] = Total / (timeit.default_timer() - Start)
+
+  return Results
+
+
+  #--------------------------------------------------------------------------
+def BenchAsync(Producers = 4, Items = 50000):
+  '''
+  Runs producer threads pushing into a CAsyncDoubleLinkedList that
+  is drained by a coroutine with 'await Pop()'.
+
+    ItemsPerSecond = BenchAsync(Producers, Items)
+  '''
+  DList = CAsyncDoubleLinkedList(DLinkType.FIFO)
+  PerProducer = Items // Producers
+  Total = PerProducer * Producers
+
+  def Produce():
+    for i in range(PerProducer):
+      DList.Push(i)
+
+  async def Consume():
+    for _ in range(Total):
+      await DList.Pop()
+
+  Workers = [threading.Thread(target = Produce) for _ in range(Producers)]
+  Start = timeit.default_timer()
+  for Worker in Workers:
+    Worker.start()
+  asyncio.run(Consume())
+  for Worker in Workers:
+    Worker.join()
+
+  return Total / (timeit.default_timer() - Start)
+
+
+if __name__ == '__main__':
+  print('Threads (producers x consumers)   items per second')
+  for (Producers, Consumers), Value in BenchThreads().items():
+    print(f'  {Producers} x {Consumers}  {Value:14,.0f}')
+  print(f'Asyncio consumer, 4 producers  {BenchAsync():14,.0f}')
@@ -0,0 +1,91 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Compares ordered inserts into a CDoubleLinkedList using a linear search
+  and PushBeforeNode with CPriorityDoubleLinkedList.Push.
+
+    python -m Libs.Base.benchmarks.bench_PriorityDoubleLinkedList
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import random
+import timeit
+
+from ..DoubleLinkedList import (DLinkType, CDoubleLinkedList)
+from ..PriorityDoubleLinkedList import CPriorityDoubleLinkedList
+
+SIZES = (1000, 10000, 100000)
+LINEARSIZES = (1000, 10000)
+
+
+  #--------------------------------------------------------------------------
+def BenchOrderedInsert(Sizes = SIZES, LinearSizes = LINEARSIZES, Loops = 1000):
+  '''
+  Fills a list with Size ordered items and then times Loops inserts
+  of random priorities, popping each one back off.
+
+    Results = BenchOrderedInsert(Sizes, LinearSizes, Loops)
+      Results
+        dict of {Size: {Method: microseconds per insert}}
+      Sizes
+        Is the list sizes to run CPriorityDoubleLinkedList at.
+      LinearSizes
+        Is the list sizes to run the linear search at, it is slow.
+  '''
+  Rand = random.Random(1)
+  Results = {}
+
+  for Size in Sizes:
+    Keys = [Rand.random() for _ in range(Loops)]
+    Results[Size] = {}
+
+    if Size in LinearSizes:
+      DList = CDoubleLinkedList(DLinkType.FIFO)
+      DList.PushMany(sorted(Rand.random() for _ in range(Size)))
+      Start = timeit.default_timer()
+      for Key in Keys:
+        for Node in DList:
+          if Node.UserData > Key:
+            DList.PopNode(DList.PushBeforeUserData(Node, Key))
+            break
+      Results[Size]['Linear search'] = (timeit.default_timer() - Start) * 1e6 / Loops
+
+    DList = CPriorityDoubleLinkedList(DLinkType.FIFO, lambda UserData: UserData)
+    DList.PushMany(Rand.random() for _ in range(Size))
+    Start = timeit.default_timer()
+    for Key in Keys:
+      DList.PopNode(DList.Push(Key))
+    Results[Size]['CPriorityDoubleLinkedList'] = (timeit.default_timer() - Start) * 1e6 / Loops
+
+  return Results
+
+
+if __name__ == '__main__':
+  print('Ordered insert and PopNode (us per insert)')
+  for Size, Methods in BenchOrderedInsert().items():
+    for Method, Value in Methods.items():
+      print(f'  {Size:>8}  {Method:<28} {Value:10.2f}')
@@ -0,0 +1,144 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long (Donald.W.Long@gmail.com)
+-----------------------------------------------------------------------------
+CopyRight:
+
+    Copyright (C) 2020-2026  Donald W. Long (Donald.W.Long@gmail.com)
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+-----------------------------------------------------------------------------
+Description:
+
+  Benchmarks for Libs.Base.StringHandlers.
+
+    python -m Libs.Base.benchmarks.bench_StringHandlers
+-----------------------------------------------------------------------------
+Update History:
+  Oct 18, 2026 - Donald W. Long (Donald.W.Long@gmail.com)
+    Released
+    Added CStringScanner to BenchStrings, a 65536 character line and
+    BenchTokens.
+    Added GetStringBytes and SkipWhiteSpaceBytes to BenchStrings.
+-----------------------------------------------------------------------------
+'''
+
+import timeit
+
+from ..StringHandlers import (CStringScanner, GetString, GetStringBytes, SkipWhiteSpace,
+                              SkipWhiteSpaceBytes)
+
+LINELENGTHS = (16, 256, 4096, 65536)
+
+
+  #--------------------------------------------------------------------------
+def BenchStrings(LineLengths = LINELENGTHS, Loops = 200):
+  '''
+  Times GetString on a quoted string and SkipWhiteSpace on leading
+  white space, the functions, the CStringScanner methods and the bytes
+  functions, for lines of different lengths.  Every 32nd character
+  of the quoted string is an escaped quote.
+
+    Results = BenchStrings(LineLengths, Loops)
+      Results
+        dict of {Length: {Function: nanoseconds per character}}
+      LineLengths
+        Is the line lengths to run.
+      Loops
+        Is how many times each function is called per length.
+  '''
+  Results = {}
+
+  for Length in LineLengths:
+    Chunk = 'a' * 30 + '\\"'
+    Text = (Chunk * (Length // len(Chunk) + 1))[:Length]
+    if Text.endswith('\\'):
+      Text = Text[:-1] + 'a'
+    QuotedLine = '"' + Text + '" rest of line'
+    SpaceLine = ' \t' * (Length // 2) + 'rest of line'
+
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      GetString(QuotedLine)
+    StringTime = timeit.default_timer() - Start
+
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      SkipWhiteSpace(SpaceLine)
+    SpaceTime = timeit.default_timer() - Start
+
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      CStringScanner(QuotedLine).GetString()
+    ScannerStringTime = timeit.default_timer() - Start
+
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      CStringScanner(SpaceLine).SkipWhiteSpace()
+    ScannerSpaceTime = timeit.default_timer() - Start
+
+    QuotedBytes = memoryview(QuotedLine.encode())
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      GetStringBytes(QuotedBytes)
+    BytesStringTime = timeit.default_timer() - Start
+
+    SpaceBytes = memoryview(SpaceLine.encode())
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      SkipWhiteSpaceBytes(SpaceBytes)
+    BytesSpaceTime = timeit.default_timer() - Start
+
+    Results[Length] = {'GetString': StringTime * 1e9 / (Loops * Length),
+                       'SkipWhiteSpace': SpaceTime * 1e9 / (Loops * Length),
+                       'Scanner.GetString': ScannerStringTime * 1e9 / (Loops * Length),
+                       'Scanner.SkipWhiteSpace': ScannerSpaceTime * 1e9 / (Loops * Length),
+                       'GetStringBytes': BytesStringTime * 1e9 / (Loops * Length),
+                       'SkipWhiteSpaceBytes': BytesSpaceTime * 1e9 / (Loops * Length)}
+
+  return Results
+
+
+  #--------------------------------------------------------------------------
+def BenchTokens(LineLengths = LINELENGTHS[-2:], Loops = 20):
+  '''
+  Times CStringScanner.Tokens on a long line like a config file,
+  names, numbers, quoted strings with escapes and punctuation.
+
+    Results = BenchTokens(LineLengths, Loops)
+      Results
+        dict of {Length: {'Tokens': nanoseconds per character}}
+  '''
+  Chunk = 'name_1 = "a \\"quoted\\" value", 12.5; '
+  Results = {}
+
+  for Length in LineLengths:
+    Line = Chunk * (Length // len(Chunk))
+    Start = timeit.default_timer()
+    for _ in range(Loops):
+      for _ in CStringScanner(Line).Tokens():
+        pass
+    Results[Length] = {'Tokens': (timeit.default_timer() - Start) * 1e9 / (Loops * len(Line))}
+
+  return Results
+
+
+if __name__ == '__main__':
+  print('String scanning (ns per character)')
+  for Length, Functions in BenchStrings().items():
+    for Function, Value in Functions.items():
+      print(f'  {Length:>8}  {Function:<24} {Value:10.2f}')
+  for Length, Functions in BenchTokens().items():
+    for Function, Value in Functions.items():
+      print(f'  {Length:>8}  {Function:<24} {Value:10.2f}')
@@ -0,0 +1,84 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.Benchmark
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import gc
+import unittest
+
+from Libs.Base.Benchmark import (_BenchResultDef, CBenchmark, FormatMilliseconds, ResultString)
+from Libs.Base.CodeTimer import (EnableTimers, TimersEnabled)
+
+
+class TestBenchmark(unittest.TestCase):
+
+  def test_Run(self):
+    Calls = []
+    Setups = []
+    Bench = CBenchmark(Warmup = 2, Runs = 3, Number = 10)
+    Result = Bench.Run(lambda: Calls.append(1), 'Append', lambda: Setups.append(1))
+    self.assertEqual(len(Calls), 50)
+    self.assertEqual(len(Setups), 5)
+    self.assertEqual((Result.Name, Result.Number, Result.Runs), ('Append', 10, 3))
+    self.assertLessEqual(Result.Low, Result.Mean)
+    self.assertLessEqual(Result.Mean, Result.High)
+    self.assertLessEqual(Result.Min, Result.Mean)
+    self.assertTrue(gc.isenabled())
+
+  def test_AutoNumber(self):
+    Result = CBenchmark(Warmup = 0, Runs = 2, MinTime = 0.001).Run(lambda: sum(range(100)))
+    self.assertIn(str(Result.Number)[0], '125')
+    self.assertGreater(Result.Number, 1)
+
+  def test_Compare(self):
+    def Fast():
+      pass
+
+    def Slow():
+      sum(range(2000))
+
+    Results = CBenchmark(Warmup = 1, Runs = 5, Number = 200).Compare([Fast, Slow])
+    self.assertEqual([Result.Name for Result in Results], ['Fast', 'Slow'])
+    self.assertIn('slower', ResultString(Results))
+
+  def test_TimersOff(self):
+    Enabled = TimersEnabled()
+    EnableTimers(False)
+    try:
+      Seen = []
+      Result = CBenchmark(Warmup = 0, Runs = 2, Number = 5).Run(lambda: Seen.append(TimersEnabled()))
+      self.assertEqual(Result.Runs, 2)
+      self.assertEqual(Seen, [False] * 10)
+      self.assertFalse(TimersEnabled())
+    finally:
+      EnableTimers(Enabled)
+
+  def test_ZeroMean(self):
+    Zero = _BenchResultDef('Zero', 10, 2, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    Slow = _BenchResultDef('Slow', 10, 2, 1.0, 0.0, 1.0, 1.0, 1.0, 1.0)
+    Lines = ResultString([Zero, Slow, Zero._replace(Name = 'Zero2')]).splitlines()
+    self.assertTrue(Lines[2].endswith('n/a'))
+    self.assertTrue(Lines[3].endswith('same'))
+    self.assertTrue(ResultString([Slow, Zero]).splitlines()[2].endswith('n/a'))
+
+  def test_Format(self):
+    self.assertEqual(FormatMilliseconds(3723004.5), '1h 2m 3s 4.5000ms')
+    self.assertEqual(FormatMilliseconds(0.00125, 5), '0.00125ms')
+
+  def test_Args(self):
+    for Args in ({'Runs': 1}, {'Number': 0}, {'Confidence': 0.5}):
+      with self.assertRaises(AttributeError):
+        CBenchmark(**Args)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,58 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.benchmarks.Suite
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from Libs.Base.benchmarks.Suite import (CompareResults, LoadResults, PrintComparison, SaveResults)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+  def test_Compare(self):
+    Old = {'A': 100.0, 'B': 100.0, 'C': 100.0}
+    New = {'A': 105.0, 'B': 120.0, 'D': 1.0}
+    Lines = CompareResults(Old, New, 0.10)
+    self.assertEqual([Line.Name for Line in Lines], ['A', 'B'])
+    self.assertFalse(Lines[0].Regressed)
+    self.assertTrue(Lines[1].Regressed)
+    self.assertAlmostEqual(Lines[1].Ratio, 1.2)
+
+  def test_CompareSmall(self):
+    Old = {'Zero': 0.0, 'Negative': -0.6, 'Tiny': 0.2, 'Grew': 0.0}
+    New = {'Zero': 0.4, 'Negative': -0.2, 'Tiny': 0.9, 'Grew': 50.0}
+    Lines = {Line.Name: Line for Line in CompareResults(Old, New, 0.10)}
+    self.assertEqual([Name for Name, Line in sorted(Lines.items()) if Line.Regressed], ['Grew'])
+    self.assertIsNone(Lines['Zero'].Ratio)
+    Output = io.StringIO()
+    PrintComparison(list(Lines.values()), Output)
+    self.assertIn('n/a', Output.getvalue())
+
+  def test_SaveLoad(self):
+    with tempfile.TemporaryDirectory() as Dir:
+      FileName = os.path.join(Dir, 'Run.json')
+      SaveResults(FileName, {'A': 1.5})
+      self.assertEqual(LoadResults(FileName), {'A': 1.5})
+
+      with open(FileName, 'w', encoding = 'utf-8') as File:
+        json.dump({'A': 1.5}, File)
+      with self.assertRaises(ValueError):
+        LoadResults(FileName)
+
+
+if __name__ == "__main__":
+  unittest.main()
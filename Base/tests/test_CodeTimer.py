@@ -4,28 +4,130 @@ Author:    donal
 -----------------------------------------------------------------------------
 Description:
 
-  TODO: Write description of unit test
+  Unit tests for Libs.Base.CodeTimer, turning the timers off and on,
+  the resources a CCodeTimer captures and CCaptureTimer.Capture.
 -----------------------------------------------------------------------------
 Update History:
   Date: Jan 29, 2021
     Released
-
+  Date: Oct 18, 2026
+    Replaced the placeholder test with the real ones.
 -----------------------------------------------------------------------------
 ToDo:
 -----------------------------------------------------------------------------
 '''
 
+import tracemalloc
 import unittest
 
-# from Libs.Base.CodeTimer import (CCaptureTimer, CCodeTimer)
+from Libs.Base.CodeTimer import (CCaptureTimer, CCodeTimer, EnableTimers, NullTimer,
+                                 TimersEnabled)
+from Libs.Base.FastTimer import (CFastTimer, CSampledTimer, Timed)
+from Libs.Base.SpanTimer import CSpanTimer
+
+
+class TestEnableTimers(unittest.TestCase):
+
+  def setUp(self):
+    self._Enabled = TimersEnabled()
+
+  def tearDown(self):
+    EnableTimers(self._Enabled)
+
+  def test_Off(self):
+    EnableTimers(False)
+    self.assertFalse(TimersEnabled())
+    with CCodeTimer('Off') as Timer:
+      pass
+    self.assertIs(Timer, NullTimer)
+    Timer.EndTimer()
+    self.assertEqual((Timer.Took, str(Timer)), (0, ''))
+    self.assertIs(CSpanTimer('Off'), NullTimer)
+    self.assertIs(CFastTimer('Off'), NullTimer)
+    self.assertIs(CSampledTimer('Off', Every = 10), NullTimer)
+
+    def Function():
+      return 1
+    self.assertIs(Timed(Function), Function)
+    self.assertIs(Timed('Off', Every = 10)(Function), Function)
+
+  def test_OffRaises(self):
+    EnableTimers(False)
+    with self.assertRaises(ValueError):
+      with CCodeTimer('Off'):
+        raise ValueError('Not swallowed')
+
+  def test_On(self):
+    EnableTimers(True)
+    Timer = CCodeTimer('On')
+    self.assertIsInstance(Timer, CCodeTimer)
+    Timer.EndTimer()
+
+
+class _CCapture(CCaptureTimer):
+
+  def Save(self):
+    self.Saved = True
+
+
+class TestResources(unittest.TestCase):
+
+  def tearDown(self):
+    tracemalloc.stop()
+
+  def test_Resources(self):
+    CaptureTimer = _CCapture()
+    with CCodeTimer('Resources', CaptureTimer, Resources = True) as Timer:
+      Data = [str(i) for i in range(10000)]
+      sum(i * i for i in range(100000))
+    self.assertTrue(CaptureTimer.Saved)
+    self.assertGreater(Timer.CPU, 0)
+    self.assertGreaterEqual(Timer.ThreadCPU, 0)
+    self.assertGreater(Timer.MemoryPeak, 100000)
+    self.assertGreater(Timer.MemoryNet, 100000)
+    self.assertGreaterEqual(Timer.GCCollections, 0)
+    self.assertEqual((CaptureTimer.CPU, CaptureTimer.MemoryPeak), (Timer.CPU, Timer.MemoryPeak))
+    self.assertIn('Memory peak', str(CaptureTimer))
+    del Data
+
+  def test_NoResources(self):
+    CaptureTimer = _CCapture()
+    with CCodeTimer('Plain', CaptureTimer) as Timer:
+      pass
+    self.assertIsNone(Timer.CPU)
+    self.assertIsNone(CaptureTimer.MemoryPeak)
+    self.assertNotIn('CPU', str(Timer))
+
+
+class _CCallCapture(CCaptureTimer):
+
+  def Capture(self, Name, Start, End, Took, Resources):
+    self.Calls = getattr(self, 'Calls', []) + [(Name, Start, End, Took, Resources)]
+
 
+class TestCapture(unittest.TestCase):
 
-class Test(unittest.TestCase):
+  def test_Capture(self):
+    CaptureTimer = _CCallCapture()
+    with CCodeTimer('First', CaptureTimer):
+      pass
+    with CCodeTimer('Second', CaptureTimer):
+      pass
+    self.assertEqual([Call[0] for Call in CaptureTimer.Calls], ['First', 'Second'])
+    for _, Start, End, Took, Resources in CaptureTimer.Calls:
+      self.assertLessEqual(Start, End)
+      self.assertGreaterEqual(Took, 0)
+      self.assertIsNone(Resources)
+    self.assertIsNone(CaptureTimer.Name)
 
-  def testName(self):
-    self.assertEqual(0, 1, "Tests not written")
+  def test_Default(self):
+    CaptureTimer = _CCapture()
+    CaptureTimer.Capture('Direct', 1.0, 3.0, 2.0, None)
+    self.assertTrue(CaptureTimer.Saved)
+    self.assertEqual((CaptureTimer.Name, CaptureTimer.Start, CaptureTimer.End, CaptureTimer.Took),
+                     ('Direct', 1.0, 3.0, 2.0))
+    self.assertIsNone(CaptureTimer.CPU)
 
 
 if __name__ == "__main__":
-  # import sys;sys.argv = ['', 'Test.testName']
   unittest.main()
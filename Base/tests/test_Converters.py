@@ -4,28 +4,109 @@ Author:    Donald W. Long
 -----------------------------------------------------------------------------
 Description:
 
-  TODO: Write description of unit test
+  Unit tests for Libs.Base.Converters, the millisecond converters, their
+  batch forms and CUnitLadder.
 -----------------------------------------------------------------------------
 Update History:
   Date: Jan 29, 2021
     Released
------------------------------------------------------------------------------
-TODO: Write ConvertMillisecondsWeeks
-      Write ConvertMillisecondsDays
+  Date: Oct 18, 2026
+    Replaced the placeholder test with the real ones.
 -----------------------------------------------------------------------------
 '''
 
 import unittest
+from fractions import Fraction
+
+from Libs.Base import Converters
+from Libs.Base.Converters import (ByteUnits, ConvertMillisecondsDays, ConvertMillisecondsDaysBatch,
+                                  ConvertMillisecondsWeeks, ConvertMillisecondsWeeksBatch,
+                                  CUnitLadder, RateUnits, TimeUnits)
+
+_VALUE = ((((1000 * 60) * 60) * 24) * 14 + 6000 + (1000 * 60) * 5 +
+          ((1000 * 60) * 60) * 8 + 566)
+
+
+class TestConverters(unittest.TestCase):
+
+  def test_Scalar(self):
+    self.assertEqual(tuple(ConvertMillisecondsDays(_VALUE)), (14, 8, 5, 6, 566))
+    self.assertEqual(tuple(ConvertMillisecondsWeeks(_VALUE)), (2, 0, 8, 5, 6, 566))
+    self.assertEqual(tuple(ConvertMillisecondsWeeks(_VALUE + 3 * 24 * 60 * 60 * 1000)),
+                     (2, 3, 8, 5, 6, 566))
+    self.assertAlmostEqual(ConvertMillisecondsDays(1500.25).milliseconds, 500.25)
+
+  def test_Batch(self):
+    Values = [0, 999, _VALUE, 1500.25, 7 * 24 * 60 * 60 * 1000, -1500, -1500.25]
+    for Scalar, Batch in ((ConvertMillisecondsDays, ConvertMillisecondsDaysBatch),
+                          (ConvertMillisecondsWeeks, ConvertMillisecondsWeeksBatch)):
+      Rows = Batch(Values)
+      self.assertEqual([tuple(Row) for Row in Rows], [tuple(Scalar(Value)) for Value in Values])
+      Columns = Batch(Values, Columns = True)
+      self.assertEqual(list(Columns.seconds), [Scalar(Value).seconds for Value in Values])
+
+  def test_BatchPython(self):
+    NumPy = Converters.numpy
+    Converters.numpy = None
+    try:
+      self.test_Batch()
+      self.assertEqual(ConvertMillisecondsDaysBatch([], Columns = True).days, [])
+    finally:
+      Converters.numpy = NumPy
+
+
+class TestUnitLadder(unittest.TestCase):
+
+  def test_Convert(self):
+    self.assertEqual(TimeUnits.Convert(1500, 'ms', 's'), 1.5)
+    self.assertEqual(TimeUnits.Convert(2000, 'milliseconds', 'seconds'), 2)
+    self.assertEqual(TimeUnits.Convert(1, 'ns', 's', Exact = True), Fraction(1, 10 ** 9))
+    self.assertEqual(ByteUnits.Convert(1, 'GiB', 'MiB'), 1024)
+    self.assertEqual(RateUnits.Convert(5, '/s', '/m'), 300)
+    self.assertEqual(list(RateUnits.ConvertBatch([1, 2], '/ms', '/s')), [1000, 2000])
+
+  def test_Breakdown(self):
+    self.assertEqual(tuple(TimeUnits.Breakdown(1234567891, 'ns', ('s', 'ms', 'us', 'ns'))),
+                     (1, 234, 567, 891))
+    self.assertEqual(tuple(ByteUnits.Breakdown(5 * 1024 ** 3 + 1536, 'B')), (0, 5, 0, 1, 512))
+    Exact = TimeUnits.Breakdown(Fraction(3, 10), 's', ('s', 'ms'), Exact = True)
+    self.assertEqual(tuple(Exact), (0, 300))
+    self.assertIsInstance(Exact.milliseconds, int)
+    self.assertEqual(tuple(TimeUnits.Breakdown(-1500, 'ms', ('m', 's', 'ms'))), (-1, 58, 500))
+    Columns = TimeUnits.BreakdownBatch([1500, 2.5], 's', ('m', 's', 'ms'), Columns = True)
+    self.assertEqual((list(Columns.minutes), list(Columns.milliseconds)), ([25, 0], [0, 500]))
 
-#from Libs.Base.Converters import (ConvertMillisecondsDays, ConvertMillisecondsWeeks)
+  def test_BreakdownLarge(self):
+      # 10 ** 12 weeks in nanoseconds does not fit in int64.
+    Expected = [(10 ** 12, 0), (5, 0)]
+    Rows = TimeUnits.BreakdownBatch([10 ** 12, 5], 'w', ('w', 'ns'))
+    self.assertEqual([tuple(Row) for Row in Rows], Expected)
+    Columns = TimeUnits.BreakdownBatch([10 ** 12, 5], 'w', ('w', 'ns'), Columns = True)
+    self.assertEqual(list(Columns.weeks), [10 ** 12, 5])
 
+  def test_ConvertLarge(self):
+      # 10 ** 6 weeks in nanoseconds does not fit in int64.
+    Values = [10 ** 6, -10 ** 6, 3]
+    Expected = [TimeUnits.Convert(Value, 'w', 'ns') for Value in Values]
+    self.assertEqual(list(TimeUnits.ConvertBatch(Values, 'w', 'ns')), Expected)
+    self.assertEqual(list(TimeUnits.ConvertBatch(Values, 'w', 'ms')),
+                     [TimeUnits.Convert(Value, 'w', 'ms') for Value in Values])
 
-class Test(unittest.TestCase):
+  def test_BreakdownFunction(self):
+    Function = TimeUnits.BreakdownFunction('ms', ('d', 'h', 'm', 's', 'ms'))
+    self.assertEqual(Function(_VALUE), ConvertMillisecondsDays(_VALUE))
+    self.assertIs(Function, TimeUnits.BreakdownFunction('ms', ('d', 'h', 'm', 's', 'ms')))
 
-  def testName(self):
-    self.assertEqual(0, 1, "Tests not written")
+  def test_Errors(self):
+    with self.assertRaises(AttributeError):
+      TimeUnits.Convert(1, 'x', 's')
+    with self.assertRaises(AttributeError):
+      TimeUnits.Breakdown(1, 's', ('s', 'm'))
+    with self.assertRaises(AttributeError):
+      CUnitLadder([('half', 'h', 0.5)])
+    with self.assertRaises(AttributeError):
+      CUnitLadder([('one', 'x', 1), ('two', 'x', 2)])
 
 
 if __name__ == "__main__":
-  # import sys;sys.argv = ['', 'Test.testName']
   unittest.main()
@@ -0,0 +1,320 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.DoubleLinkedList
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import unittest
+
+from Libs.Base.DoubleLinkedList import (DLinkType, DLinkOverflow, DLinkOverflowError,
+                                        CDoubleLinkedList, CNode, CSlotNode)
+
+
+def _Values(DList):
+  return [Node.UserData for Node in DList]
+
+
+class TestDoubleLinkedList(unittest.TestCase):
+
+  def test_FIFO(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+    for i in range(5):
+      DList.Push(i)
+    self.assertEqual(DList.Count, 5)
+    self.assertEqual(_Values(DList), [0, 1, 2, 3, 4])
+    self.assertEqual(DList.Pop().UserData, 0)
+    self.assertEqual(DList.PopBottom().UserData, 4)
+    self.assertEqual(_Values(DList), [1, 2, 3])
+
+  def test_LIFO(self):
+    DList = CDoubleLinkedList(DLinkType.LIFO)
+    for i in range(5):
+      DList.Push(i)
+    self.assertEqual(_Values(DList), [4, 3, 2, 1, 0])
+    self.assertEqual(DList.Pop().UserData, 4)
+
+  def test_PushTop(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+    DList.Push(1)
+    DList.PushTop(0)
+    self.assertEqual(_Values(DList), [0, 1])
+
+  def test_BadType(self):
+    with self.assertRaises(AttributeError):
+      CDoubleLinkedList(1)
+
+  def test_IsNode(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+    Other = CDoubleLinkedList(DLinkType.FIFO)
+    Node = DList.Push(1)
+    OtherNode = Other.Push(1)
+    self.assertIs(DList.IsNode(Node), Node)
+    self.assertIsNone(DList.IsNode(OtherNode))
+    self.assertIsNone(DList.IsNode(CNode(1)))
+    self.assertIsNone(DList.IsNode(None))
+    DList.Pop()
+    self.assertIsNone(DList.IsNode(Node))
+
+  def test_PopNode(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+    Nodes = [DList.Push(i) for i in range(5)]
+    self.assertIs(DList.PopNode(Nodes[2]), Nodes[2])
+    self.assertIsNone(DList.PopNode(Nodes[2]))
+    self.assertIsNone(Nodes[2].Prev)
+    self.assertIsNone(Nodes[2].Next)
+    self.assertIs(DList.PopNode(Nodes[0]), Nodes[0])
+    self.assertIs(DList.PopNode(Nodes[4]), Nodes[4])
+    self.assertEqual(_Values(DList), [1, 3])
+    self.assertEqual(DList.Count, 2)
+
+  def test_PushBeforeNode(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+    Nodes = [DList.Push(i) for i in range(3)]
+    DList.PushBeforeUserData(Nodes[1], 'a')
+    self.assertEqual(_Values(DList), [0, 'a', 1, 2])
+    DList.PushBeforeUserData(Nodes[0], 'b')
+    self.assertEqual(_Values(DList), ['b', 0, 'a', 1, 2])
+    self.assertIsNone(DList.PushBeforeUserData(CNode(9), 'c'))
+    self.assertEqual(DList.Count, 5)
+
+  def test_NestedIteration(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+    for i in range(3):
+      DList.Push(i)
+    Pairs = [(Outer.UserData, Inner.UserData) for Outer in DList for Inner in DList]
+    self.assertEqual(len(Pairs), 9)
+    self.assertEqual(Pairs[-1], (2, 2))
+
+  def test_Reversed(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+    self.assertEqual(list(reversed(DList)), [])
+    for i in range(4):
+      DList.Push(i)
+    self.assertEqual([Node.UserData for Node in reversed(DList)], [3, 2, 1, 0])
+
+  def test_PopWhileIterating(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+    for i in range(6):
+      DList.Push(i)
+    for Node in DList:
+      if Node.UserData % 2:
+        DList.PopNode(Node)
+    self.assertEqual(_Values(DList), [0, 2, 4])
+
+  def test_IsNodeInsideLoop(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+    Nodes = [DList.Push(i) for i in range(3)]
+    Seen = []
+    for Node in DList:
+      DList.IsNode(Nodes[0])
+      Seen.append(Node.UserData)
+    self.assertEqual(Seen, [0, 1, 2])
+
+  def test_SlotNode(self):
+    DList = CDoubleLinkedList(DLinkType.LIFO, CSlotNode)
+    Nodes = [DList.Push(i) for i in range(4)]
+    self.assertIsInstance(Nodes[0], CSlotNode)
+    self.assertFalse(hasattr(Nodes[0], '__dict__'))
+    self.assertIs(DList.PopNode(Nodes[1]), Nodes[1])
+    DList.PushBeforeNode(Nodes[0], Nodes[1])
+    self.assertEqual(_Values(DList), [3, 2, 1, 0])
+    self.assertIs(DList.NodeClass, CSlotNode)
+
+  def test_BadNodeClass(self):
+    with self.assertRaises(AttributeError):
+      CDoubleLinkedList(DLinkType.FIFO, dict)
+
+  def test_PushMany(self):
+    for Type in DLinkType:
+      Single = CDoubleLinkedList(Type)
+      Bulk = CDoubleLinkedList(Type)
+      for i in range(3):
+        Single.Push(i)
+      Bulk.Push(0)
+      self.assertEqual(Bulk.PushMany(range(1, 3)), 2)
+      self.assertEqual(_Values(Bulk), _Values(Single))
+      self.assertEqual(Bulk.PushMany([]), 0)
+      self.assertEqual(Bulk.Count, 3)
+      self.assertEqual([Node.UserData for Node in reversed(Bulk)],
+                       list(reversed(_Values(Single))))
+
+  def test_PushManyRaises(self):
+    def Nodes(Taken):
+      for i in range(3):
+        Node = CNode(i)
+        Taken.append(Node)
+        yield Node
+      raise ValueError('Stop')
+
+    for Type in DLinkType:
+      DList = CDoubleLinkedList(Type)
+      DList.Push('a')
+      Taken = []
+      with self.assertRaises(ValueError):
+        DList.PushManyNodes(Nodes(Taken))
+      self.assertEqual(len(Taken), 3)
+      for Node in Taken:
+        self.assertIsNone(DList.IsNode(Node))
+        self.assertIsNone(DList.PopNode(Node))
+      self.assertEqual((_Values(DList), DList.Count), (['a'], 1))
+      self.assertEqual(DList.PushManyNodes(Taken), 3)
+      self.assertTrue(all(DList.IsNode(Node) for Node in Taken))
+      self.assertEqual(DList.Count, 4)
+
+  def test_PopMany(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+    DList.PushMany(range(5))
+    Nodes = DList.PopMany(2)
+    self.assertEqual([Node.UserData for Node in Nodes], [0, 1])
+    self.assertIsNone(DList.IsNode(Nodes[0]))
+    self.assertIsNone(Nodes[1].Next)
+    self.assertEqual(_Values(DList), [2, 3, 4])
+    self.assertEqual([Node.UserData for Node in DList.PopMany(10)], [2, 3, 4])
+    self.assertEqual(DList.Count, 0)
+    self.assertEqual(DList.PopMany(1), [])
+
+  def test_Splice(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+    Other = CDoubleLinkedList(DLinkType.FIFO)
+    DList.PushMany(range(2))
+    Moved = [Other.Push(i) for i in range(2, 4)]
+    self.assertEqual(DList.Splice(Other), 2)
+    self.assertEqual(_Values(DList), [0, 1, 2, 3])
+    self.assertEqual(Other.Count, 0)
+    self.assertIs(DList.IsNode(Moved[0]), Moved[0])
+    self.assertIsNone(Other.IsNode(Moved[0]))
+    self.assertIs(DList.PopNode(Moved[1]), Moved[1])
+
+      # Splice again, the nodes must follow the forwards
+    Last = CDoubleLinkedList(DLinkType.LIFO)
+    Last.Push('x')
+    Last.Splice(DList)
+    self.assertEqual(_Values(Last), [0, 1, 2, 'x'])
+    self.assertIs(Last.IsNode(Moved[0]), Moved[0])
+    self.assertIsNone(DList.IsNode(Moved[0]))
+    self.assertEqual(Other.PushMany(['y']), 1)
+    self.assertEqual(_Values(Other), ['y'])
+
+  def test_SpliceBad(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO)
+    with self.assertRaises(AttributeError):
+      DList.Splice(DList)
+    with self.assertRaises(AttributeError):
+      DList.Splice([])
+
+  def test_DropOldest(self):
+    for Type, Expected in ((DLinkType.FIFO, [2, 3, 4]), (DLinkType.LIFO, [4, 3, 2])):
+      DList = CDoubleLinkedList(Type, MaxCount = 3)
+      for i in range(5):
+        DList.Push(i)
+      self.assertEqual(_Values(DList), Expected)
+      self.assertEqual(DList.Dropped, 2)
+
+  def test_DropNewest(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO, MaxCount = 2, Overflow = DLinkOverflow.DROPNEWEST)
+    self.assertEqual(DList.PushMany(range(4)), 2)
+    self.assertIsNone(DList.Push(9))
+    self.assertEqual(_Values(DList), [0, 1])
+    self.assertEqual(DList.Dropped, 3)
+
+  def test_Raise(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO, MaxCount = 1, Overflow = DLinkOverflow.RAISE)
+    DList.Push(0)
+    with self.assertRaises(DLinkOverflowError):
+      DList.Push(1)
+    Other = CDoubleLinkedList(DLinkType.FIFO)
+    Other.Push(1)
+    with self.assertRaises(DLinkOverflowError):
+      DList.Splice(Other)
+    self.assertEqual(Other.Count, 1)
+
+  def test_SpliceOverflow(self):
+    for Type, Expected in ((DLinkType.FIFO, [2, 3, 4]), (DLinkType.LIFO, [1, 2, 3])):
+      DList = CDoubleLinkedList(Type, MaxCount = 3)
+      Other = CDoubleLinkedList(Type)
+      DList.Push(0)
+      Other.PushMany([1, 2, 3, 4] if Type == DLinkType.FIFO else [4, 3, 2, 1])
+      self.assertEqual(DList.Splice(Other), 4)
+      self.assertEqual(_Values(DList), Expected)
+      self.assertEqual(Other.Count, 0)
+
+  def test_SpliceOverflowKeys(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO, MaxCount = 3, KeyFunc = lambda UserData: UserData)
+    DList.PushMany([1, 2])
+    Other = CDoubleLinkedList(DLinkType.FIFO)
+    Other.PushMany([3, 4, 2])
+    with self.assertRaises(KeyError):
+      DList.Splice(Other)
+    self.assertEqual((_Values(DList), _Values(Other)), ([1, 2], [3, 4, 2]))
+
+  def test_BadMaxCount(self):
+    with self.assertRaises(AttributeError):
+      CDoubleLinkedList(DLinkType.FIFO, MaxCount = 0)
+    with self.assertRaises(AttributeError):
+      CDoubleLinkedList(DLinkType.FIFO, MaxCount = 1, Overflow = DLinkOverflow.BLOCK)
+
+  def test_Keys(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO, KeyFunc = lambda UserData: UserData[0])
+    DList.PushMany([('a', 1), ('b', 2), ('c', 3)])
+    DList.PushTop(('z', 0))
+    self.assertEqual(DList.FindByKey('b').UserData, ('b', 2))
+    self.assertIsNone(DList.FindByKey('x'))
+    with self.assertRaises(KeyError):
+      DList.Push(('a', 9))
+    self.assertEqual(DList.Count, 4)
+
+    self.assertEqual(DList.MoveToTop('c').UserData, ('c', 3))
+    self.assertEqual([Node.UserData[0] for Node in DList], ['c', 'z', 'a', 'b'])
+    self.assertEqual([Node.UserData[0] for Node in reversed(DList)], ['b', 'a', 'z', 'c'])
+
+    self.assertEqual(DList.PopByKey('z').UserData, ('z', 0))
+    self.assertIsNone(DList.PopByKey('z'))
+    DList.Pop()
+    DList.PopBottom()
+    self.assertIsNone(DList.FindByKey('c'))
+    self.assertIsNone(DList.FindByKey('b'))
+    DList.PopMany(1)
+    self.assertIsNone(DList.FindByKey('a'))
+    self.assertEqual(DList._Index, {})
+
+  def test_KeysPushBefore(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO, KeyFunc = str)
+    Node = DList.Push(1)
+    DList.PushBeforeUserData(Node, 0)
+    self.assertIs(DList.FindByKey('0'), Node.Prev)
+    with self.assertRaises(KeyError):
+      DList.PushBeforeUserData(Node, 0)
+
+  def test_KeysOverflow(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO, MaxCount = 2, KeyFunc = str)
+    DList.PushMany(range(3))
+    self.assertIsNone(DList.FindByKey('0'))
+    self.assertEqual(DList.FindByKey('2').UserData, 2)
+
+  def test_KeysSplice(self):
+    DList = CDoubleLinkedList(DLinkType.FIFO, KeyFunc = str)
+    Other = CDoubleLinkedList(DLinkType.FIFO)
+    DList.Push(0)
+    Other.PushMany([0, 1])
+    with self.assertRaises(KeyError):
+      DList.Splice(Other)
+    self.assertEqual(Other.Count, 2)
+    Other.Pop()
+    DList.Splice(Other)
+    self.assertEqual(DList.FindByKey('1').UserData, 1)
+
+  def test_NoKeyFunc(self):
+    with self.assertRaises(AttributeError):
+      CDoubleLinkedList(DLinkType.FIFO).FindByKey(1)
+
+
+if __name__ == "__main__":
+  unittest.main()
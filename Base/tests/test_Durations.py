@@ -0,0 +1,63 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.Durations
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import io
+import unittest
+
+from Libs.Base.CodeTimer import CCaptureTimer
+from Libs.Base.Durations import (FormatDuration, FormatDurations, ParseDuration,
+                                 ParseTimerLines)
+
+
+class TestDurations(unittest.TestCase):
+
+  def test_Parse(self):
+    self.assertEqual(ParseDuration('1d 2h 3m 4s 5ms'), 93784005)
+    self.assertEqual(ParseDuration(' 90 s '), 90000)
+    self.assertEqual(ParseDuration('1.5h'), 5400000.0)
+    self.assertEqual(ParseDuration('-2m'), -120000)
+    self.assertEqual(ParseDuration('1w 0.25ms'), 604800000.25)
+    for Text in ('', '5', '-', 'x', '1s 2d', '3mm'):
+      with self.assertRaises(ValueError):
+        ParseDuration(Text)
+
+  def test_Format(self):
+    self.assertEqual(FormatDuration(93784005), '1d 2h 3m 4s 5ms')
+    self.assertEqual(FormatDuration(-1500, '{s}s'), '-1.5s')
+    self.assertEqual(FormatDuration(3723000, '{h:02}:{m:02}:{s:02}'), '01:02:03')
+    self.assertEqual(FormatDuration(1209600000 + 1, '{w}w {d}d {ms}ms'), '2w 0d 1ms')
+    self.assertEqual(list(FormatDurations([1000, 60000], '{m}m {s}s')), ['0m 1s', '1m 0s'])
+    with self.assertRaises(AttributeError):
+      FormatDuration(1, '{x}')
+    with self.assertRaises(AttributeError):
+      FormatDuration(1, 'no fields')
+
+  def test_RoundTrip(self):
+    for Value in (0, 1, 999, 93784005, 90061001.123, 1234567890.5):
+      self.assertAlmostEqual(ParseDuration(FormatDuration(Value)), Value, places = 6)
+
+  def test_TimerLines(self):
+    CaptureTimer = CCaptureTimer()
+    CaptureTimer.Name = 'Block'
+    CaptureTimer.Took = 90061001.123
+    Log = io.StringIO(str(CaptureTimer) + '\nNot a timer\n' +
+                      'Code Block "Other" took: 0d 0h 0m 0s 0.5ms CPU: 0.4ms\n')
+    Lines = list(ParseTimerLines(Log))
+    self.assertEqual([Line.Name for Line in Lines], ['Block', 'Other'])
+    self.assertAlmostEqual(Lines[0].Took, 90061001.123, places = 6)
+    self.assertEqual(Lines[1].Took, 0.5)
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,115 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.FastTimer
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import time
+import unittest
+
+from Libs.Base import FastTimer
+from Libs.Base.FastTimer import (CFastTimer, CSampledTimer, Timed, Calibrate)
+from Libs.Base.TimerStats import (CTimerRegistry, TimerRegistry)
+
+
+class TestFastTimer(unittest.TestCase):
+
+  def test_Context(self):
+    Registry = CTimerRegistry()
+    Timer = CFastTimer('Sleep', Registry)
+    for _ in range(2):
+      with Timer:
+        time.sleep(0.002)
+    self.assertIsInstance(Timer.Took, int)
+    self.assertGreaterEqual(Timer.Took, 2000000)
+    Stats = Registry.Get('Sleep')
+    self.assertEqual(Stats.Count, 2)
+    self.assertGreaterEqual(Stats.Min, 2.0)
+
+  def test_NoName(self):
+    Registry = CTimerRegistry()
+    with CFastTimer(None, Registry) as Timer:
+      pass
+    self.assertGreaterEqual(Timer.Took, 0)
+    self.assertEqual(Registry.Names, [])
+
+  def test_Timed(self):
+    Registry = CTimerRegistry()
+
+    @Timed(Registry = Registry)
+    def Add(a, b):
+      return a + b
+
+    @Timed('Fail', Registry)
+    def Fail():
+      raise ValueError('Fail')
+
+    self.assertEqual(Add(1, 2), 3)
+    self.assertEqual(Add.__name__, 'Add')
+    with self.assertRaises(ValueError):
+      Fail()
+    self.assertEqual(Registry.Names, ['Fail', 'TestFastTimer.test_Timed.<locals>.Add'])
+
+  def test_TimedBare(self):
+    @Timed
+    def Bare():
+      return 1
+
+    Bare()
+    Name = 'TestFastTimer.test_TimedBare.<locals>.Bare'
+    self.assertEqual(TimerRegistry.Get(Name).Count, 1)
+    TimerRegistry.Reset(Name)
+
+  def test_SampledEvery(self):
+    Registry = CTimerRegistry()
+    Timer = CSampledTimer('Every', Registry, Every = 10)
+
+    @Timed('Function', Registry, Every = 5)
+    def Function():
+      return 1
+
+    for _ in range(100):
+      with Timer:
+        Function()
+    for Name, Samples in (('Every', 10), ('Function', 20)):
+      Stats = Registry.Get(Name)
+      self.assertEqual((Stats.Samples, Stats.Count), (Samples, 100))
+
+  def test_SampledRate(self):
+    Registry = CTimerRegistry()
+    Timer = CSampledTimer('Rate', Registry, Rate = 0.1)
+    for _ in range(20000):
+      with Timer:
+        pass
+    Stats = Registry.Get('Rate')
+    self.assertLess(abs(Stats.Count - 20000), 2000)
+    self.assertLess(abs(Stats.Samples - 2000), 200)
+
+  def test_SampledArgs(self):
+    for Every, Rate in ((None, None), (10, 0.5), (0, None), (None, 0), (None, 1.5)):
+      with self.assertRaises(AttributeError):
+        CSampledTimer('Bad', Every = Every, Rate = Rate)
+
+  def test_Calibrate(self):
+    Context, Decorator = Calibrate(100, 2)
+    self.assertGreater(Context, 0)
+    self.assertGreater(Decorator, 0)
+
+  def test_CalibrateOnFirstUse(self):
+    FastTimer._Calibrated = False
+    FastTimer.ContextOverhead = FastTimer.DecoratorOverhead = 0
+    Timed(lambda: None)
+    self.assertTrue(FastTimer._Calibrated)
+    self.assertGreater(FastTimer.DecoratorOverhead, 0)
+
+
+if __name__ == "__main__":
+  unittest.main()
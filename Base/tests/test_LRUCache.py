@@ -0,0 +1,147 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.LRUCache
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import unittest
+
+from Libs.Base.LRUCache import (CLRUCache, LRUMemoize)
+
+
+class CFakeTimer:
+
+  def __init__(self):
+    self.Now = 0.0
+
+  def __call__(self):
+    return self.Now
+
+
+class TestLRUCache(unittest.TestCase):
+
+  def test_Evict(self):
+    Cache = CLRUCache(MaxSize = 2)
+    Cache.Put('a', 1)
+    Cache.Put('b', 2)
+    self.assertEqual(Cache.Get('a'), 1)
+    Cache.Put('c', 3)
+    self.assertNotIn('b', Cache)
+    self.assertIn('a', Cache)
+    self.assertEqual(len(Cache), 2)
+    self.assertEqual(Cache.Stats.Evictions, 1)
+
+  def test_Counters(self):
+    Cache = CLRUCache()
+    Cache.Put('a', 1)
+    Cache.Get('a')
+    Cache.Get('b')
+    self.assertEqual((Cache.Hits, Cache.Misses), (1, 1))
+    self.assertEqual(Cache.Get('b', 'x'), 'x')
+
+  def test_Replace(self):
+    Cache = CLRUCache(MaxSize = 2)
+    Cache.Put('a', 1)
+    Cache.Put('b', 2)
+    Cache.Put('a', 3)
+    Cache.Put('c', 4)
+    self.assertEqual(Cache.Get('a'), 3)
+    self.assertNotIn('b', Cache)
+
+  def test_Touch(self):
+    Cache = CLRUCache(MaxSize = 2)
+    Cache.Put('a', 1)
+    Cache.Put('b', 2)
+    self.assertTrue(Cache.Touch('a'))
+    self.assertFalse(Cache.Touch('z'))
+    Cache.Put('c', 3)
+    self.assertIn('a', Cache)
+    self.assertEqual(Cache.Hits, 0)
+
+  def test_Pop(self):
+    Cache = CLRUCache()
+    Cache.Put('a', 1)
+    self.assertEqual(Cache.Pop('a'), 1)
+    self.assertIsNone(Cache.Pop('a'))
+    self.assertEqual(Cache.Count, 0)
+
+  def test_TTL(self):
+    Timer = CFakeTimer()
+    Cache = CLRUCache(TTL = 10, Timer = Timer)
+    Cache.Put('a', 1)
+    Timer.Now = 5
+    Cache.Put('b', 2)
+    self.assertEqual(Cache.Get('a'), 1)
+    Timer.Now = 10
+    self.assertIsNone(Cache.Get('a'))
+    self.assertEqual(Cache.Expirations, 1)
+    Timer.Now = 20
+    self.assertEqual(Cache.Expire(), 1)
+    self.assertEqual(Cache.Count, 0)
+
+  def test_TTLPop(self):
+    Timer = CFakeTimer()
+    Cache = CLRUCache(TTL = 10, Timer = Timer)
+    Cache.Put('a', 1)
+    Cache.Put('b', 2)
+    Cache.Put('c', 3)
+    Timer.Now = 9
+    self.assertEqual(Cache.Pop('a'), 1)
+    Timer.Now = 10
+    self.assertEqual(Cache.Pop('b', 'x'), 'x')
+    self.assertFalse(Cache.Touch('c'))
+    self.assertEqual((Cache.Expirations, Cache.Count, Cache.Weight), (2, 0, 0))
+    self.assertEqual((Cache.Hits, Cache.Misses), (0, 0))
+
+  def test_Weight(self):
+    Cache = CLRUCache(MaxSize = None, MaxWeight = 10, Weigher = lambda Key, Value: len(Value))
+    Cache.Put('a', 'xxxx')
+    Cache.Put('b', 'xxxx')
+    Cache.Put('c', 'xxxx')
+    self.assertNotIn('a', Cache)
+    self.assertEqual(Cache.Weight, 8)
+    with self.assertRaises(AttributeError):
+      Cache.Put('d', 'x' * 11)
+
+  def test_BadArgs(self):
+    with self.assertRaises(AttributeError):
+      CLRUCache(MaxSize = 0)
+
+  def test_Memoize(self):
+    Calls = []
+
+    @LRUMemoize(MaxSize = 2)
+    def Square(x, Scale = 1):
+      Calls.append(x)
+      return x * x * Scale
+
+    self.assertEqual(Square(3), 9)
+    self.assertEqual(Square(3), 9)
+    self.assertEqual(Square(3, Scale = 2), 18)
+    self.assertEqual(Calls, [3, 3])
+    self.assertEqual(Square.Cache.Hits, 1)
+    self.assertEqual(Square.__name__, 'Square')
+
+  def test_MemoizeKeys(self):
+    @LRUMemoize()
+    def Echo(*args, **kwargs):
+      return args, kwargs
+
+      # A positional tuple that looks like the old keyword key.
+    self.assertEqual(Echo((1,), (('Scale', 2),)), (((1,), (('Scale', 2),)), {}))
+    self.assertEqual(Echo(1, Scale = 2), ((1,), {'Scale': 2}))
+      # The keyword arguments are kept in the order they are passed.
+    self.assertEqual(Echo(a = 1, b = 'x'), ((), {'a': 1, 'b': 'x'}))
+    self.assertEqual(Echo(b = None, a = 1), ((), {'b': None, 'a': 1}))
+
+
+if __name__ == "__main__":
+  unittest.main()
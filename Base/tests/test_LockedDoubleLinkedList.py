@@ -0,0 +1,191 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.LockedDoubleLinkedList
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import asyncio
+import threading
+import time
+import unittest
+
+from Libs.Base.DoubleLinkedList import (CDoubleLinkedList, DLinkType, DLinkOverflow)
+from Libs.Base.LockedDoubleLinkedList import (CLockedDoubleLinkedList, CAsyncDoubleLinkedList)
+
+
+class TestLockedDoubleLinkedList(unittest.TestCase):
+
+  def test_Order(self):
+    for Type, Expected in ((DLinkType.FIFO, [0, 1, 2]), (DLinkType.LIFO, [2, 1, 0])):
+      DList = CLockedDoubleLinkedList(Type)
+      DList.PushMany(range(3))
+      self.assertEqual([DList.Pop().UserData for _ in range(3)], Expected)
+
+  def test_Timeout(self):
+    DList = CLockedDoubleLinkedList(DLinkType.FIFO)
+    self.assertIsNone(DList.Pop(Timeout = 0.01))
+    self.assertIsNone(DList.Pop(Block = False))
+
+  def test_Wakeup(self):
+    DList = CLockedDoubleLinkedList(DLinkType.FIFO)
+    Results = []
+    Consumers = [threading.Thread(target = lambda: Results.append(DList.Pop(Timeout = 5).UserData))
+                 for _ in range(4)]
+    for Consumer in Consumers:
+      Consumer.start()
+    DList.PushMany(range(2))
+    DList.Push(2)
+    DList.PushTop(3)
+    for Consumer in Consumers:
+      Consumer.join()
+    self.assertEqual(sorted(Results), [0, 1, 2, 3])
+
+  def test_ManyProducers(self):
+    DList = CLockedDoubleLinkedList(DLinkType.FIFO)
+    Producers = [threading.Thread(target = lambda: [DList.Push(i) for i in range(1000)])
+                 for _ in range(4)]
+    for Producer in Producers:
+      Producer.start()
+    Total = 0
+    for _ in range(4000):
+      Total += DList.Pop(Timeout = 5).UserData
+    for Producer in Producers:
+      Producer.join()
+    self.assertEqual(Total, 4 * sum(range(1000)))
+    self.assertEqual(DList.Count, 0)
+
+  def test_Block(self):
+    DList = CLockedDoubleLinkedList(DLinkType.FIFO, MaxCount = 2, Overflow = DLinkOverflow.BLOCK)
+    Producer = threading.Thread(target = lambda: DList.PushMany(range(10)))
+    Producer.start()
+    Results = [DList.Pop(Timeout = 5).UserData for _ in range(10)]
+    Producer.join()
+    self.assertEqual(Results, list(range(10)))
+    self.assertEqual(DList.Dropped, 0)
+
+  def test_BlockKey(self):
+    DList = CLockedDoubleLinkedList(DLinkType.FIFO, MaxCount = 2, Overflow = DLinkOverflow.BLOCK,
+                                    KeyFunc = lambda UserData: UserData)
+    DList.PushMany(['x', 'y'])
+    Errors = []
+
+    def Push():
+      try:
+        DList.Push('k')
+      except KeyError:
+        Errors.append('k')
+
+    Producers = [threading.Thread(target = Push) for _ in range(2)]
+    for Producer in Producers:
+      Producer.start()
+    while True:
+      with DList.Lock:
+        if len(DList._NotFull._waiters) == 2:  # pylint: disable=protected-access
+          break
+      time.sleep(0.001)
+
+    self.assertEqual(DList.Pop(Timeout = 5).UserData, 'x')
+    self.assertEqual(DList.Pop(Timeout = 5).UserData, 'y')
+    for Producer in Producers:
+      Producer.join(5)
+    self.assertEqual(Errors, ['k'])
+    self.assertEqual([Node.UserData for Node in DList], ['k'])
+    self.assertIs(DList.FindByKey('k'), DList.Pop(Block = False))
+    self.assertEqual(DList.Count, 0)
+
+  def test_DropNewest(self):
+    DList = CLockedDoubleLinkedList(DLinkType.FIFO, MaxCount = 3, Overflow = DLinkOverflow.DROPNEWEST)
+    self.assertEqual(DList.PushMany(range(3)), 3)
+    self.assertIsNone(DList.Push(3))
+    self.assertIsNone(DList.PushTop(3))
+    self.assertEqual(DList.PushMany([4, 5]), 0)
+    self.assertEqual((DList.Count, DList.Dropped), (3, 4))
+    self.assertEqual([DList.Pop(Block = False).UserData for _ in range(3)], [0, 1, 2])
+    self.assertIsNone(DList.Pop(Timeout = 0.01))
+
+
+class _CCountedList(CLockedDoubleLinkedList):
+
+  def __init__(self, *Args, **KWArgs):
+    CLockedDoubleLinkedList.__init__(self, *Args, **KWArgs)
+    self.Pushes = self.Pops = 0
+
+  def _Pushed(self, Count):
+    self.Pushes += Count
+    CLockedDoubleLinkedList._Pushed(self, Count)
+
+  def _Popped(self, Count):
+    self.Pops += Count
+    CLockedDoubleLinkedList._Popped(self, Count)
+
+
+class TestSpliceWakeups(unittest.TestCase):
+
+  def test_Splice(self):
+      # The first fits and is moved in one go, the second does not fit
+      # in MaxCount and is moved one node at a time.
+    for MaxCount in (None, 3):
+      for Type in (DLinkType.FIFO, DLinkType.LIFO):
+        DList = _CCountedList(Type, MaxCount = MaxCount)
+        DList.PushMany(range(2))
+        Other = _CCountedList(Type)
+        Other.PushMany(range(3))
+        DList.Pushes = Other.Pops = 0
+        self.assertEqual(DList.Splice(Other), 3)
+        self.assertEqual((DList.Pushes, Other.Pops), (3, 3))
+
+    DList = _CCountedList(DLinkType.FIFO, MaxCount = 3)
+    DList.PushMany(range(2))
+    Other = CDoubleLinkedList(DLinkType.FIFO)
+    Other.PushMany(range(3))
+    DList.Pushes = 0
+    self.assertEqual(DList.Splice(Other), 3)
+    self.assertEqual(DList.Pushes, 3)
+
+
+class TestAsyncDoubleLinkedList(unittest.TestCase):
+
+  def test_Pop(self):
+    DList = CAsyncDoubleLinkedList(DLinkType.LIFO)
+
+    async def Run():
+      Task = asyncio.ensure_future(DList.Pop(Timeout = 5))
+      await asyncio.sleep(0)
+      Thread = threading.Thread(target = DList.Push, args = ('a',))
+      Thread.start()
+      Node = await Task
+      Thread.join()
+      return Node.UserData
+
+    self.assertEqual(asyncio.run(Run()), 'a')
+
+  def test_Timeout(self):
+    DList = CAsyncDoubleLinkedList(DLinkType.FIFO)
+    self.assertIsNone(asyncio.run(DList.Pop(Timeout = 0.01)))
+    self.assertEqual(len(DList._Waiters), 0)
+
+  def test_Cancel(self):
+    DList = CAsyncDoubleLinkedList(DLinkType.FIFO)
+
+    async def Run():
+      Task = asyncio.ensure_future(DList.Pop())
+      await asyncio.sleep(0)
+      Task.cancel()
+      with self.assertRaises(asyncio.CancelledError):
+        await Task
+      DList.Push(1)
+      return (await DList.Pop(Timeout = 1)).UserData
+
+    self.assertEqual(asyncio.run(Run()), 1)
+
+
+if __name__ == "__main__":
+  unittest.main()
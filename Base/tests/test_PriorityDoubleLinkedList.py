@@ -0,0 +1,123 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.PriorityDoubleLinkedList
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import random
+import unittest
+
+from Libs.Base.DoubleLinkedList import (DLinkType, CDoubleLinkedList, CSlotNode)
+from Libs.Base.PriorityDoubleLinkedList import CPriorityDoubleLinkedList
+
+
+def _Values(DList):
+  return [Node.UserData for Node in DList]
+
+
+class TestPriorityDoubleLinkedList(unittest.TestCase):
+
+  def test_Order(self):
+    DList = CPriorityDoubleLinkedList(DLinkType.FIFO, lambda UserData: UserData, CSlotNode)
+    Values = list(range(500))
+    random.Random(1).shuffle(Values)
+    DList.PushMany(Values)
+    self.assertEqual(_Values(DList), list(range(500)))
+    self.assertEqual([DList.Pop().UserData for _ in range(3)], [0, 1, 2])
+    self.assertEqual(DList.PopBottom().UserData, 499)
+
+  def test_Ties(self):
+    for Type, Expected in ((DLinkType.FIFO, ['a', 'b', 'c']), (DLinkType.LIFO, ['c', 'b', 'a'])):
+      DList = CPriorityDoubleLinkedList(Type, lambda UserData: UserData[0])
+      DList.Push((2, 'z'))
+      for Name in 'abc':
+        DList.Push((1, Name))
+      DList.Push((0, 'y'))
+      self.assertEqual([UserData[1] for UserData in _Values(DList)], ['y'] + Expected + ['z'])
+
+  def test_PopNode(self):
+    DList = CPriorityDoubleLinkedList(DLinkType.FIFO, lambda UserData: UserData)
+    Nodes = {Value: DList.Push(Value) for Value in (5, 1, 3, 4, 2)}
+    self.assertIs(DList.PopNode(Nodes[3]), Nodes[3])
+    self.assertIs(DList.PopNode(Nodes[1]), Nodes[1])
+    DList.Push(3)
+    DList.Push(0)
+    self.assertEqual(_Values(DList), [0, 2, 3, 4, 5])
+    self.assertEqual([Node.UserData for Node in DList.PopMany(2)], [0, 2])
+    DList.Push(1)
+    self.assertEqual(_Values(DList), [1, 3, 4, 5])
+    self.assertEqual(len(DList._Towers), 4)
+
+  def test_Random(self):
+    Rand = random.Random(7)
+    DList = CPriorityDoubleLinkedList(DLinkType.FIFO, lambda UserData: UserData)
+    Nodes = []
+    for _ in range(2000):
+      if Nodes and Rand.random() < 0.4:
+        Node = Nodes.pop(Rand.randrange(len(Nodes)))
+        self.assertIs(DList.PopNode(Node), Node)
+      else:
+        Nodes.append(DList.Push(Rand.randrange(100)))
+    self.assertEqual(_Values(DList), sorted(Node.UserData for Node in Nodes))
+
+  def test_Overflow(self):
+    DList = CPriorityDoubleLinkedList(DLinkType.FIFO, lambda UserData: UserData, MaxCount = 3)
+    DList.PushMany([5, 1, 4, 2, 3])
+    self.assertEqual(_Values(DList), [1, 2, 3])
+    self.assertEqual(DList.Dropped, 2)
+
+  def test_Keys(self):
+    DList = CPriorityDoubleLinkedList(DLinkType.FIFO, lambda UserData: UserData[1],
+                                      KeyFunc = lambda UserData: UserData[0])
+    DList.PushMany([('a', 3), ('b', 1), ('c', 2)])
+    self.assertEqual(DList.PopByKey('c').UserData, ('c', 2))
+    self.assertEqual([UserData[0] for UserData in _Values(DList)], ['b', 'a'])
+    with self.assertRaises(KeyError):
+      DList.Push(('a', 0))
+    self.assertEqual(DList.Count, 2)
+
+  def test_Splice(self):
+    DList = CPriorityDoubleLinkedList(DLinkType.FIFO, lambda UserData: UserData)
+    Other = CDoubleLinkedList(DLinkType.FIFO)
+    DList.PushMany([1, 4])
+    Other.PushMany([3, 0])
+    self.assertEqual(DList.Splice(Other), 2)
+    self.assertEqual(_Values(DList), [0, 1, 3, 4])
+
+    Plain = CDoubleLinkedList(DLinkType.FIFO)
+    Plain.Splice(DList)
+    self.assertEqual(DList.Count, 0)
+    DList.Push(2)
+    self.assertEqual(_Values(DList), [2])
+
+  def test_SpliceKeys(self):
+    DList = CPriorityDoubleLinkedList(DLinkType.FIFO, lambda UserData: UserData,
+                                      KeyFunc = lambda UserData: UserData)
+    Other = CDoubleLinkedList(DLinkType.FIFO)
+    DList.PushMany([1, 4])
+    Other.PushMany([3, 4])
+    with self.assertRaises(KeyError):
+      DList.Splice(Other)
+    self.assertEqual((_Values(DList), _Values(Other)), ([1, 4], [3, 4]))
+
+  def test_NotSupported(self):
+    DList = CPriorityDoubleLinkedList(DLinkType.FIFO, lambda UserData: UserData)
+    Node = DList.Push(1)
+    for Call in (lambda: DList.PushTop(0), lambda: DList.PushBottom(0),
+                 lambda: DList.PushBeforeUserData(Node, 0)):
+      with self.assertRaises(AttributeError):
+        Call()
+    with self.assertRaises(AttributeError):
+      CPriorityDoubleLinkedList(DLinkType.FIFO, None)
+
+
+if __name__ == "__main__":
+  unittest.main()
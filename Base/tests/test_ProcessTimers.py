@@ -0,0 +1,80 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.ProcessTimers
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import multiprocessing
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from Libs.Base.CodeTimer import CCodeTimer
+from Libs.Base.ProcessTimers import (CProcessTimers, ShipTimers, ShipsTimers)
+from Libs.Base.TimerStats import (CRegistryCaptureTimer, CTimerRegistry)
+
+
+@ShipsTimers
+def _Work(Count):
+  with CCodeTimer('Work', CRegistryCaptureTimer()):
+    return sum(range(Count))
+
+
+@ShipsTimers
+def _Sleep(Seconds):
+  with CCodeTimer('Sleep', CRegistryCaptureTimer()):
+    time.sleep(Seconds)
+
+
+class TestProcessTimers(unittest.TestCase):
+
+  def test_Executor(self):
+    Registry = CTimerRegistry()
+    Registry.Add('Parent', 1.0)
+    Context = multiprocessing.get_context('spawn')
+    with CProcessTimers(Registry, Context = Context) as Timers:
+      with ProcessPoolExecutor(2, mp_context = Context, **Timers.PoolArgs()) as Pool:
+        self.assertEqual(list(Pool.map(_Work, [10] * 20)), [45] * 20)
+    self.assertEqual(Registry.Names, ['Parent', 'Work'])
+    self.assertEqual(Registry.Get('Work').Count, 20)
+    self.assertEqual(sum(Worker.Get('Work').Count for Worker in Timers.Workers.values()), 20)
+    Report = Timers.WorkerReportString()
+    for Worker in Timers.Workers:
+      self.assertIn(f'Work [{Worker}]', Report)
+
+  def test_Pool(self):
+    with CProcessTimers() as Timers:
+      with multiprocessing.get_context().Pool(2, **Timers.PoolArgs()) as Pool:
+        Pool.map(_Work, [10] * 20)
+        Pool.close()
+        Pool.join()
+    self.assertEqual(Timers.Registry.Get('Work').Count, 20)
+    self.assertIn('Work', Timers.ReportString())
+
+  def test_ShipMidRun(self):
+      # The first task ships, the rest are sent when the worker exits.
+    for Method in ('fork', 'spawn'):
+      if Method not in multiprocessing.get_all_start_methods():
+        continue
+      Context = multiprocessing.get_context(Method)
+      with CProcessTimers(Interval = 0.2, Context = Context) as Timers:
+        with Context.Pool(1, **Timers.PoolArgs()) as Pool:
+          Pool.map(_Sleep, [0.3] + [0] * 49, chunksize = 1)
+          Pool.close()
+          Pool.join()
+      self.assertEqual(Timers.Registry.Get('Sleep').Count, 50, Method)
+
+  def test_NotWorker(self):
+    self.assertFalse(ShipTimers())
+
+
+if __name__ == "__main__":
+  unittest.main()
@@ -0,0 +1,74 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.SpanTimer
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import asyncio
+import time
+import unittest
+
+from Libs.Base.CodeTimer import CCaptureTimer
+from Libs.Base.SpanTimer import (CSpanTimer, CSpanTree, CurrentSpan)
+
+
+class TestSpanTimer(unittest.TestCase):
+
+  def test_Nested(self):
+    Tree = CSpanTree()
+    with CSpanTimer('Handler', Tree = Tree) as Handler:
+      for _ in range(2):
+        with CSpanTimer('Query', Tree = Tree) as Query:
+          self.assertIs(CurrentSpan(), Query)
+          self.assertIs(Query.Parent, Handler)
+          time.sleep(0.002)
+      with CSpanTimer('Render', Tree = Tree):
+        pass
+    self.assertIsNone(CurrentSpan())
+
+    Lines = Tree.Report()
+    self.assertEqual([Line.Path for Line in Lines],
+                     [('Handler',), ('Handler', 'Query'), ('Handler', 'Render')])
+    self.assertEqual(Lines[1].Count, 2)
+    self.assertGreaterEqual(Lines[1].Total, 4.0)
+    self.assertAlmostEqual(Handler.SelfTime, Handler._Took - Handler.ChildTime)
+    self.assertAlmostEqual(Lines[0].SelfTime + Lines[1].Total + Lines[2].Total, Lines[0].Total)
+    self.assertIn('  Query', Tree.ReportString())
+
+  def test_CaptureTimer(self):
+    class CCounter(CCaptureTimer):
+      Saved = 0
+
+      def Save(self):
+        CCounter.Saved += 1
+
+    with CSpanTimer('Span', CCounter(), CSpanTree()):
+      pass
+    self.assertEqual(CCounter.Saved, 1)
+
+  def test_Async(self):
+    Tree = CSpanTree()
+
+    async def Child(Name):
+      with CSpanTimer(Name, Tree = Tree):
+        await asyncio.sleep(0.001)
+
+    async def Main():
+      with CSpanTimer('Main', Tree = Tree):
+        await asyncio.gather(Child('A'), Child('B'))
+
+    asyncio.run(Main())
+    self.assertEqual(sorted(Line.Path for Line in Tree.Report()),
+                     [('Main',), ('Main', 'A'), ('Main', 'B')])
+
+
+if __name__ == "__main__":
+  unittest.main()
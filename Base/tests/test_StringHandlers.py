@@ -0,0 +1,121 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.StringHandlers
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import mmap
+import tempfile
+import unittest
+
+from Libs.Base.StringHandlers import (CStringScanner, GetString, GetStringBytes, SkipWhiteSpace,
+                                      SkipWhiteSpaceBytes, TokenKind, UnescapeBytes)
+
+_LINES = ('', '"', '""', '"abc" rest', r'"a\"b\\c" rest', r"'it\'s' x", '"open',
+          '"ends with\\', 'no quote', '"mixed\' quote"', "'x'", ' "after space"')
+
+
+class TestStringScanner(unittest.TestCase):
+
+  def test_GetString(self):
+    for Line in _LINES:
+      for QuoteChars in ("\"'", '"', ''):
+        Scanner = CStringScanner(Line)
+        Result = Scanner.GetString(QuoteChars)
+        self.assertEqual(Result, GetString(Line, QuoteChars), Line)
+        self.assertEqual(Scanner.Offset, Result.CharConsumed)
+
+  def test_Offset(self):
+    Line = r'How is the "\"world\" is" doing today'
+    Scanner = CStringScanner(Line, 11)
+    Result = Scanner.GetString()
+    self.assertEqual(Result, GetString(Line[11:]))
+    self.assertEqual(Line[Scanner.Offset:], ' doing today')
+    self.assertEqual(Scanner.SkipWhiteSpace(), 1)
+    self.assertEqual(Scanner.GetIdentifier(), 'doing')
+    self.assertIsNone(Scanner.GetNumber())
+
+  def test_SkipWhiteSpace(self):
+    for Line in ('', '   ', ' \t x', 'x ', '\t\t'):
+      for WhiteSpace in (' \t', ' ', ''):
+        Scanner = CStringScanner(Line)
+        self.assertEqual(Scanner.SkipWhiteSpace(WhiteSpace), SkipWhiteSpace(Line, WhiteSpace))
+    Scanner = CStringScanner('  ')
+    Scanner.SkipWhiteSpace()
+    self.assertTrue(Scanner.AtEnd)
+
+  def test_Numbers(self):
+    for Text, Number in (('12', 12), ('-3.5e2', -350.0), ('.5x', 0.5), ('+7', 7)):
+      self.assertEqual(CStringScanner(Text).GetNumber(), Number)
+
+  def test_Tokens(self):
+    Scanner = CStringScanner('name = "va\\"l" + -3.5e2, x2 [7]  \n')
+    Tokens = list(Scanner.Tokens())
+    self.assertEqual([Token.Value for Token in Tokens],
+                     ['name', '=', 'va"l', '+', -350.0, ',', 'x2', '[', 7, ']'])
+    self.assertEqual([Token.Kind for Token in Tokens[:3]],
+                     [TokenKind.IDENTIFIER, TokenKind.PUNCTUATION, TokenKind.STRING])
+    self.assertEqual(Tokens[2].Offset, 7)
+    self.assertTrue(Scanner.AtEnd)
+    with self.assertRaises(ValueError):
+      list(CStringScanner('a "open').Tokens())
+
+  def test_TokensEmptySets(self):
+    Tokens = list(CStringScanner('a "b\n').Tokens(QuoteChars = '', WhiteSpace = ''))
+    self.assertEqual([Token.Value for Token in Tokens], ['a', ' ', '"', 'b', '\n'])
+    self.assertEqual(Tokens[2].Kind, TokenKind.PUNCTUATION)
+
+
+class TestBytes(unittest.TestCase):
+
+  def test_GetStringBytes(self):
+    for Line in _LINES:
+      for QuoteChars in ("\"'", '"', ''):
+        Expected = GetString(Line, QuoteChars)
+        for Buffer in (Line.encode(), memoryview(Line.encode())):
+          Result = GetStringBytes(Buffer, 0, None, QuoteChars.encode())
+          self.assertEqual(Result.OutCome, Expected.OutCome, Line)
+          if Result.OutCome:
+            self.assertEqual(Result.Next, Expected.CharConsumed)
+            String = UnescapeBytes(Buffer, Result.Start, Result.End)
+            self.assertEqual(String.decode(), Expected.String)
+            self.assertEqual(Result.Escaped, '\\' in Line[:Result.End])
+
+  def test_SkipWhiteSpaceBytes(self):
+    for Line in ('', '   ', ' \t x', 'x ', '\t\t'):
+      for WhiteSpace in (' \t', ' ', ''):
+        self.assertEqual(SkipWhiteSpaceBytes(Line.encode(), 0, None, WhiteSpace.encode()),
+                         SkipWhiteSpace(Line, WhiteSpace))
+    self.assertEqual(SkipWhiteSpaceBytes(b'x    y', 1, 3), 3)
+    self.assertEqual(SkipWhiteSpaceBytes(b'x  ', 3), 3)
+    self.assertEqual(SkipWhiteSpaceBytes(b'x  \t y', 1, None, bytearray(b' \t')), 5)
+    self.assertEqual(SkipWhiteSpaceBytes(b'x  \t y', 1, None, memoryview(b' ')), 3)
+    self.assertEqual(GetStringBytes(b'|a|', 0, None, bytearray(b'|'))[:3], (True, 3, 1))
+
+  def test_Mmap(self):
+    with tempfile.TemporaryFile() as File:
+      File.write(b'key  "a \\"b\\"" \'plain\' "open')
+      File.flush()
+      with mmap.mmap(File.fileno(), 0, access = mmap.ACCESS_READ) as Buffer:
+        Result = GetStringBytes(Buffer, SkipWhiteSpaceBytes(Buffer, 3))
+        self.assertEqual(Result[:3], (True, 14, 6))
+        self.assertTrue(Result.Escaped)
+        self.assertEqual(UnescapeBytes(Buffer, Result.Start, Result.End), b'a "b"')
+
+        Result = GetStringBytes(Buffer, SkipWhiteSpaceBytes(Buffer, Result.Next))
+        self.assertFalse(Result.Escaped)
+        self.assertEqual(Buffer[Result.Start:Result.End], b'plain')
+        self.assertFalse(GetStringBytes(Buffer, Result.Start - 1, Result.End).OutCome)
+        self.assertFalse(GetStringBytes(Buffer, SkipWhiteSpaceBytes(Buffer, Result.Next)).OutCome)
+
+
+if __name__ == "__main__":
+  unittest.main()
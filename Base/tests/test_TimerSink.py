@@ -0,0 +1,120 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.TimerSink
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import csv
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+
+from Libs.Base.CodeTimer import CCodeTimer
+from Libs.Base.DoubleLinkedList import DLinkOverflow
+from Libs.Base.TimerSink import (CTimerSink, CSinkCaptureTimer, CCSVSinkWriter,
+                                 CJSONLinesSinkWriter, CSQLiteSinkWriter, SINKFIELDS)
+
+
+class CSlowWriter:
+
+  def __init__(self):
+    self.Gate = threading.Event()
+    self.Samples = []
+    self.Closed = False
+
+  def Write(self, Samples):
+    self.Gate.wait()
+    self.Samples.extend(Samples)
+
+  def Close(self):
+    self.Closed = True
+
+
+class TestTimerSink(unittest.TestCase):
+
+  def setUp(self):
+    self._Dir = tempfile.TemporaryDirectory()
+
+  def tearDown(self):
+    self._Dir.cleanup()
+
+  def _FileName(self, Name):
+    return os.path.join(self._Dir.name, Name)
+
+  def test_CSV(self):
+    FileName = self._FileName('Timers.csv')
+    Sink = CTimerSink(CCSVSinkWriter(FileName), BatchSize = 2)
+    CaptureTimer = CSinkCaptureTimer(Sink)
+    for _ in range(5):
+      with CCodeTimer('Block', CaptureTimer):
+        pass
+    self.assertTrue(Sink.Flush(5))
+    self.assertEqual(Sink.Written, 5)
+    Sink.Close()
+    Sink.Close()
+    with self.assertRaises(AttributeError):
+      Sink.Add('Late', 0, 0, 0)
+
+    with open(FileName, newline = '', encoding = 'utf-8') as File:
+      Rows = list(csv.reader(File))
+    self.assertEqual(tuple(Rows[0]), SINKFIELDS)
+    self.assertEqual([Row[1] for Row in Rows[1:]], ['Block'] * 5)
+
+  def test_JSONLines(self):
+    FileName = self._FileName('Timers.jsonl')
+    Sink = CTimerSink(CJSONLinesSinkWriter(FileName))
+    Sink.Add('A', 1.0, 2.0, 1000.0)
+    Sink.Close()
+    with open(FileName, encoding = 'utf-8') as File:
+      Lines = [json.loads(Line) for Line in File]
+    self.assertEqual(Lines[0]['Name'], 'A')
+    self.assertEqual(Lines[0]['Took'], 1000.0)
+
+  def test_SQLite(self):
+    FileName = self._FileName('Timers.db')
+    Sink = CTimerSink(CSQLiteSinkWriter(FileName, 'Runs'), BatchSize = 3)
+    for i in range(10):
+      Sink.Add('A', i, i + 1, 1000.0)
+    Sink.Close()
+    with sqlite3.connect(FileName) as Connection:
+      self.assertEqual(Connection.execute('SELECT COUNT(*), SUM(Start) FROM Runs').fetchone(),
+                       (10, 45.0))
+
+  def test_Drop(self):
+    Writer = CSlowWriter()
+    Sink = CTimerSink(Writer, MaxQueue = 4, BatchSize = 2, Overflow = DLinkOverflow.DROPNEWEST)
+    for i in range(20):
+      Sink.Add('A', i, i, 0)
+    self.assertGreater(Sink.Dropped, 0)
+    Writer.Gate.set()
+    Sink.Close()
+    self.assertTrue(Writer.Closed)
+    self.assertEqual(len(Writer.Samples) + Sink.Dropped, 20)
+
+  def test_AtExit(self):
+    FileName = self._FileName('Exit.jsonl')
+    Code = ('from Libs.Base.TimerSink import (CTimerSink, CJSONLinesSinkWriter)\n'
+            f'Sink = CTimerSink(CJSONLinesSinkWriter({FileName!r}), FlushInterval = 60)\n'
+            'for i in range(3):\n'
+            '  Sink.Add("A", i, i, 0)\n')
+    subprocess.run([sys.executable, '-c', Code], check = True, timeout = 30,
+                   env = dict(os.environ, PYTHONPATH = os.pathsep.join(sys.path)))
+    with open(FileName, encoding = 'utf-8') as File:
+      self.assertEqual(len(File.readlines()), 3)
+
+
+if __name__ == "__main__":
+  unittest.main()
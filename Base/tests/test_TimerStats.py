@@ -0,0 +1,142 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.TimerStats
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import random
+import sys
+import threading
+import unittest
+
+from Libs.Base.CodeTimer import CCodeTimer
+from Libs.Base.TimerStats import (CTimerStats, CTimerRegistry, CRegistryCaptureTimer)
+
+
+class TestTimerStats(unittest.TestCase):
+
+  def test_Basic(self):
+    Stats = CTimerStats()
+    self.assertIsNone(Stats.Mean)
+    self.assertEqual(Stats.Quantiles(), (None, None, None))
+    for Took in (1.0, 2.0, 3.0, 0.0):
+      Stats.Add(Took)
+    self.assertEqual((Stats.Count, Stats.Total, Stats.Min, Stats.Max), (4, 6.0, 0.0, 3.0))
+    self.assertEqual(Stats.Mean, 1.5)
+    self.assertEqual(Stats.Quantile(0), 0.0)
+    self.assertEqual(Stats.Quantile(1), 3.0)
+
+  def test_Quantiles(self):
+    Rand = random.Random(1)
+    Values = [Rand.lognormvariate(0, 2) for _ in range(20000)]
+    Stats = CTimerStats(0.01)
+    for Value in Values:
+      Stats.Add(Value)
+    Values.sort()
+    for Fraction, Value in zip((0.5, 0.95, 0.99), Stats.Quantiles()):
+      Exact = Values[int(Fraction * len(Values)) - 1]
+      self.assertLess(abs(Value - Exact) / Exact, 0.02)
+    self.assertLess(len(Stats._Buckets), 1000)
+
+  def test_Weight(self):
+    Stats = CTimerStats()
+    for Took in (1.0, 2.0):
+      Stats.Add(Took, 10)
+    self.assertEqual((Stats.Samples, Stats.Count, Stats.Total), (2, 20, 30.0))
+    self.assertEqual(Stats.Mean, 1.5)
+    self.assertAlmostEqual(Stats.Quantile(0.5), 1.0, delta = 0.02)
+
+  def test_Merge(self):
+    First = CTimerStats()
+    Second = CTimerStats()
+    for i in range(1, 11):
+      (First if i % 2 else Second).Add(float(i))
+    First.Merge(Second)
+    self.assertEqual((First.Count, First.Total, First.Min, First.Max), (10, 55.0, 1.0, 10.0))
+    with self.assertRaises(AttributeError):
+      First.Merge(CTimerStats(0.05))
+
+
+class TestTimerRegistry(unittest.TestCase):
+
+  def test_Registry(self):
+    Registry = CTimerRegistry()
+    CaptureTimer = CRegistryCaptureTimer(Registry)
+    for _ in range(3):
+      with CCodeTimer('Block', CaptureTimer):
+        pass
+    Registry.Add('Other', 5.0)
+    self.assertEqual(Registry.Names, ['Block', 'Other'])
+    Lines = Registry.Report((0.5,))
+    self.assertEqual(Lines[0].Count, 3)
+    self.assertEqual(Lines[1].Quantiles, (5.0,))
+    self.assertIn('P50', Registry.ReportString())
+    Registry.Reset('Block')
+    self.assertIsNone(Registry.Get('Block'))
+    Registry.Reset()
+    self.assertEqual(Registry.Names, [])
+
+  def test_SharedCaptureTimer(self):
+    Registry = CTimerRegistry()
+    CaptureTimer = CRegistryCaptureTimer(Registry)
+
+    def Run(Name):
+      for _ in range(3000):
+        with CCodeTimer(Name, CaptureTimer):
+          pass
+
+    Interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+      Threads = [threading.Thread(target = Run, args = (Name,)) for Name in 'ABCD']
+      for Thread in Threads:
+        Thread.start()
+      for Thread in Threads:
+        Thread.join()
+    finally:
+      sys.setswitchinterval(Interval)
+    self.assertEqual([Registry.Get(Name).Count for Name in 'ABCD'], [3000] * 4)
+      # Nothing is stored in the shared instance for another thread to overwrite.
+    self.assertEqual((CaptureTimer.Name, CaptureTimer.Took), (None, 0))
+
+  def test_Resources(self):
+    Registry = CTimerRegistry()
+    Registry.Add('Block', 2.0, Resources = (1.0, 0.5, 100, 10, 0))
+    Registry.Add('Block', 3.0, Resources = (2.0, 1.5, 300, -5, 1))
+    Registry.Add('Other', 1.0)
+    Block, Other = Registry.Report()
+    self.assertEqual((Block.CPU, Block.ThreadCPU, Block.MemoryPeak, Block.MemoryNet, Block.GCCollections),
+                     (3.0, 2.0, 300, 5, 1))
+    self.assertIsNone(Other.CPU)
+    self.assertIn('PeakBytes', Registry.ReportString())
+
+    Stats = CTimerStats()
+    Stats.Merge(Registry.Get('Block'))
+    self.assertEqual((Stats.CPU, Stats.MemoryPeak), (3.0, 300))
+    Stats.Reset()
+    self.assertIsNone(Stats.CPU)
+
+  def test_MergeTake(self):
+    Registry = CTimerRegistry()
+    Registry.Add('Block', 2.0)
+    Other = CTimerRegistry()
+    Other.Add('Block', 4.0)
+    Other.Merge(Registry)
+    Other.Merge({'New': Registry.Get('Block')})
+    Timers = Other.Take()
+    self.assertEqual(sorted(Timers), ['Block', 'New'])
+    self.assertEqual((Timers['Block'].Count, Timers['Block'].Total), (2, 6.0))
+    self.assertEqual(Other.Names, [])
+    self.assertEqual(Registry.Get('Block').Count, 1)
+
+
+if __name__ == "__main__":
+  unittest.main()
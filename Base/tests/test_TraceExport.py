@@ -0,0 +1,101 @@
+'''
+Created:   Oct 18, 2026
+Author:    Donald W. Long
+-----------------------------------------------------------------------------
+Description:
+
+  Unit tests for Libs.Base.TraceExport
+-----------------------------------------------------------------------------
+Update History:
+  Date: Oct 18, 2026
+    Released
+-----------------------------------------------------------------------------
+'''
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from Libs.Base.CodeTimer import CCodeTimer
+from Libs.Base.SpanTimer import (CSpanTimer, CSpanTree)
+from Libs.Base.TraceExport import (CChromeTraceWriter, CSpeedscopeWriter, CTraceCaptureTimer,
+                                   SPEEDSCOPESCHEMA)
+
+
+def _Run(Writer, Loops = 3):
+  CaptureTimer = CTraceCaptureTimer(Writer)
+  Tree = CSpanTree()
+  for _ in range(Loops):
+    with CSpanTimer('Outer', CaptureTimer, Tree):
+      with CSpanTimer('Inner', CaptureTimer, Tree):
+        with CCodeTimer('Code', CaptureTimer):
+          pass
+      with CSpanTimer('Inner', CaptureTimer, Tree):
+        pass
+
+
+class TestTraceExport(unittest.TestCase):
+
+  def setUp(self):
+    self._Dir = tempfile.TemporaryDirectory()
+    self.FileName = os.path.join(self._Dir.name, 'Trace.json')
+
+  def tearDown(self):
+    self._Dir.cleanup()
+
+  def test_Chrome(self):
+    with CChromeTraceWriter(self.FileName, ChunkSize = 2) as Writer:
+      _Run(Writer)
+      Thread = threading.Thread(target = Writer.Add, args = ('Thread', 1.0, 2.0))
+      Thread.start()
+      Thread.join()
+    with self.assertRaises(AttributeError):
+      Writer.Add('Late', 1.0, 2.0)
+
+    with open(self.FileName, encoding = 'utf-8') as File:
+      Events = json.load(File)['traceEvents']
+    Spans = [Event for Event in Events if Event['ph'] == 'X']
+    self.assertEqual(len(Spans), 13)
+    self.assertEqual(len({Event['tid'] for Event in Spans}), 2)
+    self.assertEqual(sum(Event['name'] == 'Inner' for Event in Spans), 6)
+    self.assertTrue(all(Event['dur'] >= 0 for Event in Spans))
+
+  def test_Speedscope(self):
+    with CSpeedscopeWriter(self.FileName, ChunkSize = 2) as Writer:
+      _Run(Writer)
+      Writer.Add('Other', 10.0, 11.0, ThreadId = 1)
+
+    with open(self.FileName, encoding = 'utf-8') as File:
+      Data = json.load(File)
+    self.assertEqual(Data['$schema'], SPEEDSCOPESCHEMA)
+    Frames = [Frame['name'] for Frame in Data['shared']['frames']]
+    self.assertEqual(sorted(Frames), ['Code', 'Inner', 'Other', 'Outer'])
+    self.assertEqual(len(Data['profiles']), 2)
+
+    Profile = Data['profiles'][0]
+    Stack = []
+    Last = Profile['startValue']
+    for Event in Profile['events']:
+      self.assertGreaterEqual(Event['at'], Last)
+      Last = Event['at']
+      if Event['type'] == 'O':
+        Stack.append(Event['frame'])
+      else:
+        self.assertEqual(Stack.pop(), Event['frame'])
+    self.assertEqual(Stack, [])
+    self.assertEqual(len(Profile['events']), 24)
+    self.assertLessEqual(Last, Profile['endValue'])
+
+  def test_NotNested(self):
+    with CSpeedscopeWriter(self.FileName) as Writer:
+      Writer.Add('Child', 1.5, 3.0, Root = False)
+      Writer.Add('Parent', 1.0, 2.0)
+    with open(self.FileName, encoding = 'utf-8') as File:
+      Events = json.load(File)['profiles'][0]['events']
+    self.assertEqual([Event['at'] for Event in Events], [1000.0, 1500.0, 2000.0, 2000.0])
+
+
+if __name__ == "__main__":
+  unittest.main()